@@ -0,0 +1,332 @@
+"""
+Batch Command-Line Interface for Personal Job Agent
+
+This module runs the AI scripts over newline-delimited JSON (NDJSON) records, so
+bulk backfills over database exports can run without the C# host.
+
+Each input line is one JSON record; each output line is the result for the
+input line with the same position. Results are written as soon as they are
+ready, in input order, with a bounded number of records in flight.
+
+Record formats:
+    parse:        {"id": ..., "resume_text": "..."}
+    match:        {"id": ..., "profile": {...}, "jobs": [{...}, ...]}
+    cover-letter: {"id": ..., "profile": {...}, "job": {...}, "deterministic": false, "variant": 0,
+                  "semantic": false}
+    interview:    {"id": ..., "job": {...}, "profile": {...}, "count": 10}
+
+Usage:
+    python batch_cli.py parse resumes.ndjson -o parsed.ndjson --workers 4
+    python batch_cli.py match < pairs.ndjson > matches.ndjson
+    python batch_cli.py cover-letter letters.ndjson -o out.ndjson --checkpoint out.ckpt
+
+After a crash, rerun the same command with the same --checkpoint file (or pass
+--start-offset) to continue after the last record that was written.
+
+When results go to stdout, anything else printed to stdout while the batch runs
+(e.g. warnings of the AI scripts or their libraries, also in worker processes)
+is sent to stderr, so the output stays valid NDJSON.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterator, Optional, Tuple, TextIO
+
+from json_boundary import dumps, loads
+
+
+def _run_parse(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse one resume record."""
+    from resume_parser import parse_resume
+    return {"result": parse_resume(record["resume_text"])}
+
+
+def _run_match(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Match one profile against its job listings."""
+    from job_matcher import match_jobs
+    return {"matches": match_jobs(record["profile"], record["jobs"])}
+
+
+def _run_cover_letter(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate one cover letter."""
+    from cover_letter_generator import generate_cover_letter
+    return {"cover_letter": generate_cover_letter(
+        record["profile"], record["job"],
+        deterministic=record.get("deterministic", False),
+        variant=record.get("variant", 0),
+        semantic=record.get("semantic", False)
+    )}
+
+
+def _run_interview(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate interview questions, tips and requirement analysis for one listing."""
+    from interview_preparation import prepare_interview
+    return prepare_interview(record.get("profile"), record["job"], record.get("count", 10))
+
+
+COMMANDS = {
+    "parse": _run_parse,
+    "match": _run_match,
+    "cover-letter": _run_cover_letter,
+    "interview": _run_interview
+}
+
+
+def process_line(command: str, offset: int, line: str) -> str:
+    """
+    Process one NDJSON input line and serialize its result.
+    
+    Failures are reported in the output record instead of aborting the batch.
+    
+    Args:
+        command: Subcommand name
+        offset: Zero-based position of the line in the input
+        line: Raw input line
+        
+    Returns:
+        Serialized output line (without trailing newline)
+    """
+    output = {"offset": offset}
+    try:
+        record = loads(line)
+        if isinstance(record, dict) and "id" in record:
+            output["id"] = record["id"]
+        output.update(COMMANDS[command](record))
+    except Exception as e:
+        output["error"] = f"{type(e).__name__}: {e}"
+    
+    return dumps(output).decode("utf-8")
+
+
+def read_lines(paths: List[str], start_offset: int = 0) -> Iterator[Tuple[int, str]]:
+    """
+    Stream input lines from files (or stdin), skipping already processed ones.
+    
+    Blank lines are counted towards offsets but not yielded, so offsets always
+    match physical line positions across the concatenated inputs.
+    
+    Args:
+        paths: Input file paths; empty or "-" means stdin
+        start_offset: Number of leading lines to skip
+        
+    Returns:
+        Iterator of (offset, line) pairs
+    """
+    offset = 0
+    for path in paths or ["-"]:
+        stream = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+        try:
+            for line in stream:
+                if offset >= start_offset and line.strip():
+                    yield offset, line
+                offset += 1
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def read_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    """
+    Read progress from a checkpoint file.
+    
+    Args:
+        path: Checkpoint file path, or None
+        
+    Returns:
+        Dictionary with the next input offset and the output size at that point
+    """
+    if not path or not os.path.exists(path):
+        return {"offset": 0, "output_bytes": None}
+    
+    with open(path, "r", encoding="utf-8") as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def write_checkpoint(path: str, offset: int, output_bytes: Optional[int]):
+    """
+    Atomically record progress.
+    
+    Args:
+        path: Checkpoint file path
+        offset: Offset of the first input line not yet written
+        output_bytes: Size of the output file once that line's predecessors were written
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+        json.dump({"offset": offset, "output_bytes": output_bytes}, checkpoint_file)
+    os.replace(temp_path, path)
+
+
+def run_batch(command: str, lines: Iterator[Tuple[int, str]], output: TextIO, workers: int = 1,
+              max_pending: Optional[int] = None, checkpoint: Optional[str] = None,
+              checkpoint_every: int = 100) -> int:
+    """
+    Process input lines and write results incrementally in input order.
+    
+    Args:
+        command: Subcommand name
+        lines: Iterator of (offset, line) pairs
+        output: Stream the NDJSON results are written to
+        workers: Number of worker processes (1 processes records inline)
+        max_pending: Maximum number of records in flight (default 4 per worker)
+        checkpoint: Optional checkpoint file updated as results are written
+        checkpoint_every: Number of records between checkpoint updates
+        
+    Returns:
+        Number of records processed
+    """
+    processed = 0
+    last_offset = None
+    seekable = output.seekable()
+    
+    def save_checkpoint():
+        output.flush()
+        write_checkpoint(checkpoint, last_offset + 1, output.tell() if seekable else None)
+    
+    def emit(offset: int, result: str):
+        nonlocal processed, last_offset
+        output.write(result + "\n")
+        processed += 1
+        last_offset = offset
+        if checkpoint and processed % checkpoint_every == 0:
+            save_checkpoint()
+    
+    if workers <= 1:
+        for offset, line in lines:
+            emit(offset, process_line(command, offset, line))
+    else:
+        # Results are emitted in input order; at most max_pending records are
+        # held in memory while waiting for an earlier one to finish
+        max_pending = max_pending or workers * 4
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for offset, line in lines:
+                pending.append((offset, executor.submit(process_line, command, offset, line)))
+                if len(pending) >= max_pending:
+                    done_offset, future = pending.popleft()
+                    emit(done_offset, future.result())
+            while pending:
+                done_offset, future = pending.popleft()
+                emit(done_offset, future.result())
+    
+    output.flush()
+    if checkpoint and last_offset is not None:
+        save_checkpoint()
+    
+    return processed
+
+
+def claim_stdout() -> Optional[TextIO]:
+    """
+    Reserve stdout for results, pointing the stdout file descriptor at stderr.
+    
+    Worker processes started afterwards inherit the redirected descriptor.
+    
+    Returns:
+        Stream writing to the original stdout, or None if stdout has no file
+        descriptor (e.g. when replaced in-process)
+    """
+    try:
+        descriptor = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return None
+    
+    sys.stdout.flush()
+    output = os.fdopen(os.dup(descriptor), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), descriptor)
+    return output
+
+
+def release_stdout(output: TextIO):
+    """
+    Restore the stdout file descriptor reserved by claim_stdout and close its stream.
+    
+    Args:
+        output: Stream returned by claim_stdout
+    """
+    sys.stdout.flush()
+    output.flush()
+    os.dup2(output.fileno(), sys.stdout.fileno())
+    output.close()
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description="Run Personal Job Agent AI scripts over NDJSON records.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    for command in COMMANDS:
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("inputs", nargs="*", help="NDJSON input files (default: stdin)")
+        subparser.add_argument("-o", "--output", help="Output file (default: stdout)")
+        subparser.add_argument("-w", "--workers", type=int, default=1, help="Number of worker processes")
+        subparser.add_argument("--max-pending", type=int, help="Maximum records in flight")
+        subparser.add_argument("--start-offset", type=int, help="Skip this many input lines")
+        subparser.add_argument("--checkpoint", help="File recording progress, used to resume after a crash")
+        subparser.add_argument("--checkpoint-every", type=int, default=100,
+                               help="Records between checkpoint updates")
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the batch CLI.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        
+    Returns:
+        Process exit code
+    """
+    args = build_argument_parser().parse_args(argv)
+    
+    start_offset = args.start_offset
+    if start_offset is None:
+        progress = read_checkpoint(args.checkpoint)
+        start_offset = progress["offset"]
+        
+        # Drop results written after the last checkpoint; they are produced again
+        if args.output and progress["output_bytes"] is not None and os.path.exists(args.output):
+            os.truncate(args.output, progress["output_bytes"])
+    
+    # Append when resuming so results written before the crash are kept
+    claimed = None
+    if args.output:
+        output = open(args.output, "a" if start_offset else "w", encoding="utf-8")
+    else:
+        claimed = claim_stdout()
+        output = claimed or sys.stdout
+    
+    try:
+        processed = run_batch(
+            args.command,
+            read_lines(args.inputs, start_offset),
+            output,
+            workers=args.workers,
+            max_pending=args.max_pending,
+            checkpoint=args.checkpoint,
+            checkpoint_every=args.checkpoint_every
+        )
+    finally:
+        if claimed is not None:
+            release_stdout(claimed)
+        elif output is not sys.stdout:
+            output.close()
+    
+    print(f"Processed {processed} records starting at offset {start_offset}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1037 @@
+"""
+Benchmarks for Personal Job Agent AI scripts
+
+This module provides micro-benchmarks for the performance-sensitive parts of the
+Python scripts. Each benchmark checks its result against a reference before
+timing it, so a speedup never hides a behavior change.
+
+Usage:
+    python benchmarks.py [benchmark_name ...]
+"""
+
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _time_call(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Time a callable and return the best of several runs.
+    
+    Args:
+        func: Zero-argument callable to time
+        repeat: Number of runs
+        
+    Returns:
+        Best wall-clock time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _make_long_resume(entries: int = 400) -> str:
+    """
+    Build a synthetic resume with many experience and project entries.
+    
+    Args:
+        entries: Number of experience entries to generate
+        
+    Returns:
+        Resume text
+    """
+    lines = [
+        "Jane Smith",
+        "jane.smith@example.com | (555) 987-6543",
+        "Austin, TX",
+        "",
+        "PROFESSIONAL SUMMARY",
+        "Engineer with a long and varied career across many teams and products.",
+        "",
+        "WORK EXPERIENCE",
+    ]
+    for i in range(entries):
+        lines.extend([
+            f"Software Engineer {i} at Company {i}",
+            f"Jan {2000 + i % 20} - Dec {2001 + i % 20}",
+            f"- Built service number {i} handling requests for internal customers",
+            f"- Reduced latency of pipeline {i} by {i % 50}% through caching",
+            "",
+        ])
+    lines.extend([
+        "EDUCATION",
+        "State University",
+        "Bachelor of Science in Computer Science",
+        "2000 - 2004",
+        "",
+        "TECHNICAL SKILLS",
+        "Python, Java, SQL, Docker, Kubernetes",
+        "",
+        "KEY PROJECTS",
+    ])
+    lines.extend(f"Project {i}: internal tooling for team {i}" for i in range(entries // 4))
+    return "\n".join(lines)
+
+
+def _legacy_identify_sections(sections_vocabulary: Dict[str, List[str]], text: str) -> Dict[str, str]:
+    """
+    Reference implementation of section identification that runs one regex per
+    header per line. Kept only to validate and compare the compiled matcher.
+    """
+    current_section = None
+    sections = {}
+    section_content = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        found_section = False
+        for section_key, section_headers in sections_vocabulary.items():
+            for header in section_headers:
+                if re.search(r'\b' + re.escape(header) + r'\b', line.lower()):
+                    if current_section:
+                        sections[current_section] = '\n'.join(section_content)
+                    current_section = section_key
+                    section_content = []
+                    found_section = True
+                    break
+            if found_section:
+                break
+        if not found_section and current_section:
+            section_content.append(line)
+    if current_section and section_content:
+        sections[current_section] = '\n'.join(section_content)
+    return sections
+
+
+def benchmark_section_identification() -> Dict[str, Any]:
+    """
+    Compare the compiled section matcher against the per-header regex loop.
+    
+    Returns:
+        Dictionary with timings and throughput
+    """
+    from resume_parser import ResumeParser
+    
+    parser = ResumeParser()
+    text = _make_long_resume()
+    line_count = text.count("\n") + 1
+    
+    assert parser._identify_sections(text) == _legacy_identify_sections(parser.sections, text)
+    
+    legacy_time = _time_call(lambda: _legacy_identify_sections(parser.sections, text))
+    compiled_time = _time_call(lambda: parser._identify_section_spans(text))
+    
+    return {
+        "lines": line_count,
+        "legacy_seconds": legacy_time,
+        "compiled_seconds": compiled_time,
+        "lines_per_second": line_count / compiled_time,
+        "speedup": legacy_time / compiled_time
+    }
+
+
+def benchmark_parse_cache() -> Dict[str, Any]:
+    """
+    Compare an uncached parse with a cache hit and with a one-line edit.
+    
+    Returns:
+        Dictionary with timings
+    """
+    from resume_parser import ResumeParser, ResumeParseCache, normalize_resume_text
+    
+    text = _make_long_resume()
+    edited = text.replace("Python, Java, SQL", "Python, Go, SQL")
+    cache = ResumeParseCache()
+    
+    assert cache.parse(edited) == ResumeParser().parse_resume(normalize_resume_text(edited))
+    
+    def parse_edit():
+        cache.documents.clear()
+        cache.parse(edited)
+    
+    cache.parse(text)
+    return {
+        "uncached_seconds": _time_call(lambda: ResumeParser().parse_resume(text)),
+        "hit_seconds": _time_call(lambda: cache.parse(text)),
+        "edited_seconds": _time_call(parse_edit)
+    }
+
+
+def benchmark_template_render(renders: int = 100000) -> Dict[str, Any]:
+    """
+    Compare precompiled template rendering with str.format on the same templates.
+    
+    Args:
+        renders: Number of letters to render
+        
+    Returns:
+        Dictionary with timings and throughput
+    """
+    from template_engine import TemplateStore
+    
+    templates = TemplateStore("cover_letter").get()["letters"]
+    values = {
+        "date": "January 01, 2025",
+        "hiring_manager": "Hiring Manager",
+        "company_name": "Tech Innovators",
+        "introduction": "I am writing to express my interest in the role.",
+        "skills_paragraph": "My expertise includes Python, Django, and React.",
+        "experience_paragraph": "In my role as Senior Software Engineer at ABC Tech, I led API development.",
+        "closing": "Thank you for your time and consideration.",
+        "user_name": "John Doe"
+    }
+    
+    for template in templates:
+        assert template.render(values) == template.source.format(**values)
+    
+    def render_compiled():
+        for i in range(renders):
+            templates[i % len(templates)].render(values)
+    
+    def render_format():
+        for i in range(renders):
+            templates[i % len(templates)].source.format(**values)
+    
+    compiled_time = _time_call(render_compiled, repeat=3)
+    return {
+        "renders": renders,
+        "format_seconds": _time_call(render_format, repeat=3),
+        "compiled_seconds": compiled_time,
+        "renders_per_second": renders / compiled_time
+    }
+
+
+def _legacy_experience_scores(experiences: List[Dict[str, Any]], key_terms: List[str]) -> List[int]:
+    """
+    Reference implementation of experience relevance that checks every key term
+    against every experience. Kept only to validate and compare the sparse scoring.
+    """
+    scores = []
+    for exp in experiences:
+        score = 0
+        exp_title = exp.get("title", "").lower()
+        exp_description = exp.get("description", "").lower()
+        for term in key_terms:
+            if term in exp_title:
+                score += 2
+            if term in exp_description:
+                score += 1
+        scores.append(score)
+    return scores
+
+
+def benchmark_experience_relevance(experiences: int = 200, listings: int = 200) -> Dict[str, Any]:
+    """
+    Compare sparse experience scoring against the per-term, per-experience loop
+    for one long work history scored against many listings.
+    
+    Args:
+        experiences: Number of experiences in the profile
+        listings: Number of listings scored
+        
+    Returns:
+        Dictionary with timings
+    """
+    from cover_letter_generator import CoverLetterGenerator, ProfileContext
+    
+    generator = CoverLetterGenerator()
+    profile = {"experience": [
+        {
+            "title": f"Software Engineer {i}",
+            "description": f"Built service {i} for the platform team. Reduced latency by {i % 50}% with caching."
+        }
+        for i in range(experiences)
+    ]}
+    key_term_sets = [
+        sorted(set(f"senior backend engineer level{i % 7}".split())
+               | set(generator._extract_key_terms(f"we develop software for customer project {i}")))
+        for i in range(listings)
+    ]
+    
+    context = ProfileContext(profile)
+    for key_terms in key_term_sets:
+        assert context.experience_scores(key_terms) == _legacy_experience_scores(profile["experience"], key_terms)
+    
+    def score_sparse():
+        context = ProfileContext(profile)
+        for key_terms in key_term_sets:
+            context.experience_scores(key_terms)
+    
+    sparse_time = _time_call(score_sparse, repeat=3)
+    legacy_time = _time_call(
+        lambda: [_legacy_experience_scores(profile["experience"], key_terms) for key_terms in key_term_sets],
+        repeat=3
+    )
+    return {
+        "experiences": experiences,
+        "listings": listings,
+        "legacy_seconds": legacy_time,
+        "sparse_seconds": sparse_time,
+        "speedup": legacy_time / sparse_time
+    }
+
+
+def benchmark_interview_questions(skills: int = 40, count: int = 10, runs: int = 2000) -> Dict[str, Any]:
+    """
+    Compare sampled question generation against building, shuffling and
+    slicing the full question set, for a listing with many skills.
+    
+    Args:
+        skills: Number of required skills in the listing
+        count: Number of questions requested
+        runs: Number of question sets generated per timing
+        
+    Returns:
+        Dictionary with timings
+    """
+    import random
+    from interview_preparation import InterviewPreparationModule
+    
+    module = InterviewPreparationModule()
+    job = {"title": "Backend Engineer", "company": "Acme", "skills": [f"Skill {i}" for i in range(skills)]}
+    
+    def full_set():
+        questions = module._generate_technical_questions(job["title"], "", job["skills"])
+        questions += module._generate_behavioral_questions(job["title"], "")
+        questions += module._generate_company_questions(job["company"], "")
+        questions += module._generate_role_questions(job["title"], "")
+        random.shuffle(questions)
+        return questions[:count]
+    
+    assert len(module.generate_interview_questions(job, count)) == len(full_set())
+    
+    sampled_time = _time_call(lambda: [module.generate_interview_questions(job, count) for _ in range(runs)], repeat=3)
+    full_time = _time_call(lambda: [full_set() for _ in range(runs)], repeat=3)
+    return {
+        "skills": skills,
+        "count": count,
+        "full_set_seconds": full_time,
+        "sampled_seconds": sampled_time,
+        "speedup": full_time / sampled_time
+    }
+
+
+def benchmark_question_bank(lookups: int = 20000) -> Dict[str, Any]:
+    """
+    Compare indexed question bank lookups against scanning every question record.
+    
+    Args:
+        lookups: Number of skill lookups
+        
+    Returns:
+        Dictionary with timings
+    """
+    from question_bank import QUESTION_BANK_SOURCE, QuestionBank, _read_records, normalize_tag
+    
+    records = _read_records(QUESTION_BANK_SOURCE)
+    bank = QuestionBank(QuestionBank.compile(records))
+    skills = sorted({skill for record in records for skill in record["skills"]})
+    
+    def scan(skill: str) -> List[int]:
+        return [
+            question_id for question_id, record in enumerate(records)
+            if normalize_tag(skill) in map(normalize_tag, record["skills"]) and record["seniority"] == "senior"
+        ]
+    
+    for skill in skills:
+        assert bank.lookup(skill, seniority="senior") == scan(skill)
+    
+    indexed_time = _time_call(
+        lambda: [bank.lookup(skills[i % len(skills)], seniority="senior") for i in range(lookups)], repeat=3
+    )
+    scan_time = _time_call(lambda: [scan(skills[i % len(skills)]) for i in range(lookups)], repeat=3)
+    return {
+        "questions": len(bank),
+        "lookups": lookups,
+        "scan_seconds": scan_time,
+        "indexed_seconds": indexed_time,
+        "speedup": scan_time / indexed_time
+    }
+
+
+def benchmark_job_sections(paragraphs: int = 200) -> Dict[str, Any]:
+    """
+    Compare one-pass job description tokenization against searching for each
+    section header with its own regex, on a long listing.
+    
+    Args:
+        paragraphs: Number of filler paragraphs in the listing
+        
+    Returns:
+        Dictionary with timings
+    """
+    from job_description import SECTION_HEADERS, JobDescription
+    
+    filler = "\n\n".join(
+        f"Team {i} builds services for customers in region {i % 12} using modern tooling." for i in range(paragraphs)
+    )
+    text = "\n\n".join([
+        "About us: we build developer tools.",
+        filler,
+        "Responsibilities:\n- Design APIs\n- Review code",
+        filler,
+        "What you'll need:\n- Python\n- 5+ years of experience with distributed systems",
+        "Benefits: remote work"
+    ])
+    
+    def legacy_sections() -> Dict[str, str]:
+        sections = {}
+        for kind, headers in SECTION_HEADERS.items():
+            for header in headers:
+                match = re.search(header + r":?(.*?)(?:\n\n|\Z)", text, re.IGNORECASE | re.DOTALL)
+                if match:
+                    sections[kind] = match.group(1)
+                    break
+        return sections
+    
+    tokenized = JobDescription(text)
+    assert {kind: tokenized.section_text(kind) for kind in tokenized.sections} == legacy_sections()
+    
+    return {
+        "characters": len(text),
+        "legacy_seconds": _time_call(legacy_sections),
+        "tokenizer_seconds": _time_call(lambda: JobDescription(text))
+    }
+
+
+def _make_adversarial_descriptions(size: int) -> Dict[str, str]:
+    """
+    Build job descriptions that are worst cases for the extraction patterns:
+    no blank lines to end a section, long runs of word characters without the
+    words the patterns look for, and many near-misses.
+    
+    Args:
+        size: Length of each description in characters
+        
+    Returns:
+        Dictionary mapping case names to descriptions
+    """
+    import random
+    
+    rng = random.Random(0)
+    fragments = [
+        "requirements ", "computer science ", "degree", " in ", "background", "experience with ",
+        "5 ", "years ", "- ", "\n", "• ", "bachelor", ", ", "python ", "a" * 40 + " "
+    ]
+    fuzzed = []
+    length = 0
+    while length < size:
+        fragment = rng.choice(fragments)
+        fuzzed.append(fragment)
+        length += len(fragment)
+    
+    return {
+        "no_blank_lines": ("Requirements: " + "knowledge of systems " * size)[:size],
+        "word_run": ("computer science " * size)[:size],
+        "digit_run": ("5 " * size)[:size],
+        "bullet_run": ("- " + "x" * 60 + "\n") * (size // 63),
+        "experience_run": ("experience with " + "a " * size)[:size],
+        "background_in_run": ("background in " * size)[:size],
+        "degree_in_run": ("degree in " * size)[:size],
+        "fuzzed": "".join(fuzzed)[:size]
+    }
+
+
+def benchmark_adversarial_descriptions(size: int = 1000000, max_seconds: float = 10.0,
+                                       fuzz_runs: int = 20000) -> Dict[str, Any]:
+    """
+    Check that extraction time stays bounded on adversarial 1 MB descriptions,
+    with and without the MAX_DESCRIPTION_CHARS cap, and fuzz the hardened field-of-study patterns against their original form.
+    
+    Args:
+        size: Length of each adversarial description in characters
+        max_seconds: Maximum time allowed for all extractions on one description
+        fuzz_runs: Number of random short texts compared against the original patterns
+        
+    Returns:
+        Dictionary with the extraction time of each description
+    """
+    import random
+    from regex_registry import FIELD_OF_STUDY_SOURCES, FIELD_OF_STUDY_PATTERNS
+    from job_description import JobDescription
+    from job_matcher import JobMatcher
+    from interview_preparation import InterviewPreparationModule
+    
+    # The original patterns are quadratic, so they are only run on short texts
+    original_patterns = [
+        re.compile(source.replace(r"(?<![\w\s])", ""), re.IGNORECASE) for source in FIELD_OF_STUDY_SOURCES
+    ]
+    rng = random.Random(0)
+    tokens = ["a", " ", ".", " degree", "Degree", " background", "in", "\n", "é", "_", "-", "1"]
+    for _ in range(fuzz_runs):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 16)))
+        for hardened, original in zip(FIELD_OF_STUDY_PATTERNS, original_patterns):
+            expected = original.search(text)
+            found = hardened.search(text)
+            assert (found and (found.span(), found.groups())) == (expected and (expected.span(), expected.groups())), text
+    
+    matcher = JobMatcher()
+    module = InterviewPreparationModule(analysis_cache=None)
+    
+    def extract_all(description: str):
+        JobDescription(description).required_skills()
+        lowered = description.lower()
+        matcher._extract_years_required(lowered)
+        matcher._extract_degree_required(lowered)
+        matcher._extract_field_required(lowered)
+        module._analyze_description(description)
+    
+    def extract_capped(description: str):
+        # The public entry points cut descriptions to MAX_DESCRIPTION_CHARS first
+        job = {"title": "Engineer", "description": description}
+        matcher._job_requirements(job)
+        module.analyze_job_requirements(job)
+    
+    result = {"size": size}
+    for name, description in _make_adversarial_descriptions(size).items():
+        seconds = _time_call(lambda: extract_all(description), repeat=1)
+        assert seconds < max_seconds, f"Extraction took {seconds:.2f}s on the {name} description"
+        result[f"{name}_seconds"] = seconds
+        result[f"{name}_capped_seconds"] = _time_call(lambda: extract_capped(description), repeat=1)
+    
+    return result
+
+
+def _make_job_listings(count: int) -> List[Dict[str, Any]]:
+    """
+    Build synthetic job listings and a matching user profile.
+    
+    Args:
+        count: Number of listings to generate
+        
+    Returns:
+        List of job listings
+    """
+    import random
+    
+    rng = random.Random(0)
+    words = ("python java sql docker kubernetes react aws team lead backend data pipelines "
+             "requirements: 5+ years of experience bachelor's degree in computer science").split()
+    titles = ["Software Engineer", "Senior Backend Engineer", "Data Engineer", "Frontend Developer", "DevOps Engineer"]
+    return [
+        {
+            "id": i,
+            "title": f"{titles[i % len(titles)]} {i % 37}",
+            "company": f"Company {i % 50}",
+            "description": " ".join(rng.choice(words) for _ in range(60))
+        }
+        for i in range(count)
+    ]
+
+
+SAMPLE_MATCH_PROFILE = {
+    "summary": "Backend engineer building data pipelines in Python",
+    "skills": [{"name": "Python"}, {"name": "SQL"}, {"name": "Docker"}, {"name": "AWS"}],
+    "experience": [
+        {"title": "Software Engineer", "description": "Built python services on aws",
+         "start_date": "Jan 2016", "end_date": "Dec 2019"},
+        {"title": "Senior Backend Engineer", "description": "Led a data team",
+         "start_date": "Jan 2020", "end_date": "Present"}
+    ],
+    "education": [{"degree": "Bachelor of Science", "field_of_study": "Computer Science"}]
+}
+
+
+def benchmark_shared_matcher(listings: int = 1000, runs: int = 3, threads: int = 8) -> Dict[str, Any]:
+    """
+    Stress one JobMatcher shared by several threads, each matching the same
+    listings on a cold embedding cache, and compare every thread's results
+    against single-threaded matching.
+    
+    The single-threaded time is that of the same number of match_jobs calls
+    made one after another, each on a cold cache.
+    
+    Args:
+        listings: Number of job listings
+        runs: Number of stress runs
+        threads: Number of threads per run
+        
+    Returns:
+        Dictionary with the single-threaded time, the best time of a run and
+        the speedup
+    """
+    import threading
+    from job_matcher import JobMatcher, EMBEDDING_CACHE
+    
+    jobs = _make_job_listings(listings)
+    matcher = JobMatcher()
+    
+    start = time.perf_counter()
+    for _ in range(threads):
+        EMBEDDING_CACHE.clear()
+        expected = matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+    result = {"listings": listings, "threads": threads, "serial_seconds": time.perf_counter() - start}
+    
+    best = float("inf")
+    for _ in range(runs):
+        EMBEDDING_CACHE.clear()
+        found = [None] * threads
+        
+        def match(index: int):
+            found[index] = matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+        
+        workers = [threading.Thread(target=match, args=(index,)) for index in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        best = min(best, time.perf_counter() - start)
+        assert all(results == expected for results in found), "A thread's results differ from match_jobs"
+    
+    result["shared_seconds"] = best
+    result["speedup"] = result["serial_seconds"] / best
+    return result
+
+
+def benchmark_top_k_matching(listings: int = 5000, ks: tuple = (1, 10, 50)) -> Dict[str, Any]:
+    """
+    Compare score-bound pruned top-k matching against exhaustive matching.
+    
+    Args:
+        listings: Number of job listings
+        ks: Numbers of matches to request
+        
+    Returns:
+        Dictionary with the exhaustive time, and the time and pruned share per k
+    """
+    from job_matcher import JobMatcher, EMBEDDING_CACHE
+    
+    jobs = _make_job_listings(listings)
+    matcher = JobMatcher()
+    
+    EMBEDDING_CACHE.clear()
+    start = time.perf_counter()
+    expected = matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+    result = {"listings": listings, "exhaustive_seconds": time.perf_counter() - start}
+    
+    for k in ks:
+        EMBEDDING_CACHE.clear()
+        start = time.perf_counter()
+        found = matcher.match_jobs_top_k(SAMPLE_MATCH_PROFILE, jobs, k)
+        result[f"top_{k}_seconds"] = time.perf_counter() - start
+        assert found.matches == expected[:k], f"Top-{k} matching differs from exhaustive matching"
+        result[f"top_{k}_pruned"] = found.pruned / listings
+    
+    return result
+
+
+def benchmark_weight_recombination(listings: int = 2000, pairs: int = 1000000) -> Dict[str, Any]:
+    """
+    Check that rankings recombined from stored component scores match
+    re-matching under the same weights, and time recombination over many pairs.
+    
+    Args:
+        listings: Number of job listings matched and re-ranked
+        pairs: Number of synthetic pairs recombined in the timing run
+        
+    Returns:
+        Dictionary with the re-matching time, and the recombination times
+    """
+    import numpy as np
+    from component_scores import ComponentScoreStore, profile_key, job_key
+    from inference_backend import model_identity
+    from job_matcher import JobMatcher, MatchWeights
+    
+    jobs = _make_job_listings(listings)
+    store = ComponentScoreStore()
+    matcher = JobMatcher(score_store=store)
+    matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+    key = profile_key(SAMPLE_MATCH_PROFILE, model_identity(matcher.model))
+    
+    weightings = [
+        MatchWeights(),
+        MatchWeights(skill=0.7, experience=0.2, education=0.1),
+        MatchWeights(skill=0.2, experience=0.2, education=0.6, profile=0.5, semantic=0.5)
+    ]
+    result = {"listings": listings}
+    for index, weights in enumerate(weightings):
+        start = time.perf_counter()
+        expected = JobMatcher(weights).match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+        result[f"rematch_{index}_seconds"] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        found = store.rank(key, weights)
+        result[f"rerank_{index}_seconds"] = time.perf_counter() - start
+        expected_ranking = [
+            (job_key({name: value for name, value in job_result.items() if name not in ("match_score", "match_details")}),
+             job_result["match_score"])
+            for job_result in expected
+        ]
+        assert found == expected_ranking, f"Re-ranking under weighting {index} differs from re-matching"
+    
+    rng = np.random.default_rng(0)
+    large = ComponentScoreStore(capacity=pairs)
+    large.add_many("profile", [str(i) for i in range(pairs)], rng.random((pairs, 4)))
+    result["pairs"] = pairs
+    result["recombine_seconds"] = _time_call(lambda: large.combine(weightings[1]))
+    
+    return result
+
+
+class _CountingModel:
+    """Deterministic bag-of-words model that counts the texts it encodes."""
+    
+    def __init__(self, dimensions: int = 64, max_seq_length: int = 128):
+        self.dimensions = dimensions
+        self.max_seq_length = max_seq_length
+        self.encoded = 0
+        self.batches = 0
+    
+    def get_max_seq_length(self) -> int:
+        return self.max_seq_length
+    
+    def _encode_one(self, text: str):
+        import numpy as np
+        
+        vector = np.full(self.dimensions, 0.01, dtype=np.float32)
+        for word in text.lower().split()[:self.max_seq_length]:
+            vector[hash(word) % self.dimensions] += 1.0
+        return vector
+    
+    def encode(self, texts: Any):
+        import numpy as np
+        
+        if isinstance(texts, str):
+            self.encoded += 1
+            return self._encode_one(texts)
+        self.encoded += len(texts)
+        self.batches += 1
+        return np.stack([self._encode_one(text) for text in texts])
+
+
+def benchmark_chunked_embeddings(listings: int = 500, companies: int = 10) -> Dict[str, Any]:
+    """
+    Embed long descriptions that share per-company boilerplate, and check that
+    the boilerplate is encoded once, every word of a description counts, and
+    chunks past MAX_DOCUMENT_CHUNKS are counted as dropped.
+    
+    Args:
+        listings: Number of job listings
+        companies: Number of companies the listings are spread over
+        
+    Returns:
+        Dictionary with the time, the number of texts encoded and the number of batches
+    """
+    from embedding_cache import EmbeddingCache, MAX_DOCUMENT_CHUNKS, chunk_text, token_counter
+    
+    model = _CountingModel()
+    cache = EmbeddingCache(max_entries=100000)
+    boilerplate = {
+        company: [f"Company {company} benefit {paragraph} " * 30 for paragraph in range(3)]
+        for company in range(companies)
+    }
+    descriptions = [
+        "\n\n".join([f"Listing {i} requirements " * 40, f"Listing {i} duties " * 80] + boilerplate[i % companies])
+        for i in range(listings)
+    ]
+    
+    chunks = [chunk_text(text, model.get_max_seq_length() - 2, token_counter(model)) for text in descriptions]
+    assert all(len(chunk.split()) <= model.get_max_seq_length() - 2 for document in chunks for chunk, _ in document)
+    
+    start = time.perf_counter()
+    for offset in range(0, listings, 64):
+        cache.encode_documents(model, descriptions[offset:offset + 64], model.get_max_seq_length() - 2)
+    seconds = time.perf_counter() - start
+    
+    unique_chunks = len({chunk for document in chunks for chunk, _ in document})
+    assert model.encoded == unique_chunks, "A chunk was encoded more than once"
+    
+    oversized = "\n\n".join(f"Oversized listing paragraph {i}" for i in range(MAX_DOCUMENT_CHUNKS + 8))
+    cache.encode_documents(model, [oversized], 4)
+    stats = cache.stats()
+    assert stats["truncated_documents"] == 1 and stats["dropped_chunks"] == 8, "Dropped chunks were not counted"
+    
+    return {
+        "listings": listings,
+        "seconds": seconds,
+        "chunks": sum(len(document) for document in chunks),
+        "encoded": model.encoded,
+        "batches": model.batches
+    }
+
+
+def benchmark_boilerplate(companies: int = 5, listings_per_company: int = 400) -> Dict[str, Any]:
+    """
+    Match listings from a few large employers with and without boilerplate
+    stripping, and check that stripped listings yield the requirements of
+    their role-specific text alone.
+    
+    Args:
+        companies: Number of companies
+        listings_per_company: Number of listings per company
+        
+    Returns:
+        Dictionary with the matching time with and without stripping
+    """
+    import boilerplate
+    from job_matcher import JobMatcher, EMBEDDING_CACHE
+    
+    def company_paragraphs(company: int) -> List[str]:
+        return [
+            f"About us: Company {company} builds cloud software in Java, Go and Kubernetes for banks. "
+            "Founded 20 years ago, we have over 10 years of experience serving regulated industries. " * 4,
+            "Benefits: competitive salary, equity, health, dental and vision insurance, a learning budget, "
+            "and a yearly offsite. We value a master's degree in economics but do not require one. " * 4,
+            f"Company {company} is an equal opportunity employer and does not discriminate on any protected basis. " * 3
+        ]
+    
+    jobs = []
+    role_texts = []
+    for company in range(companies):
+        for index in range(listings_per_company):
+            role_text = (f"Requirements:\n- Python\n- SQL\n- {index % 7 + 1}+ years of experience\n"
+                         f"- Bachelor's degree in computer science\n\nYou will own service {index}.")
+            role_texts.append(role_text)
+            jobs.append({
+                "id": len(jobs),
+                "title": f"Software Engineer {index}",
+                "company": f"Company {company}",
+                "description": "\n\n".join([role_text] + company_paragraphs(company))
+            })
+    
+    result = {"listings": len(jobs)}
+    index = boilerplate.BoilerplateIndex(boilerplate.MIN_LISTINGS or 3)
+    for label, matcher in (("unstripped", JobMatcher()), ("stripped", JobMatcher(boilerplate=index))):
+        EMBEDDING_CACHE.clear()
+        start = time.perf_counter()
+        matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)
+        result[f"{label}_seconds"] = time.perf_counter() - start
+    
+    # Once learned, every listing is reduced to its role-specific text
+    for job, role_text in zip(jobs, role_texts):
+        assert boilerplate.listing_description(job, index) == role_text, job["id"]
+        assert matcher._job_requirements(job) == matcher._job_requirements({"description": role_text})
+    # Without the index, descriptions are left alone
+    assert all(boilerplate.listing_description(job) == job["description"] for job in jobs)
+    result["boilerplate_paragraphs"] = index.stats()["boilerplate"]
+    
+    return result
+
+
+def benchmark_experience_dates(entries: int = 200, listings: int = 2000) -> Dict[str, Any]:
+    """
+    Check month-precision experience merging on known cases, and time
+    summarizing a long experience history cold and from the profile cache.
+    
+    Args:
+        entries: Number of experience entries in the timed profile
+        listings: Number of listings the profile is scored against
+        
+    Returns:
+        Dictionary with the cold, cached and per-listing times
+    """
+    import datetime
+    import experience_dates
+    
+    today = datetime.date(2025, 6, 15)
+    cases = [
+        ([{"start_date": "Jan 2016", "end_date": "Dec 2019"}], 4.0),
+        ([{"start_date": "2018", "end_date": "2020"}], 2.0),
+        ([{"date_range": "Mar 2024 - Present"}], 16 / 12),
+        # Overlapping and adjacent roles count once
+        ([{"start_date": "Jan 2016", "end_date": "Dec 2019"}, {"start_date": "2018-06", "end_date": "06/2021"}], 5.5),
+        ([{"start_date": "Jan 2016", "end_date": "Dec 2016"}, {"start_date": "Jan 2017", "end_date": "Dec 2017"}], 2.0),
+        ([{"start_date": "Jan 2016", "end_date": "Dec 2016"}, {"duration_years": 1.5}], 2.5),
+        ([{"start_date": "sometime"}, {"start_date": "Dec 2020", "end_date": "Jan 2020"}], 0.0)
+    ]
+    for experiences, years in cases:
+        found = experience_dates.summarize_experience(experiences, today).years
+        assert abs(found - years) < 1e-9, (experiences, found, years)
+    
+    history = [
+        {"start_date": f"{['Jan', 'Apr', 'Jul', 'Oct'][i % 4]} {1990 + i % 30}", "end_date": f"Mar {1991 + i % 30}"}
+        for i in range(entries)
+    ]
+    
+    def summarize_cold():
+        experience_dates.PARSED_DATES.clear()
+        experience_dates.EXPERIENCE_SUMMARIES.clear()
+        experience_dates.summarize_experience(history, today)
+    
+    cold = _time_call(summarize_cold)
+    cached = _time_call(lambda: experience_dates.summarize_experience(history, today))
+    
+    summary = experience_dates.summarize_experience(history, today)
+    per_listing = _time_call(lambda: [summary.years >= required for required in range(listings)])
+    
+    return {"entries": entries, "cold_seconds": cold, "cached_seconds": cached, "per_listing_seconds": per_listing / listings}
+
+
+def benchmark_education_taxonomy(listings: int = 2000, fuzz_runs: int = 20000) -> Dict[str, Any]:
+    """
+    Check the education taxonomy against the per-pattern regexes it replaced,
+    and time degree and field extraction per listing with both.
+    
+    Args:
+        listings: Number of synthetic listing descriptions to time
+        fuzz_runs: Number of random texts compared against the original regexes
+        
+    Returns:
+        Dictionary with the per-listing time of both implementations
+    """
+    import random
+    from regex_registry import FIELD_OF_STUDY_PATTERNS
+    import education_taxonomy
+    
+    # The degree patterns matched before the taxonomy, in priority order
+    original_degrees = [
+        ("bachelor", [r"bachelor'?s?", r"ba", r"bs", r"b\.a", r"b\.s", r"undergraduate"]),
+        ("master", [r"master'?s?", r"ma", r"ms", r"m\.a", r"m\.s", r"graduate"]),
+        ("phd", [r"ph\.?d", r"doctorate", r"doctoral"]),
+        ("associate", [r"associate'?s?", r"a\.a", r"a\.s"])
+    ]
+    original_degree_patterns = [
+        (degree, re.compile(r"\b" + pattern + r"\b", re.IGNORECASE))
+        for degree, patterns in original_degrees for pattern in patterns
+    ]
+    
+    def original_degree(description: str) -> str:
+        for degree, pattern in original_degree_patterns:
+            if pattern.search(description):
+                return degree
+        return ""
+    
+    def original_field(description: str) -> str:
+        for pattern in FIELD_OF_STUDY_PATTERNS:
+            match = pattern.search(description)
+            if match:
+                for field in education_taxonomy.FIELDS_OF_STUDY:
+                    if field in match.group(1).lower():
+                        return field
+        for field in education_taxonomy.FIELDS_OF_STUDY:
+            if field in description:
+                return field
+        return ""
+    
+    rng = random.Random(0)
+    words = [
+        "bachelor's", "ba", "bs", "b.a", "b.s.", "ph.d", "phd", "master's", "ma", "m.s", "graduate", "a.s",
+        "as", "maths", "degree in", "background", "computer science", "engineering", "business", "data",
+        "science", "statistics", "physics", "with", "the", "e.g.", "node.js", ",", "\n",
+        "bsc", "b.sc", "beng", "msc", "m.sc", "meng", "m.eng", "mba", "doctor"
+    ]
+    cases = [str.lower, str.upper, str.title, str.capitalize]
+    for _ in range(fuzz_runs):
+        text = " ".join(rng.choice(cases)(rng.choice(words)) for _ in range(rng.randint(0, 20)))
+        assert education_taxonomy.degree_required(text) == original_degree(text), text
+        assert education_taxonomy.field_required(text) == original_field(text), text
+    
+    # Substring checks used to read "mathematics" as a master's
+    assert education_taxonomy.degree_class("Bachelor of Science in Mathematics") == "bachelor"
+    assert education_taxonomy.degree_class("MBA") == "master"
+    assert education_taxonomy.degree_class("Ph.D. in Physics") == "phd"
+    assert education_taxonomy.degree_required("MBA or MSc preferred") == ""
+    assert education_taxonomy.field_required("Bachelor in Computer Science required.") == ""
+    
+    descriptions = [job["description"].lower() for job in _make_job_listings(listings)]
+    original = _time_call(lambda: [(original_degree(text), original_field(text)) for text in descriptions])
+    taxonomy = _time_call(lambda: [
+        (education_taxonomy.degree_required(text), education_taxonomy.field_required(text)) for text in descriptions
+    ])
+    
+    return {
+        "listings": listings,
+        "aho_corasick": education_taxonomy.ahocorasick is not None,
+        "original_per_listing_seconds": original / listings,
+        "taxonomy_per_listing_seconds": taxonomy / listings
+    }
+
+
+def benchmark_inference_backend(backend: Optional[str] = None, listings: int = 500, k: int = 10,
+                                min_correlation: float = 0.95) -> Dict[str, Any]:
+    """
+    Check that an embedding inference backend ranks the benchmark listings like
+    the fp32 SentenceTransformer, and time both.
+    
+    Args:
+        backend: Backend to check (default: PJA_EMBEDDING_BACKEND, or "quantized"
+            if that is the default backend)
+        listings: Number of synthetic listings to rank
+        k: Number of top listings compared
+        min_correlation: Minimum Spearman correlation of the semantic rankings
+        
+    Returns:
+        Dictionary with ranking agreement and encoding times, or the reason
+        the check was skipped if a backend cannot be loaded
+    """
+    import numpy as np
+    import inference_backend
+    
+    if backend is None:
+        backend = inference_backend.BACKEND
+        if backend == inference_backend.DEFAULT_BACKEND:
+            backend = "quantized"
+    models = {}
+    for name, model_backend in (("reference", inference_backend.DEFAULT_BACKEND), ("candidate", backend)):
+        try:
+            models[name] = inference_backend.load_backend(model_backend)
+        except Exception as e:
+            return {"backend": backend, "skipped": f"the {model_backend} backend could not be loaded ({e!r})"}
+    
+    from job_matcher import JobMatcher, build_job_text
+    
+    jobs = _make_job_listings(listings)
+    texts = [build_job_text(job) for job in jobs]
+    profile_text = SAMPLE_MATCH_PROFILE["summary"]
+    
+    result = {"backend": backend, "listings": listings}
+    similarities = {}
+    top_jobs = {}
+    for name, model in models.items():
+        result[f"{name}_encode_seconds"] = _time_call(lambda: model.encode(texts), repeat=1)
+        
+        embeddings = np.asarray(model.encode(texts), dtype=np.float64)
+        profile = np.asarray(model.encode(profile_text), dtype=np.float64)
+        similarities[name] = embeddings @ profile / (np.linalg.norm(embeddings, axis=1) * np.linalg.norm(profile))
+        
+        matcher = JobMatcher()
+        matcher.model = model
+        top_jobs[name] = [job["id"] for job in matcher.match_jobs(SAMPLE_MATCH_PROFILE, jobs)[:k]]
+    
+    # Spearman correlation of the semantic rankings
+    ranks = {name: np.argsort(np.argsort(-values)) for name, values in similarities.items()}
+    correlation = float(np.corrcoef(ranks["reference"], ranks["candidate"])[0, 1])
+    semantic_top = {name: set(np.argsort(-values, kind="stable")[:k].tolist()) for name, values in similarities.items()}
+    
+    result["spearman"] = correlation
+    result["semantic_top_k_overlap"] = len(semantic_top["reference"] & semantic_top["candidate"]) / k
+    result["match_top_k_overlap"] = len(set(top_jobs["reference"]) & set(top_jobs["candidate"])) / k
+    result["max_similarity_error"] = float(np.max(np.abs(similarities["reference"] - similarities["candidate"])))
+    assert correlation >= min_correlation, f"The {backend} backend ranks listings differently (Spearman {correlation:.3f})"
+    return result
+
+
+BENCHMARKS = {
+    "sections": benchmark_section_identification,
+    "parse_cache": benchmark_parse_cache,
+    "template_render": benchmark_template_render,
+    "experience_relevance": benchmark_experience_relevance,
+    "interview_questions": benchmark_interview_questions,
+    "question_bank": benchmark_question_bank,
+    "job_sections": benchmark_job_sections,
+    "adversarial": benchmark_adversarial_descriptions,
+    "shared_matcher": benchmark_shared_matcher,
+    "top_k": benchmark_top_k_matching,
+    "weight_recombination": benchmark_weight_recombination,
+    "chunked_embeddings": benchmark_chunked_embeddings,
+    "boilerplate": benchmark_boilerplate,
+    "experience_dates": benchmark_experience_dates,
+    "education_taxonomy": benchmark_education_taxonomy,
+    "inference_backend": benchmark_inference_backend,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        result = BENCHMARKS[name]()
+        print(f"{name}: " + ", ".join(
+            f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in result.items()
+        ))
@@ -0,0 +1,252 @@
+"""
+Company Boilerplate Detection for Personal Job Agent
+
+Postings from the same company repeat long paragraphs ("About us", benefits,
+equal opportunity statements) that say nothing about the role. This module
+fingerprints the paragraphs of each company's listings, learns the ones that
+recur across several listings, and strips them from descriptions before they
+are scanned for requirements or embedded.
+
+Stripping is opt-in: build a BoilerplateIndex and pass it to JobMatcher, which
+then learns from every batch it matches and strips with what it has learned.
+The module-level job_matcher functions (match_jobs, match_jobs_json, ...) use
+SHARED_INDEX, which is only created when the PJA_STRIP_BOILERPLATE environment
+variable is 1, so each process reuses one index across calls. Without an
+index, descriptions are used as they are, so results never depend on what a
+process matched before. Since the same listing can then score differently,
+ComponentScoreStore keys include the company's fingerprint (see
+BoilerplateIndex.fingerprint); the other caches key on the stripped text itself.
+
+Paragraphs are the blocks between blank lines. A paragraph counts as
+boilerplate once it appears in MIN_LISTINGS different listings of the same
+company and is at least MIN_PARAGRAPH_CHARS long. Paragraphs that open a
+requirements or responsibilities section are never stripped, since companies
+often reuse those too.
+
+Set the PJA_BOILERPLATE_MIN_LISTINGS environment variable to change the
+default number of listings (0 makes indexes learn nothing).
+"""
+
+import os
+import threading
+from typing import Dict, Any, Iterable, Optional, Set
+
+from job_description import SECTION_HEADERS
+from result_cache import LRUCache, content_hash
+
+
+MIN_LISTINGS = int(os.environ.get("PJA_BOILERPLATE_MIN_LISTINGS", "3"))
+
+STRIP_BOILERPLATE = os.environ.get("PJA_STRIP_BOILERPLATE") == "1"
+
+MIN_PARAGRAPH_CHARS = 80
+
+# Paragraphs tracked per company before rarely seen ones are dropped
+MAX_FINGERPRINTS_PER_COMPANY = 10000
+
+# Headers of the sections extraction relies on
+PROTECTED_HEADERS = SECTION_HEADERS["requirements"] + SECTION_HEADERS["responsibilities"]
+
+
+def paragraph_fingerprint(paragraph: str) -> str:
+    """
+    Fingerprint a paragraph, ignoring case and whitespace differences.
+    
+    Args:
+        paragraph: Paragraph text
+    
+    Returns:
+        Fingerprint of the normalized paragraph
+    """
+    return content_hash(" ".join(paragraph.lower().split()))
+
+
+def _is_protected(paragraph: str) -> bool:
+    """Check whether a paragraph opens a section that extraction relies on."""
+    lowered = paragraph.lower()
+    return any(header in lowered for header in PROTECTED_HEADERS)
+
+
+class BoilerplateIndex:
+    """
+    Thread-safe index of recurring paragraphs per company.
+    """
+    
+    def __init__(self, min_listings: int = MIN_LISTINGS, max_listings: int = 100000):
+        """
+        Initialize an empty index.
+        
+        Args:
+            min_listings: Number of listings a paragraph must appear in to count as boilerplate
+                (0 disables stripping)
+            max_listings: Number of listing fingerprints remembered to avoid counting a listing twice
+        """
+        self.min_listings = min_listings
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.boilerplate = {}
+        self.fingerprints = {}
+        self.seen_listings = LRUCache(max_listings)
+        self.stripped = LRUCache(4096)
+    
+    def learn(self, job_listings: Iterable[Dict[str, Any]]):
+        """
+        Count the paragraphs of listings not seen before.
+        
+        Args:
+            job_listings: Job listings with "company" and "description"
+        """
+        if self.min_listings <= 0:
+            return
+        
+        for job in job_listings:
+            company = job.get("company")
+            description = job.get("description")
+            if not isinstance(company, str) or not company or not description:
+                continue
+            
+            listing_key = content_hash(company, description)
+            with self.lock:
+                if listing_key in self.seen_listings:
+                    continue
+                self.seen_listings.put(listing_key, True)
+            
+            fingerprints = {
+                paragraph_fingerprint(paragraph)
+                for paragraph in description.split("\n\n")
+                if len(paragraph.strip()) >= MIN_PARAGRAPH_CHARS and not _is_protected(paragraph)
+            }
+            if fingerprints:
+                self._count(company, fingerprints)
+    
+    def _count(self, company: str, fingerprints: Set[str]):
+        """Add one listing's paragraph fingerprints to a company's counts."""
+        with self.lock:
+            counts = self.counts.setdefault(company, {})
+            for fingerprint in fingerprints:
+                count = counts.get(fingerprint, 0) + 1
+                counts[fingerprint] = count
+                if count == self.min_listings:
+                    self._add_boilerplate(company, {fingerprint})
+            
+            if len(counts) > MAX_FINGERPRINTS_PER_COMPANY:
+                # Paragraphs seen once are unlikely to be boilerplate
+                for fingerprint in [fingerprint for fingerprint, count in counts.items() if count == 1]:
+                    del counts[fingerprint]
+    
+    def _add_boilerplate(self, company: str, fingerprints: Iterable[str]):
+        """Add paragraph fingerprints to a company's boilerplate; call with the lock held."""
+        boilerplate = self.boilerplate.get(company, frozenset()) | frozenset(fingerprints)
+        self.boilerplate[company] = boilerplate
+        self.fingerprints[company] = content_hash(*sorted(boilerplate))
+    
+    def fingerprint(self, company: Optional[str]) -> str:
+        """
+        Get a fingerprint of a company's learned boilerplate.
+        
+        Args:
+            company: Company name
+            
+        Returns:
+            Content hash of the company's boilerplate paragraphs (empty string if none)
+        """
+        return self.fingerprints.get(company, "") if isinstance(company, str) else ""
+    
+    def strip(self, company: Optional[str], description: str) -> str:
+        """
+        Remove a company's learned boilerplate paragraphs from a description.
+        
+        Args:
+            company: Company name
+            description: Job description
+        
+        Returns:
+            Description without boilerplate paragraphs (unchanged if none are known)
+        """
+        boilerplate = self.boilerplate.get(company) if isinstance(company, str) else None
+        if not boilerplate:
+            return description
+        
+        key = (company, len(boilerplate), content_hash(description))
+        stripped = self.stripped.get(key)
+        if stripped is None:
+            paragraphs = description.split("\n\n")
+            kept = [
+                paragraph for paragraph in paragraphs
+                if len(paragraph.strip()) < MIN_PARAGRAPH_CHARS
+                or paragraph_fingerprint(paragraph) not in boilerplate
+                or _is_protected(paragraph)
+            ]
+            stripped = description if len(kept) == len(paragraphs) else "\n\n".join(kept)
+            self.stripped.put(key, stripped)
+        return stripped
+    
+    def snapshot(self, companies: Optional[Iterable[str]] = None) -> Dict[str, frozenset]:
+        """
+        Get the learned boilerplate fingerprints, e.g. to hand to worker processes.
+        
+        Args:
+            companies: Companies to include (default: all)
+        
+        Returns:
+            Dictionary mapping companies to their boilerplate fingerprints
+        """
+        with self.lock:
+            if companies is None:
+                return dict(self.boilerplate)
+            return {company: self.boilerplate[company] for company in set(companies) if company in self.boilerplate}
+    
+    def load(self, snapshot: Dict[str, frozenset]):
+        """
+        Add boilerplate fingerprints from a snapshot.
+        
+        Args:
+            snapshot: Result of snapshot
+        """
+        with self.lock:
+            for company, fingerprints in snapshot.items():
+                self._add_boilerplate(company, fingerprints)
+    
+    def clear(self):
+        """Forget everything learned."""
+        with self.lock:
+            self.counts.clear()
+            self.boilerplate.clear()
+            self.fingerprints.clear()
+            self.seen_listings.clear()
+        self.stripped.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get index statistics.
+        
+        Returns:
+            Dictionary with the number of companies, tracked paragraphs and boilerplate paragraphs
+        """
+        with self.lock:
+            return {
+                "companies": len(self.counts),
+                "paragraphs": sum(len(counts) for counts in self.counts.values()),
+                "boilerplate": sum(len(fingerprints) for fingerprints in self.boilerplate.values())
+            }
+
+
+def listing_description(job: Dict[str, Any], boilerplate: Optional[BoilerplateIndex] = None) -> str:
+    """
+    Get a listing's description without its company's known boilerplate.
+    
+    Args:
+        job: Job listing data
+        boilerplate: Index of learned boilerplate (default: strip nothing)
+    
+    Returns:
+        Description to analyze and embed
+    """
+    description = job.get("description", "")
+    if boilerplate is None:
+        return description
+    return boilerplate.strip(job.get("company"), description)
+
+
+# Index shared by the module-level matching functions, if stripping is enabled
+SHARED_INDEX = BoilerplateIndex() if STRIP_BOILERPLATE else None
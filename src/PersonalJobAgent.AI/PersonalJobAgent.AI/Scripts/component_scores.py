@@ -0,0 +1,280 @@
+"""
+Component Scores for Personal Job Agent
+
+This module stores the component scores (skill, experience, education,
+semantic) of matched (profile, job) pairs as columns of one NumPy array, so a
+new weighting of the match score can be evaluated by recombining the stored
+columns instead of matching again. Recombination uses the same arithmetic as
+JobMatcher, so a ranking computed from the store is identical to matching with
+the same weights.
+
+Stores can be saved to and loaded from .npz files.
+"""
+
+import json
+import threading
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from result_cache import content_hash
+
+
+COMPONENTS = ("skill", "experience", "education", "semantic")
+
+# Version tag of the component score definitions; bump when a component changes
+SCORES_VERSION = "2"
+
+
+def profile_key(user_profile: Dict[str, Any], model: str) -> str:
+    """
+    Get the store key of a user profile.
+    
+    Semantic scores depend on the embedding model, so the key includes the
+    identity of the model that computed them.
+    
+    Args:
+        user_profile: User profile data
+        model: Identity of the embedding model (see inference_backend.model_identity)
+    
+    Returns:
+        Content hash of the profile and model
+    """
+    return content_hash(SCORES_VERSION, model, json.dumps(user_profile, sort_keys=True, default=str))
+
+
+def job_key(job: Dict[str, Any], boilerplate: str = "") -> str:
+    """
+    Get the store key of a job listing.
+    
+    Args:
+        job: Job listing data
+        boilerplate: Fingerprint of the boilerplate stripped from the listing
+            (see BoilerplateIndex.fingerprint), empty if none
+    
+    Returns:
+        Content hash of the listing
+    """
+    encoded = json.dumps(job, sort_keys=True, default=str)
+    if boilerplate:
+        return content_hash(SCORES_VERSION, encoded, boilerplate)
+    return content_hash(SCORES_VERSION, encoded)
+
+
+class ComponentScoreStore:
+    """
+    Thread-safe columnar store of component scores per (profile, job) pair.
+    
+    Pairs keep the position they were first stored at; storing a pair again
+    overwrites its scores in place. Rankings break ties by that position, as
+    match_jobs breaks them by input order.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty store.
+        
+        Args:
+            capacity: Number of pairs to allocate room for up front
+        """
+        self.lock = threading.Lock()
+        self.size = 0
+        self.scores = np.empty((capacity, len(COMPONENTS)), dtype=np.float64)
+        self.profiles = np.empty(capacity, dtype=np.int64)
+        self.jobs = np.empty(capacity, dtype=np.int64)
+        
+        self.profile_keys = []
+        self.profile_codes = {}
+        self.job_keys = []
+        self.job_codes = {}
+        self.rows = {}
+    
+    def _code(self, key: str, keys: List[str], codes: Dict[str, int]) -> int:
+        """Get the integer code of a key, assigning the next one to new keys."""
+        code = codes.get(key)
+        if code is None:
+            code = len(keys)
+            keys.append(key)
+            codes[key] = code
+        return code
+    
+    def _grow(self, size: int):
+        """Make room for at least size pairs."""
+        capacity = len(self.scores)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        
+        scores = np.empty((capacity, len(COMPONENTS)), dtype=np.float64)
+        scores[:self.size] = self.scores[:self.size]
+        profiles = np.empty(capacity, dtype=np.int64)
+        profiles[:self.size] = self.profiles[:self.size]
+        jobs = np.empty(capacity, dtype=np.int64)
+        jobs[:self.size] = self.jobs[:self.size]
+        self.scores, self.profiles, self.jobs = scores, profiles, jobs
+    
+    def add_many(self, profile: str, jobs: Sequence[str], scores: Sequence[Sequence[float]]):
+        """
+        Store the component scores of one profile against several jobs.
+        
+        Args:
+            profile: Profile key (see profile_key)
+            jobs: Job keys (see job_key)
+            scores: Component scores of each job, in COMPONENTS order
+        """
+        with self.lock:
+            profile_code = self._code(profile, self.profile_keys, self.profile_codes)
+            self._grow(self.size + len(jobs))
+            for job, job_scores in zip(jobs, scores):
+                job_code = self._code(job, self.job_keys, self.job_codes)
+                row = self.rows.get((profile_code, job_code))
+                if row is None:
+                    row = self.size
+                    self.size += 1
+                    self.rows[(profile_code, job_code)] = row
+                    self.profiles[row] = profile_code
+                    self.jobs[row] = job_code
+                self.scores[row] = job_scores
+    
+    def add(self, profile: str, job: str, scores: Sequence[float]):
+        """
+        Store the component scores of one pair.
+        
+        Args:
+            profile: Profile key (see profile_key)
+            job: Job key (see job_key)
+            scores: Component scores, in COMPONENTS order
+        """
+        self.add_many(profile, [job], [scores])
+    
+    def get(self, profile: str, job: str) -> Optional[Dict[str, float]]:
+        """
+        Look up the component scores of a pair.
+        
+        Args:
+            profile: Profile key
+            job: Job key
+        
+        Returns:
+            Dictionary mapping component names to scores, or None if the pair is not stored
+        """
+        with self.lock:
+            row = self.rows.get((self.profile_codes.get(profile), self.job_codes.get(job)))
+            if row is None:
+                return None
+            return dict(zip(COMPONENTS, self.scores[row].tolist()))
+    
+    def combine(self, weights: Any, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Recombine stored component scores into match scores.
+        
+        Args:
+            weights: MatchWeights (or any object with the same attributes)
+            rows: Rows to combine (default: every stored pair)
+        
+        Returns:
+            Match score of each row
+        """
+        with self.lock:
+            scores = self.scores[:self.size] if rows is None else self.scores[rows]
+        skill, experience, education, semantic = scores.T
+        
+        # Same operation order as JobMatcher._calculate_match_score
+        match_score = weights.skill * skill + weights.experience * experience + weights.education * education
+        return match_score * weights.profile + semantic * weights.semantic
+    
+    def rank(self, profile: str, weights: Any, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank the jobs stored for a profile under a weighting.
+        
+        Args:
+            profile: Profile key
+            weights: MatchWeights (or any object with the same attributes)
+            k: Number of jobs to return (default: all)
+        
+        Returns:
+            List of (job key, match score) pairs, best first
+        """
+        with self.lock:
+            profile_code = self.profile_codes.get(profile)
+            if profile_code is None:
+                return []
+            rows = np.flatnonzero(self.profiles[:self.size] == profile_code)
+            jobs = self.jobs[rows]
+        
+        totals = self.combine(weights, rows)
+        order = np.argsort(-totals, kind="stable")[:k]
+        return [(self.job_keys[jobs[index]], float(totals[index])) for index in order]
+    
+    def save(self, path: str):
+        """
+        Save the store to a .npz file.
+        
+        Args:
+            path: Output path
+        """
+        with self.lock:
+            np.savez(
+                path,
+                scores=self.scores[:self.size],
+                profiles=self.profiles[:self.size],
+                jobs=self.jobs[:self.size],
+                profile_keys=np.array(self.profile_keys, dtype=str),
+                job_keys=np.array(self.job_keys, dtype=str)
+            )
+    
+    @classmethod
+    def load(cls, path: str) -> "ComponentScoreStore":
+        """
+        Load a store saved with save.
+        
+        Args:
+            path: Path of the .npz file
+        
+        Returns:
+            Loaded store
+        """
+        with np.load(path) as data:
+            store = cls(capacity=max(len(data["scores"]), 1))
+            store.size = len(data["scores"])
+            store.scores[:store.size] = data["scores"]
+            store.profiles[:store.size] = data["profiles"]
+            store.jobs[:store.size] = data["jobs"]
+            store.profile_keys = data["profile_keys"].tolist()
+            store.job_keys = data["job_keys"].tolist()
+        
+        store.profile_codes = {key: code for code, key in enumerate(store.profile_keys)}
+        store.job_codes = {key: code for code, key in enumerate(store.job_keys)}
+        store.rows = {
+            (profile_code, job_code): row
+            for row, (profile_code, job_code) in enumerate(zip(store.profiles[:store.size].tolist(),
+                                                               store.jobs[:store.size].tolist()))
+        }
+        return store
+    
+    def clear(self):
+        """Remove all pairs."""
+        with self.lock:
+            self.size = 0
+            self.profile_keys.clear()
+            self.profile_codes.clear()
+            self.job_keys.clear()
+            self.job_codes.clear()
+            self.rows.clear()
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store statistics.
+        
+        Returns:
+            Dictionary with the number of pairs, profiles and jobs
+        """
+        with self.lock:
+            return {
+                "pairs": self.size,
+                "profiles": len(self.profile_keys),
+                "jobs": len(self.job_keys)
+            }
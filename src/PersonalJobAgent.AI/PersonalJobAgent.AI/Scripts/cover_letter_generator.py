@@ -5,27 +5,293 @@ This module provides functionality to generate personalized cover letters
 based on user profiles and job listings using NLP techniques.
 """
 
+import os
 import re
+import json
 import random
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
 import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from job_description import tokenize_job_description
+from boilerplate import listing_description
+from json_boundary import JsonInput, loads
+from regex_registry import registry
+from template_engine import TemplatePack, TemplateStore
+from result_cache import LRUCache, content_hash
+from embedding_cache import EMBEDDING_CACHE
+
+SKILL_BULLET_PATTERN = registry.compile("cover_letter.skill_bullet", r"[•\-*]\s*([\w\s,/&+#]+)")
+SENTENCE_SPLIT_PATTERN = registry.compile("cover_letter.sentence_split", r'(?<=[.!?])\s+')
+
+# Words and figures that suggest a sentence describes an accomplishment
+ACHIEVEMENT_INDICATOR = registry.alternation("cover_letter.achievement_indicator", [
+    r"increased", r"decreased", r"improved", r"reduced", r"achieved",
+    r"developed", r"implemented", r"created", r"launched", r"led",
+    r"managed", r"coordinated", r"designed", r"\d+%", r"\$\d+"
+], re.IGNORECASE)
+
+# Common job-related terms looked for in job descriptions
+JOB_TERMS = [
+    "develop", "design", "implement", "manage", "lead", "create",
+    "analyze", "research", "coordinate", "organize", "plan",
+    "software", "application", "system", "database", "network",
+    "project", "team", "client", "customer", "user",
+    "experience", "skill", "knowledge", "ability", "proficiency"
+]
+
+# Cover letter template packs, loaded once per process. Set
+# PJA_TEMPLATE_RELOAD_SECONDS to pick up edited template files without a restart.
+_reload_seconds = os.environ.get("PJA_TEMPLATE_RELOAD_SECONDS")
+TEMPLATE_STORE = TemplateStore(
+    "cover_letter",
+    reload_interval=float(_reload_seconds) if _reload_seconds else None
+)
+
+# Bump when a change alters the letters produced for the same inputs
+LETTER_VERSION = "1"
+
+# Letters rendered in deterministic mode, shared by all generators in the process
+LETTER_CACHE = LRUCache(max_entries=1024)
+
+
+def stable_hash(data: Any) -> str:
+    """
+    Hash JSON-like data independently of dictionary key order.
+    
+    Args:
+        data: Profile, listing or other JSON-serializable data
+        
+    Returns:
+        Hex digest identifying the data
+    """
+    return content_hash(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class ProfileContext:
+    """
+    Profile-side data that does not depend on the job listing.
+    
+    Computing it once lets one profile be matched against many listings
+    without re-sorting skills or re-lowercasing experience texts per letter.
+    """
+    
+    def __init__(self, user_profile: Dict[str, Any], experience_embeddings: Optional[List[Any]] = None):
+        """
+        Precompute profile-side data.
+        
+        Args:
+            user_profile: User profile data
+            experience_embeddings: Embeddings of the experiences, if already computed
+        """
+        self.user_profile = user_profile
+        self.experience_embeddings = experience_embeddings
+        self.skills = user_profile.get("skills", [])
+        self.skill_names = [skill.get("name", "").lower() for skill in self.skills]
+        self.experiences = user_profile.get("experience", [])
+        self.experience_titles = [exp.get("title", "").lower() for exp in self.experiences]
+        self.experience_descriptions = [exp.get("description", "").lower() for exp in self.experiences]
+        self._sorted_skills = None
+        self._term_postings = {}
+        self._profile_hash = None
+        
+        # All experience texts in one string, so a term absent from the whole
+        # history is ruled out with a single substring search
+        self._history_text = "\0".join(self.experience_titles + self.experience_descriptions)
+    
+    @property
+    def profile_hash(self) -> str:
+        """Content hash of the profile, computed on first use."""
+        if self._profile_hash is None:
+            self._profile_hash = stable_hash(self.user_profile)
+        return self._profile_hash
+    
+    @property
+    def sorted_skills(self) -> List[Dict[str, Any]]:
+        """Skills sorted by proficiency plus years of experience, computed on first use."""
+        if self._sorted_skills is None:
+            self._sorted_skills = sorted(
+                self.skills,
+                key=lambda s: s.get("proficiency", 0) + s.get("years_experience", 0),
+                reverse=True
+            )
+        return self._sorted_skills
+    
+    def term_postings(self, term: str) -> List[Tuple[int, int]]:
+        """
+        Get the experiences a key term occurs in, with the term's weight in each.
+        
+        A term found in an experience title weighs 2, in its description 1.
+        Experiences where the term does not occur are left out, and postings
+        are memoized per term, so across many listings each distinct term is
+        looked up in the experience texts only once.
+        
+        Args:
+            term: Key term
+            
+        Returns:
+            List of (experience index, weight) pairs with non-zero weight
+        """
+        postings = self._term_postings.get(term)
+        if postings is None:
+            postings = []
+            if term in self._history_text:
+                for index, (title, description) in enumerate(zip(self.experience_titles,
+                                                                 self.experience_descriptions)):
+                    weight = (2 if term in title else 0) + (1 if term in description else 0)
+                    if weight:
+                        postings.append((index, weight))
+            self._term_postings[term] = postings
+        return postings
+    
+    def experience_scores(self, key_terms: Iterable[str]) -> List[int]:
+        """
+        Score every experience against a set of key terms.
+        
+        The score is the sparse dot product of the key terms with each
+        experience's term weights, so the cost grows with the number of
+        term occurrences rather than with terms times experiences.
+        
+        Args:
+            key_terms: Distinct key terms of a job listing
+            
+        Returns:
+            List of scores aligned with the profile's experiences
+        """
+        scores = [0] * len(self.experiences)
+        for term in key_terms:
+            for index, weight in self.term_postings(term):
+                scores[index] += weight
+        return scores
+    
+    def experience_texts(self) -> List[str]:
+        """Get the text each experience is embedded from: its description, or its title if it has none."""
+        return [exp.get("description") or exp.get("title", "") for exp in self.experiences]
+    
+    def experience_vectors(self, model: Any) -> Optional[List[Any]]:
+        """
+        Get the experience embeddings, encoding them on first use.
+        
+        Args:
+            model: SentenceTransformer-compatible model, or None
+            
+        Returns:
+            Embeddings aligned with the profile's experiences, or None if
+            none were given and there is no model to compute them
+        """
+        if self.experience_embeddings is None and model is not None:
+            self.experience_embeddings = EMBEDDING_CACHE.encode_many(model, self.experience_texts())
+        return self.experience_embeddings
+
 
 class CoverLetterGenerator:
     """
     Class for generating personalized cover letters based on user profiles and job listings.
     """
     
-    def __init__(self):
-        """Initialize the cover letter generator."""
-        self.templates = self._load_templates()
+    def __init__(self, locale: Optional[str] = None, deterministic: bool = False,
+                 cache: Optional[LRUCache] = LETTER_CACHE, semantic: bool = False, model: Any = None):
+        """
+        Initialize the cover letter generator.
         
-    def generate_cover_letter(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any]) -> str:
+        Args:
+            locale: Locale of the template pack to use (default: English)
+            deterministic: Seed template choices from the profile, listing and
+                variant, so the same request always produces the same letter
+            cache: Cache of letters rendered in deterministic mode, or None to disable
+            semantic: Rank experiences by embedding similarity to the listing
+                instead of by shared terms
+            model: Embedding model for semantic ranking (default: the job matcher's)
+        """
+        self.locale = locale
+        self.deterministic = deterministic
+        self.cache = cache
+        self.semantic = semantic
+        self._model = model
+    
+    @property
+    def model(self) -> Any:
+        """Embedding model for semantic ranking, or None if none is available."""
+        if self._model is None and self.semantic:
+            try:
+                # Share the job matcher's model, so its cached embeddings are reused
+                from job_matcher import model as matcher_model
+            except ImportError:
+                matcher_model = None
+            self._model = matcher_model
+        return self._model
+    
+    @property
+    def pack(self) -> TemplatePack:
+        """Compiled template pack for the generator's locale."""
+        return TEMPLATE_STORE.get(self.locale)
+    
+    @property
+    def templates(self) -> List[str]:
+        """Cover letter template strings of the current pack."""
+        return self._load_templates()
+    
+    def generate_cover_letter(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any],
+                              context: Optional[ProfileContext] = None, variant: int = 0,
+                              job_embedding: Any = None) -> str:
         """
         Generate a personalized cover letter based on user profile and job listing.
         
+        In deterministic mode the letter depends only on the profile, the listing,
+        the variant, the template pack and the date, and repeated requests are
+        served from the letter cache.
+        
         Args:
             user_profile: User profile data
             job_listing: Job listing data
+            context: Precomputed profile data, reused across listings
+            variant: Selects a different deterministic letter for the same inputs
+            job_embedding: Embedding of the listing for semantic ranking, if already computed
+            
+        Returns:
+            Generated cover letter text
+        """
+        context = context or ProfileContext(user_profile)
+        pack = self.pack
+        date = self._get_current_date(pack)
+        
+        if not self.deterministic:
+            return self._compose_letter(user_profile, job_listing, context, pack, date, random, job_embedding)
+        
+        job_hash = stable_hash(job_listing)
+        cache_key = self._cache_key(context, job_hash, pack, date, variant)
+        if self.cache is not None:
+            cover_letter = self.cache.get(cache_key)
+            if cover_letter is not None:
+                return cover_letter
+        
+        # Seeding from the inputs (not the date or pack) keeps the choices stable across days
+        rng = random.Random(content_hash(LETTER_VERSION, context.profile_hash, job_hash, str(variant)))
+        cover_letter = self._compose_letter(user_profile, job_listing, context, pack, date, rng, job_embedding)
+        
+        if self.cache is not None:
+            self.cache.put(cache_key, cover_letter)
+        
+        return cover_letter
+    
+    def _cache_key(self, context: ProfileContext, job_hash: str, pack: TemplatePack, date: str,
+                   variant: int = 0) -> str:
+        """Get the letter cache key of a deterministic letter."""
+        return content_hash(LETTER_VERSION, pack.locale, str(pack.mtime), date, str(self.semantic),
+                            context.profile_hash, job_hash, str(variant))
+    
+    def _compose_letter(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any], context: ProfileContext,
+                        pack: TemplatePack, date: str, rng: Any, job_embedding: Any = None) -> str:
+        """
+        Write a cover letter, drawing template choices from the given random source.
+        
+        Args:
+            user_profile: User profile data
+            job_listing: Job listing data
+            context: Precomputed profile data
+            pack: Template pack to use
+            date: Formatted letter date
+            rng: random.Random instance, or the random module itself
+            job_embedding: Embedding of the listing for semantic ranking, if already computed
             
         Returns:
             Generated cover letter text
@@ -37,98 +303,99 @@ class CoverLetterGenerator:
         hiring_manager = self._get_hiring_manager(job_listing)
         
         # Select template
-        template = self._select_template(user_profile, job_listing)
+        template = rng.choice(pack["letters"])
         
         # Extract key skills and experiences to highlight
-        skills_to_highlight = self._extract_matching_skills(user_profile, job_listing)
-        experiences_to_highlight = self._extract_relevant_experiences(user_profile, job_listing)
+        skills_to_highlight = self._extract_matching_skills(user_profile, job_listing, context)
+        experiences_to_highlight = self._extract_relevant_experiences(user_profile, job_listing, context, job_embedding)
         
         # Generate paragraphs
-        introduction = self._generate_introduction(user_name, company_name, job_title, hiring_manager)
-        skills_paragraph = self._generate_skills_paragraph(skills_to_highlight)
-        experience_paragraph = self._generate_experience_paragraph(experiences_to_highlight, company_name, job_title)
-        closing = self._generate_closing(company_name)
+        introduction = self._generate_introduction(user_name, company_name, job_title, hiring_manager, pack, rng)
+        skills_paragraph = self._generate_skills_paragraph(skills_to_highlight, pack, rng)
+        experience_paragraph = self._generate_experience_paragraph(
+            experiences_to_highlight, company_name, job_title, pack, rng
+        )
+        closing = self._generate_closing(company_name, pack, rng)
         
         # Assemble cover letter
-        cover_letter = template.format(
-            date=self._get_current_date(),
-            hiring_manager=hiring_manager,
-            company_name=company_name,
-            introduction=introduction,
-            skills_paragraph=skills_paragraph,
-            experience_paragraph=experience_paragraph,
-            closing=closing,
-            user_name=user_name
-        )
+        cover_letter = template.render({
+            "date": date,
+            "hiring_manager": hiring_manager,
+            "company_name": company_name,
+            "introduction": introduction,
+            "skills_paragraph": skills_paragraph,
+            "experience_paragraph": experience_paragraph,
+            "closing": closing,
+            "user_name": user_name
+        })
         
         return cover_letter
     
-    def _load_templates(self) -> List[str]:
-        """
-        Load cover letter templates.
-        
-        Returns:
-            List of template strings
+    def generate_cover_letters(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                               workers: int = 1, chunk_size: int = 8) -> Iterator[Tuple[int, str]]:
         """
-        # In a real implementation, would load from files or database
-        templates = [
-            # Template 1: Standard format
-            """{date}
-
-{hiring_manager}
-{company_name}
-
-Dear {hiring_manager},
-
-{introduction}
-
-{skills_paragraph}
-
-{experience_paragraph}
-
-{closing}
-
-Sincerely,
-
-{user_name}""",
-            
-            # Template 2: Modern format
-            """{date}
-
-{hiring_manager}
-{company_name}
-
-Dear {hiring_manager},
-
-{introduction}
-
-{experience_paragraph}
-
-{skills_paragraph}
-
-{closing}
-
-Best regards,
-
-{user_name}"""
-        ]
+        Generate cover letters for one profile across many job listings.
         
-        return templates
-    
-    def _select_template(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any]) -> str:
-        """
-        Select an appropriate template based on user profile and job listing.
+        Profile-side work is done once (once per worker process when running in
+        parallel). Letters are yielded as soon as they are ready, so with
+        several workers they may arrive out of order. In deterministic mode,
+        cached letters are yielded without rendering, and letters rendered by
+        workers are added to this process's letter cache.
         
         Args:
             user_profile: User profile data
-            job_listing: Job listing data
+            job_listings: Job listings to write letters for
+            workers: Number of worker processes (1 renders in this process)
+            chunk_size: Number of listings sent to a worker at a time
             
         Returns:
-            Selected template string
+            Iterator of (listing index, cover letter) pairs
+        """
+        if workers <= 1:
+            context = ProfileContext(user_profile)
+            for index, job_listing in enumerate(job_listings):
+                yield index, self.generate_cover_letter(user_profile, job_listing, context)
+            return
+        
+        # Serve cached letters here; workers only render the rest
+        indices = list(range(len(job_listings)))
+        cache_keys = {}
+        if self.deterministic and self.cache is not None:
+            context = ProfileContext(user_profile)
+            pack = self.pack
+            date = self._get_current_date(pack)
+            indices = []
+            for index, job_listing in enumerate(job_listings):
+                cache_key = self._cache_key(context, stable_hash(job_listing), pack, date)
+                cover_letter = self.cache.get(cache_key)
+                if cover_letter is not None:
+                    yield index, cover_letter
+                else:
+                    cache_keys[index] = cache_key
+                    indices.append(index)
+            if not indices:
+                return
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_letter_worker,
+                                 initargs=(user_profile, self.locale, self.deterministic, self.semantic)) as executor:
+            futures = []
+            for start in range(0, len(indices), chunk_size):
+                chunk = indices[start:start + chunk_size]
+                futures.append(executor.submit(_generate_letter_chunk, chunk, [job_listings[index] for index in chunk]))
+            for future in as_completed(futures):
+                for index, cover_letter in future.result():
+                    if index in cache_keys:
+                        self.cache.put(cache_keys[index], cover_letter)
+                    yield index, cover_letter
+    
+    def _load_templates(self) -> List[str]:
         """
-        # In a real implementation, would use more sophisticated selection logic
-        # For now, just randomly select a template
-        return random.choice(self.templates)
+        Load cover letter templates.
+        
+        Returns:
+            List of template strings
+        """
+        return [template.source for template in self.pack["letters"]]
     
     def _get_user_name(self, user_profile: Dict[str, Any]) -> str:
         """
@@ -191,28 +458,35 @@ Best regards,
         
         return "Hiring Manager"
     
-    def _get_current_date(self) -> str:
+    def _get_current_date(self, pack: Optional[TemplatePack] = None) -> str:
         """
         Get current date formatted for cover letter.
         
+        Args:
+            pack: Template pack providing the locale's date format
+            
         Returns:
             Formatted date string
         """
-        return datetime.datetime.now().strftime("%B %d, %Y")
+        pack = pack or self.pack
+        return datetime.datetime.now().strftime(pack["date_format"].source)
     
-    def _extract_matching_skills(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_matching_skills(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any],
+                                 context: Optional[ProfileContext] = None) -> List[Dict[str, Any]]:
         """
         Extract skills from user profile that match job requirements.
         
         Args:
             user_profile: User profile data
             job_listing: Job listing data
+            context: Precomputed profile data, reused across listings
             
         Returns:
             List of matching skills
         """
-        user_skills = user_profile.get("skills", [])
-        job_description = job_listing.get("description", "").lower()
+        context = context or ProfileContext(user_profile)
+        user_skills = context.skills
+        job_description = listing_description(job_listing).lower()
         
         # Extract required skills from job description
         required_skills = []
@@ -223,13 +497,12 @@ Best regards,
             skill_section = self._extract_skills_section(job_description)
             if skill_section:
                 # Look for bullet points
-                skills = re.findall(r"[•\-*]\s*([\w\s,/&+#]+)", skill_section)
+                skills = SKILL_BULLET_PATTERN.findall(skill_section)
                 required_skills = [skill.strip().lower() for skill in skills]
         
         # Find matching skills
         matching_skills = []
-        for skill in user_skills:
-            skill_name = skill.get("name", "").lower()
+        for skill, skill_name in zip(user_skills, context.skill_names):
             if not skill_name:
                 continue
                 
@@ -241,15 +514,8 @@ Best regards,
         
         # If we don't have enough matching skills, add some of the user's top skills
         if len(matching_skills) < 3 and len(user_skills) > 0:
-            # Sort by proficiency if available
-            sorted_skills = sorted(
-                user_skills, 
-                key=lambda s: s.get("proficiency", 0) + s.get("years_experience", 0),
-                reverse=True
-            )
-            
-            # Add top skills until we have at least 3 or run out
-            for skill in sorted_skills:
+            # Add top skills (by proficiency if available) until we have at least 3 or run out
+            for skill in context.sorted_skills:
                 if skill not in matching_skills:
                     matching_skills.append(skill)
                     if len(matching_skills) >= 3:
@@ -267,41 +533,33 @@ Best regards,
         Returns:
             Skills section text or None if not found
         """
-        # Common skill section indicators
-        skill_indicators = [
-            r"skills required",
-            r"required skills",
-            r"technical skills",
-            r"qualifications",
-            r"requirements",
-            r"you have",
-            r"you should have",
-            r"what you'll need",
-            r"what we're looking for"
-        ]
-        
-        # Try to find skills section
-        for indicator in skill_indicators:
-            match = re.search(f"{indicator}:?(.*?)(?:\n\n|\Z)", job_description, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1)
-        
-        return None
+        return tokenize_job_description(job_description).section_text("requirements")
     
-    def _extract_relevant_experiences(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _extract_relevant_experiences(self, user_profile: Dict[str, Any], job_listing: Dict[str, Any],
+                                      context: Optional[ProfileContext] = None,
+                                      job_embedding: Any = None) -> List[Dict[str, Any]]:
         """
         Extract experiences from user profile that are relevant to the job.
         
         Args:
             user_profile: User profile data
             job_listing: Job listing data
+            context: Precomputed profile data, reused across listings
+            job_embedding: Embedding of the listing for semantic ranking, if already computed
             
         Returns:
             List of relevant experiences
         """
-        experiences = user_profile.get("experience", [])
+        context = context or ProfileContext(user_profile)
+        experiences = context.experiences
+        
+        if self.semantic:
+            relevant_experiences = self._rank_experiences_semantically(job_listing, context, job_embedding)
+            if relevant_experiences is not None:
+                return relevant_experiences
+        
         job_title = job_listing.get("title", "").lower()
-        job_description = job_listing.get("description", "").lower()
+        job_description = listing_description(job_listing).lower()
         
         # Extract key terms from job title and description
         key_terms = set()
@@ -312,25 +570,9 @@ Best regards,
         # Add key terms from description
         key_terms.update(self._extract_key_terms(job_description))
         
-        # Score experiences based on relevance
-        scored_experiences = []
-        for exp in experiences:
-            score = 0
-            exp_title = exp.get("title", "").lower()
-            exp_description = exp.get("description", "").lower()
-            
-            # Check title relevance
-            for term in key_terms:
-                if term in exp_title:
-                    score += 2
-            
-            # Check description relevance
-            for term in key_terms:
-                if term in exp_description:
-                    score += 1
-            
-            # Add to scored experiences
-            scored_experiences.append((score, exp))
+        # Score experiences based on relevance (2 per term in the title, 1 per
+        # term in the description)
+        scored_experiences = list(zip(context.experience_scores(key_terms), experiences))
         
         # Sort by score (descending) and take top 2
         scored_experiences.sort(reverse=True, key=lambda x: x[0])
@@ -338,6 +580,49 @@ Best regards,
         
         return relevant_experiences
     
+    def _rank_experiences_semantically(self, job_listing: Dict[str, Any], context: ProfileContext,
+                                       job_embedding: Any = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pick the two experiences whose embeddings are most similar to the listing's.
+        
+        Embeddings come from the arguments when given, otherwise from the shared
+        embedding cache, so listings already scored by the job matcher are not
+        encoded again.
+        
+        Args:
+            job_listing: Job listing data
+            context: Precomputed profile data
+            job_embedding: Embedding of the listing, if already computed
+            
+        Returns:
+            List of relevant experiences, or None if embeddings are unavailable
+        """
+        if not context.experiences:
+            return []
+        
+        model = self.model
+        if job_embedding is None:
+            if model is None:
+                return None
+            from job_matcher import build_job_text
+            job_embedding = EMBEDDING_CACHE.encode_document(model, build_job_text(job_listing))
+        
+        vectors = context.experience_vectors(model)
+        if vectors is None:
+            return None
+        
+        import numpy as np
+        
+        # Cosine similarity of every experience with the listing
+        matrix = np.asarray(vectors, dtype=np.float32)
+        job_vector = np.asarray(job_embedding, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(job_vector)
+        similarities = (matrix @ job_vector) / np.where(norms > 0, norms, 1.0)
+        
+        # Stable sort (descending), like the term-based ranking
+        order = sorted(range(len(context.experiences)), key=lambda index: similarities[index], reverse=True)
+        return [context.experiences[index] for index in order[:2]]
+    
     def _extract_key_terms(self, text: str) -> List[str]:
         """
         Extract key terms from text.
@@ -350,25 +635,10 @@ Best regards,
         """
         # In a real implementation, would use more sophisticated NLP techniques
         # For now, just extract common job-related terms
-        
-        # Common job-related terms
-        job_terms = [
-            "develop", "design", "implement", "manage", "lead", "create",
-            "analyze", "research", "coordinate", "organize", "plan",
-            "software", "application", "system", "database", "network",
-            "project", "team", "client", "customer", "user",
-            "experience", "skill", "knowledge", "ability", "proficiency"
-        ]
-        
-        # Extract terms that appear in the text
-        key_terms = []
-        for term in job_terms:
-            if term in text:
-                key_terms.append(term)
-        
-        return key_terms
+        return [term for term in JOB_TERMS if term in text]
     
-    def _generate_introduction(self, user_name: str, company_name: str, job_title: str, hiring_manager: str) -> str:
+    def _generate_introduction(self, user_name: str, company_name: str, job_title: str, hiring_manager: str,
+                               pack: Optional[TemplatePack] = None, rng: Any = random) -> str:
         """
         Generate introduction paragraph.
         
@@ -377,56 +647,47 @@ Best regards,
             company_name: Company name
             job_title: Job title
             hiring_manager: Hiring manager name
+            pack: Template pack to use (default: the generator's pack)
+            rng: Random source for template choices (default: the random module)
             
         Returns:
             Introduction paragraph
         """
-        # Introduction templates
-        templates = [
-            "I am writing to express my interest in the {job_title} position at {company_name}. With my background and experience, I believe I would be a valuable addition to your team.",
-            
-            "I was excited to see your posting for the {job_title} role at {company_name}. After reviewing the job description, I am confident that my skills and experiences align well with your requirements.",
-            
-            "I am enthusiastic about the opportunity to apply for the {job_title} position at {company_name}. My professional background and skill set make me an ideal candidate for this role."
-        ]
+        pack = pack or self.pack
         
         # Select random template
-        template = random.choice(templates)
+        template = rng.choice(pack["introduction"])
         
         # Format template
-        introduction = template.format(
-            job_title=job_title,
-            company_name=company_name
-        )
+        introduction = template.render({
+            "job_title": job_title,
+            "company_name": company_name
+        })
         
         return introduction
     
-    def _generate_skills_paragraph(self, skills: List[Dict[str, Any]]) -> str:
+    def _generate_skills_paragraph(self, skills: List[Dict[str, Any]], pack: Optional[TemplatePack] = None,
+                                   rng: Any = random) -> str:
         """
         Generate skills paragraph.
         
         Args:
             skills: List of skills to highlight
+            pack: Template pack to use (default: the generator's pack)
+            rng: Random source for template choices (default: the random module)
             
         Returns:
             Skills paragraph
         """
+        pack = pack or self.pack
+        
         if not skills:
-            return "I have a diverse skill set that would be valuable in this role, including strong communication, problem-solving, and analytical abilities."
+            return pack["default_skills_paragraph"].render({})
         
         # Extract skill names
         skill_names = [skill.get("name", "") for skill in skills]
         skill_names = [name for name in skill_names if name]
         
-        # Skills paragraph templates
-        templates = [
-            "My expertise includes {skill_list}, which I believe are essential for success in this role. I am constantly expanding my knowledge and staying current with industry developments.",
-            
-            "I bring a strong set of technical skills to this role, including {skill_list}. These skills have allowed me to successfully deliver projects and solve complex problems throughout my career.",
-            
-            "Throughout my career, I have developed proficiency in {skill_list}. I am confident these skills would enable me to make significant contributions to your team."
-        ]
-        
         # Format skill list
         if len(skill_names) == 1:
             skill_list = skill_names[0]
@@ -436,14 +697,15 @@ Best regards,
             skill_list = ", ".join(skill_names[:-1]) + f", and {skill_names[-1]}"
         
         # Select random template
-        template = random.choice(templates)
+        template = rng.choice(pack["skills_paragraph"])
         
         # Format template
-        skills_paragraph = template.format(skill_list=skill_list)
+        skills_paragraph = template.render({"skill_list": skill_list})
         
         return skills_paragraph
     
-    def _generate_experience_paragraph(self, experiences: List[Dict[str, Any]], company_name: str, job_title: str) -> str:
+    def _generate_experience_paragraph(self, experiences: List[Dict[str, Any]], company_name: str, job_title: str,
+                                       pack: Optional[TemplatePack] = None, rng: Any = random) -> str:
         """
         Generate experience paragraph.
         
@@ -451,136 +713,201 @@ Best regards,
             experiences: List of experiences to highlight
             company_name: Company name
             job_title: Job title
+            pack: Template pack to use (default: the generator's pack)
+            rng: Random source for template choices (default: the random module)
             
         Returns:
             Experience paragraph
         """
+        pack = pack or self.pack
+        
         if not experiences:
-            return f"My professional experience has prepared me well for the {job_title} role at {company_name}. I have consistently demonstrated the ability to deliver results, work effectively in team environments, and adapt to new challenges."
+            return pack["default_experience_paragraph"].render({
+                "job_title": job_title,
+                "company_name": company_name
+            })
         
         # Extract company and title from most relevant experience
         most_relevant = experiences[0]
         exp_company = most_relevant.get("company", "")
         exp_title = most_relevant.get("title", "")
         
-        # Experience paragraph templates
-        templates = [
-            "In my role as {exp_title} at {exp_company}, I gained valuable experience that directly relates to the {job_title} position. {achievement} I am excited about the opportunity to bring these skills and experiences to {company_name}.",
-            
-            "My experience as {exp_title} at {exp_company} has prepared me well for this role. {achievement} I believe these experiences have positioned me to make immediate contributions at {company_name}.",
-            
-            "While working as {exp_title} at {exp_company}, I developed skills that align perfectly with the {job_title} role. {achievement} I am confident that my background would be an asset to your team at {company_name}."
-        ]
-        
         # Generate achievement statement
-        achievement = self._generate_achievement_statement(most_relevant)
+        achievement = self._generate_achievement_statement(most_relevant, pack, rng)
         
         # Select random template
-        template = random.choice(templates)
+        template = rng.choice(pack["experience_paragraph"])
         
         # Format template
-        experience_paragraph = template.format(
-            exp_title=exp_title,
-            exp_company=exp_company,
-            job_title=job_title,
-            company_name=company_name,
-            achievement=achievement
-        )
+        experience_paragraph = template.render({
+            "exp_title": exp_title,
+            "exp_company": exp_company,
+            "job_title": job_title,
+            "company_name": company_name,
+            "achievement": achievement
+        })
         
         return experience_paragraph
     
-    def _generate_achievement_statement(self, experience: Dict[str, Any]) -> str:
+    def _generate_achievement_statement(self, experience: Dict[str, Any], pack: Optional[TemplatePack] = None,
+                                        rng: Any = random) -> str:
         """
         Generate achievement statement from experience.
         
         Args:
             experience: Experience data
+            pack: Template pack to use (default: the generator's pack)
+            rng: Random source for template choices (default: the random module)
             
         Returns:
             Achievement statement
         """
+        pack = pack or self.pack
         description = experience.get("description", "")
         
         # If no description, use generic achievement
         if not description:
-            generic_achievements = [
-                "I successfully managed multiple projects simultaneously while meeting all deadlines and quality standards.",
-                "I collaborated effectively with cross-functional teams to deliver successful outcomes.",
-                "I implemented process improvements that increased efficiency and productivity."
-            ]
-            return random.choice(generic_achievements)
+            return rng.choice(pack["generic_achievements"]).render({})
         
         # Try to extract achievement from description
-        # Look for sentences with metrics or accomplishments
-        achievement_indicators = [
-            r"increased", r"decreased", r"improved", r"reduced", r"achieved",
-            r"developed", r"implemented", r"created", r"launched", r"led",
-            r"managed", r"coordinated", r"designed", r"\d+%", r"\$\d+"
-        ]
-        
-        # Split description into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', description)
-        
-        # Look for sentences with achievement indicators
-        achievement_sentences = []
-        for sentence in sentences:
-            for indicator in achievement_indicators:
-                if re.search(indicator, sentence, re.IGNORECASE):
-                    achievement_sentences.append(sentence)
-                    break
-        
-        # If found, use the first achievement sentence
-        if achievement_sentences:
-            return achievement_sentences[0]
+        # Look for the first sentence with metrics or accomplishments. No
+        # indicator spans whitespace, so the first indicator in the whole
+        # description lies in that sentence.
+        indicator = ACHIEVEMENT_INDICATOR.search(description)
+        if indicator:
+            return self._sentence_at(description, indicator.start())
         
         # If no specific achievement found, use the first sentence of the description
+        sentences = SENTENCE_SPLIT_PATTERN.split(description, maxsplit=1)
         if sentences:
             return sentences[0]
         
         # Fallback to generic achievement
-        return "I consistently delivered high-quality results and contributed to the team's success."
+        return pack["default_achievement"].render({})
+    
+    def _sentence_at(self, text: str, position: int) -> str:
+        """
+        Get the sentence of a text that contains a position.
+        
+        Args:
+            text: Input text
+            position: Character offset outside the whitespace between sentences
+            
+        Returns:
+            Sentence text
+        """
+        start = 0
+        end = len(text)
+        for boundary in SENTENCE_SPLIT_PATTERN.finditer(text):
+            if boundary.start() > position:
+                end = boundary.start()
+                break
+            start = boundary.end()
+        return text[start:end]
     
-    def _generate_closing(self, company_name: str) -> str:
+    def _generate_closing(self, company_name: str, pack: Optional[TemplatePack] = None, rng: Any = random) -> str:
         """
         Generate closing paragraph.
         
         Args:
             company_name: Company name
+            pack: Template pack to use (default: the generator's pack)
+            rng: Random source for template choices (default: the random module)
             
         Returns:
             Closing paragraph
         """
-        # Closing templates
-        templates = [
-            "I am excited about the opportunity to join {company_name} and would welcome the chance to discuss how my background and skills would be a good match for this position. Thank you for your time and consideration.",
-            
-            "I am eager to bring my skills and experiences to {company_name} and would appreciate the opportunity to discuss my application with you further. Thank you for considering my application.",
-            
-            "I am enthusiastic about the possibility of joining the team at {company_name} and contributing to your continued success. I look forward to the opportunity to discuss my qualifications in more detail. Thank you for your consideration."
-        ]
+        pack = pack or self.pack
         
         # Select random template
-        template = random.choice(templates)
+        template = rng.choice(pack["closing"])
         
         # Format template
-        closing = template.format(company_name=company_name)
+        closing = template.render({"company_name": company_name})
         
         return closing
 
 
-def generate_cover_letter(user_profile: Dict[str, Any], job_listing: Dict[str, Any]) -> str:
+def generate_cover_letter(user_profile: Dict[str, Any], job_listing: Dict[str, Any],
+                          deterministic: bool = False, variant: int = 0, semantic: bool = False) -> str:
     """
     Generate a personalized cover letter based on user profile and job listing.
     
     Args:
         user_profile: User profile data
         job_listing: Job listing data
+        deterministic: Produce (and cache) the same letter for the same inputs
+        variant: Selects a different deterministic letter for the same inputs
+        semantic: Rank experiences by embedding similarity to the listing
         
     Returns:
         Generated cover letter text
     """
-    generator = CoverLetterGenerator()
-    return generator.generate_cover_letter(user_profile, job_listing)
+    generator = CoverLetterGenerator(deterministic=deterministic, semantic=semantic)
+    return generator.generate_cover_letter(user_profile, job_listing, variant=variant)
+
+
+def generate_cover_letter_json(user_profile_json: JsonInput, job_listing_json: JsonInput,
+                               deterministic: bool = False, variant: int = 0, semantic: bool = False) -> bytes:
+    """
+    Generate a cover letter for a user profile and job listing given as JSON.
+    
+    Args:
+        user_profile_json: User profile as JSON text or bytes
+        job_listing_json: Job listing as JSON text or bytes
+        deterministic: Produce (and cache) the same letter for the same inputs
+        variant: Selects a different deterministic letter for the same inputs
+        semantic: Rank experiences by embedding similarity to the listing
+        
+    Returns:
+        Cover letter text as UTF-8 bytes
+    """
+    letter = generate_cover_letter(
+        loads(user_profile_json), loads(job_listing_json),
+        deterministic=deterministic, variant=variant, semantic=semantic
+    )
+    return letter.encode("utf-8")
+
+
+def generate_cover_letters(user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                           workers: int = 1, deterministic: bool = False,
+                           semantic: bool = False) -> Iterator[Tuple[int, str]]:
+    """
+    Generate cover letters for one profile across many job listings.
+    
+    Args:
+        user_profile: User profile data
+        job_listings: Job listings to write letters for
+        workers: Number of worker processes
+        deterministic: Produce (and cache) the same letter for the same inputs
+        semantic: Rank experiences by embedding similarity to the listing
+        
+    Returns:
+        Iterator of (listing index, cover letter) pairs, in completion order
+    """
+    generator = CoverLetterGenerator(deterministic=deterministic, semantic=semantic)
+    return generator.generate_cover_letters(user_profile, job_listings, workers)
+
+
+# Per-process state for parallel letter generation
+_worker_generator = None
+_worker_context = None
+
+
+def _init_letter_worker(user_profile: Dict[str, Any], locale: Optional[str], deterministic: bool, semantic: bool):
+    """Precompute the profile side once in each worker process."""
+    global _worker_generator, _worker_context
+    _worker_generator = CoverLetterGenerator(locale, deterministic, semantic=semantic)
+    _worker_context = ProfileContext(user_profile)
+
+
+def _generate_letter_chunk(indices: List[int], job_listings: List[Dict[str, Any]]) -> List[Tuple[int, str]]:
+    """Generate letters for a chunk of listings in a worker process."""
+    user_profile = _worker_context.user_profile
+    return [
+        (index, _worker_generator.generate_cover_letter(user_profile, job_listing, _worker_context))
+        for index, job_listing in zip(indices, job_listings)
+    ]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,232 @@
+"""
+Education Taxonomy for Personal Job Agent
+
+This module compiles the degree and field-of-study vocabulary once at import
+time. Degree aliases are looked up word by word in a dictionary, fields of
+study are found in one Aho-Corasick pass over the text, and every degree class
+has a precomputed level, so comparing degrees is an integer comparison.
+
+Degree aliases match whole words; dotted aliases ("b.s", "ph.d") match two
+words joined by a dot. Fields of study match anywhere in the text, including
+inside longer words. Job descriptions are read as the matcher always read them:
+degree aliases match in any case, fields of study only in lowercase unless they
+are inside a "degree in ..." or "... background" phrase, and the abbreviations
+added for degree names (BSc, MSc, MEng, MBA, Doctor) are not looked for.
+
+pyahocorasick is used for the field scan when it is installed; otherwise each
+field is searched for with str.find.
+"""
+
+from typing import Dict, Any, List, Tuple
+
+from regex_registry import registry, FIELD_OF_STUDY_PATTERNS
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Degree classes and their lowercase aliases. When a job description mentions
+# several classes, the requirement is the first class in this order.
+DEGREE_ALIASES = {
+    "bachelor": ["bachelor", "bachelors", "ba", "bs", "b.a", "b.s", "undergraduate"],
+    "master": ["master", "masters", "ma", "ms", "m.a", "m.s", "graduate"],
+    "phd": ["phd", "ph.d", "doctorate", "doctoral"],
+    "associate": ["associate", "associates", "a.a", "a.s"]
+}
+
+# Further aliases of degree names (from profiles), too ambiguous in job descriptions
+DEGREE_NAME_EXTRA_ALIASES = {
+    "bachelor": ["bsc", "b.sc", "beng", "b.eng"],
+    "master": ["msc", "m.sc", "meng", "m.eng", "mba"],
+    "phd": ["doctor"]
+}
+
+DEGREE_LEVELS = {
+    "": 0,
+    "associate": 1,
+    "bachelor": 2,
+    "master": 3,
+    "phd": 4
+}
+
+DEGREE_BY_ALIAS = {alias: degree for degree, aliases in DEGREE_ALIASES.items() for alias in aliases}
+
+DEGREE_NAME_ALIASES = dict(
+    DEGREE_BY_ALIAS,
+    **{alias: degree for degree, aliases in DEGREE_NAME_EXTRA_ALIASES.items() for alias in aliases}
+)
+
+DEGREE_PRIORITY = {degree: index for index, degree in enumerate(DEGREE_ALIASES)}
+
+# Common fields of study, in the order ties are resolved in
+FIELDS_OF_STUDY = [
+    "computer science", "information technology", "software engineering",
+    "data science", "mathematics", "statistics", "business",
+    "engineering", "economics", "finance", "accounting",
+    "marketing", "psychology", "biology", "chemistry", "physics"
+]
+
+# Words, keeping dotted abbreviations such as "ph.d" together
+WORD = registry.compile("education.word", r"\w+(?:\.\w+)*")
+
+
+def _degree_mentions(text: str, aliases: Dict[str, str] = DEGREE_BY_ALIAS) -> List[str]:
+    """Get the degree class of every degree alias in a lowercase text, in order."""
+    mentions = []
+    for word in WORD.findall(text):
+        degree = aliases.get(word)
+        if degree:
+            mentions.append(degree)
+        elif "." in word:
+            # A dotted run such as "b.s.c" contains the aliases of its parts and adjacent pairs
+            parts = word.split(".")
+            for candidate in parts + [first + "." + second for first, second in zip(parts, parts[1:])]:
+                degree = aliases.get(candidate)
+                if degree:
+                    mentions.append(degree)
+    return mentions
+
+
+def degree_class(degree_name: str) -> str:
+    """
+    Classify a degree name.
+    
+    Args:
+        degree_name: Degree as written, e.g. "Master of Science" or "B.S."
+    
+    Returns:
+        Highest degree class the name mentions (empty string if none)
+    """
+    mentions = _degree_mentions(degree_name.lower(), DEGREE_NAME_ALIASES)
+    return max(mentions, key=DEGREE_LEVELS.__getitem__) if mentions else ""
+
+
+def highest_degree(education: List[Dict[str, Any]]) -> str:
+    """
+    Get the highest degree class of a profile's education entries.
+    
+    Args:
+        education: Education entries with a "degree" name
+    
+    Returns:
+        Highest degree class (empty string if none is recognized)
+    """
+    degrees = [degree_class(entry.get("degree") or "") for entry in education]
+    return max(degrees, key=DEGREE_LEVELS.__getitem__, default="")
+
+
+def degree_required(description: str) -> str:
+    """
+    Get the degree a job description asks for.
+    
+    Args:
+        description: Job description text
+    
+    Returns:
+        First degree class in DEGREE_ALIASES order that the description
+        mentions (empty string if none)
+    """
+    mentions = set(_degree_mentions(description.lower()))
+    return min(mentions, key=DEGREE_PRIORITY.__getitem__) if mentions else ""
+
+
+def is_degree_sufficient(user_degree: str, required_degree: str) -> bool:
+    """
+    Check whether a degree class meets a required one.
+    
+    Args:
+        user_degree: User's highest degree class
+        required_degree: Required degree class
+    
+    Returns:
+        True if the user's degree is at least the required level
+    """
+    return DEGREE_LEVELS.get(user_degree, 0) >= DEGREE_LEVELS.get(required_degree, 0)
+
+
+class FieldMatcher:
+    """
+    Finds every occurrence of a fixed list of phrases in one pass.
+    """
+    
+    def __init__(self, fields: List[str]):
+        """
+        Build the matcher.
+        
+        Args:
+            fields: Lowercase phrases, in priority order
+        """
+        self.fields = list(fields)
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for index, field in enumerate(self.fields):
+                self.automaton.add_word(field, index)
+            self.automaton.make_automaton()
+    
+    def occurrences(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find every occurrence of every field, overlapping ones included.
+        
+        Args:
+            text: Lowercase text
+        
+        Returns:
+            List of (start, end, field index) triples
+        """
+        if self.automaton is not None:
+            return [
+                (end + 1 - len(self.fields[index]), end + 1, index)
+                for end, index in self.automaton.iter(text)
+            ]
+        
+        found = []
+        for index, field in enumerate(self.fields):
+            start = text.find(field)
+            while start != -1:
+                found.append((start, start + len(field), index))
+                start = text.find(field, start + 1)
+        return found
+
+
+FIELD_MATCHER = FieldMatcher(FIELDS_OF_STUDY)
+
+
+def field_required(description: str) -> str:
+    """
+    Get the field of study a job description asks for.
+    
+    A field inside a "degree in ..." or "... background" phrase, in any
+    case, wins; otherwise the first field in FIELDS_OF_STUDY order that the
+    description mentions in lowercase does.
+    
+    Args:
+        description: Job description text
+    
+    Returns:
+        Field of study (empty string if none is mentioned)
+    """
+    lowered = description.lower()
+    occurrences = FIELD_MATCHER.occurrences(lowered)
+    if not occurrences:
+        return ""
+    
+    present = {index for _, _, index in occurrences}
+    if lowered == description:
+        written = present
+    else:
+        written = {index for _, _, index in FIELD_MATCHER.occurrences(description)}
+    
+    if len(present) > 1 or written != present:
+        # The phrase patterns only matter when they can pick another field than the plain search
+        for pattern in FIELD_OF_STUDY_PATTERNS:
+            match = pattern.search(lowered)
+            if match:
+                start, end = match.span(1)
+                inside = [index for first, last, index in occurrences if start <= first and last <= end]
+                if inside:
+                    return FIELDS_OF_STUDY[min(inside)]
+    
+    return FIELDS_OF_STUDY[min(written)] if written else ""
@@ -0,0 +1,364 @@
+"""
+Embedding Cache for Personal Job Agent
+
+This module provides a process-wide cache of sentence embeddings, so a text
+encoded by one script (e.g. a job description during matching) is not encoded
+again by another (e.g. when ranking experiences for a cover letter).
+
+The cache is safe to share between threads. Tokenizers cannot be used by
+several threads at once, so each model is called under its own lock, unless it
+provides a tokenizer_lock: such models (see inference_backend) only lock while
+tokenizing and run their forward pass, with the GIL released, in parallel.
+Callers that need many embeddings should request them in one encode_many batch
+so the model runs in one long stretch.
+
+Documents longer than the model's input (which the model would silently
+truncate) are split into token-bounded chunks at paragraph boundaries, and the
+chunk embeddings are averaged, weighted by their token counts. Only the first
+MAX_DOCUMENT_CHUNKS chunks of a document are pooled; the rest are dropped, and
+stats() counts the truncated documents and dropped chunks. Chunks are cached
+like any other text, so a paragraph shared by many documents (e.g. a company's
+boilerplate) is encoded once.
+"""
+
+import threading
+from typing import Dict, Any, List, Iterable, Callable, Optional, Tuple
+
+import numpy as np
+
+from result_cache import LRUCache, content_hash
+
+
+# Token budget of a chunk when the model does not report its input length
+DEFAULT_CHUNK_TOKENS = 256
+
+# Room left in the model input for its special tokens
+SPECIAL_TOKENS = 2
+
+# Longer documents are pooled over their first chunks only
+MAX_DOCUMENT_CHUNKS = 32
+
+
+def token_counter(model: Any) -> Callable[[List[str]], List[int]]:
+    """
+    Get a function counting the tokens of texts as the model sees them.
+    
+    Args:
+        model: SentenceTransformer-compatible model
+        
+    Returns:
+        Function mapping a list of texts to their token counts (words if
+        the model has no tokenizer)
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if not callable(tokenizer):
+        return lambda texts: [len(text.split()) for text in texts]
+    
+    def count_tokens(texts: List[str]) -> List[int]:
+        encoded = tokenizer(texts, add_special_tokens=False, verbose=False)
+        return [len(ids) for ids in encoded["input_ids"]]
+    
+    return count_tokens
+
+
+def chunk_tokens(model: Any) -> int:
+    """
+    Get the token budget of a chunk for a model.
+    
+    Args:
+        model: SentenceTransformer-compatible model
+        
+    Returns:
+        Maximum number of tokens per chunk
+    """
+    get_max_seq_length = getattr(model, "get_max_seq_length", None)
+    max_seq_length = get_max_seq_length() if callable(get_max_seq_length) else None
+    return max((max_seq_length or DEFAULT_CHUNK_TOKENS) - SPECIAL_TOKENS, 1)
+
+
+def chunk_text(text: str, max_tokens: int,
+               count_tokens: Callable[[List[str]], List[int]]) -> List[Tuple[str, float]]:
+    """
+    Split a text into chunks of at most max_tokens tokens.
+    
+    A text that fits is a single chunk. Otherwise each paragraph is a chunk,
+    and paragraphs that do not fit are cut into word windows sized from their
+    token count.
+    
+    Args:
+        text: Text to split
+        max_tokens: Token budget of a chunk
+        count_tokens: Token counting function (see token_counter)
+        
+    Returns:
+        List of (chunk, token count) pairs
+    """
+    # Every token covers at least one character
+    if len(text) <= max_tokens:
+        return [(text, len(text))]
+    
+    paragraphs = [paragraph.strip() for paragraph in text.split("\n\n")]
+    paragraphs = [paragraph for paragraph in paragraphs if paragraph]
+    counts = count_tokens(paragraphs) if paragraphs else []
+    if sum(counts) <= max_tokens:
+        return [(text, sum(counts))]
+    
+    chunks = []
+    for paragraph, count in zip(paragraphs, counts):
+        if count <= max_tokens:
+            chunks.append((paragraph, count))
+            continue
+        
+        words = paragraph.split()
+        window = max(len(words) * max_tokens // count, 1)
+        for start in range(0, len(words), window):
+            window_words = words[start:start + window]
+            chunks.append((" ".join(window_words), count * len(window_words) / len(words)))
+    
+    return chunks
+
+
+class EmbeddingCache:
+    """
+    In-memory cache of embeddings keyed by model and text.
+    
+    Cached vectors are marked read-only because they are shared by every caller.
+    Threads that miss the same text at the same time may both encode it.
+    
+    Vectors are keyed by the model's identity (see inference_backend), so
+    models loaded with the same backend and weights share them. A model without
+    an identity is keyed by its type and object id, and the cache keeps a
+    reference to it until clear() so that id is not reused by another model
+    while its vectors are cached.
+    """
+    
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of vectors kept in memory
+        """
+        self.vectors = LRUCache(max_entries)
+        self.model_locks = {}
+        self.model_locks_lock = threading.Lock()
+        self.anonymous_models = {}
+        self.truncated_documents = 0
+        self.dropped_chunks = 0
+        self.counts_lock = threading.Lock()
+    
+    def model_lock(self, model: Any) -> threading.Lock:
+        """
+        Get the lock that guards a model's tokenizer.
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            
+        Returns:
+            The model's tokenizer_lock, or a lock held around every call of a
+            model without one
+        """
+        lock = getattr(model, "tokenizer_lock", None)
+        if lock is None:
+            with self.model_locks_lock:
+                lock = self.model_locks.setdefault(id(model), threading.Lock())
+        return lock
+    
+    def _run_model(self, model: Any, texts: Any) -> Any:
+        """Encode with a model, holding its lock unless it only needs it for tokenizing."""
+        if getattr(model, "tokenizer_lock", None) is not None:
+            return model.encode(texts)
+        with self.model_lock(model):
+            return model.encode(texts)
+    
+    def model_key(self, model: Any) -> str:
+        """
+        Get the key identifying a model's vectors.
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            
+        Returns:
+            The model's identity (as from inference_backend.model_identity), or
+            its type and object id if it has none
+        """
+        identity = getattr(model, "identity", None)
+        if identity:
+            return identity
+        with self.model_locks_lock:
+            self.anonymous_models.setdefault(id(model), model)
+        return f"{type(model).__name__}:{id(model)}"
+    
+    def _key(self, model: Any, text: str) -> str:
+        """Get the cache key of a text encoded by a model."""
+        return content_hash(self.model_key(model), text)
+    
+    def _document_key(self, model: Any, text: str) -> str:
+        """Get the cache key of a document's pooled embedding."""
+        return content_hash(self.model_key(model), "document", text)
+    
+    def _store(self, key: str, vector: Any) -> Any:
+        """Freeze and cache a vector."""
+        if hasattr(vector, "setflags"):
+            vector.setflags(write=False)
+        self.vectors.put(key, vector)
+        return vector
+    
+    def encode(self, model: Any, text: str) -> Any:
+        """
+        Get the embedding of a text, encoding it only on a cache miss.
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            text: Text to encode
+        
+        Returns:
+            Embedding vector
+        """
+        key = self._key(model, text)
+        vector = self.vectors.get(key)
+        if vector is None:
+            vector = self._store(key, self._run_model(model, text))
+        return vector
+    
+    def encode_many(self, model: Any, texts: Iterable[str]) -> List[Any]:
+        """
+        Get the embeddings of several texts, encoding the misses in one batch.
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            texts: Texts to encode
+        
+        Returns:
+            Embedding vectors aligned with texts
+        """
+        texts = list(texts)
+        keys = [self._key(model, text) for text in texts]
+        vectors = [self.vectors.get(key) for key in keys]
+        
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing:
+            # Encode repeated texts once
+            unique = {}
+            for index in missing:
+                unique.setdefault(keys[index], index)
+            encoded = self._run_model(model, [texts[index] for index in unique.values()])
+            encoded_by_key = {key: self._store(key, vector) for key, vector in zip(unique, encoded)}
+            for index in missing:
+                vectors[index] = encoded_by_key[keys[index]]
+        
+        return vectors
+    
+    def encode_documents(self, model: Any, texts: Iterable[str],
+                         max_tokens: Optional[int] = None) -> List[Any]:
+        """
+        Get the pooled embeddings of several documents.
+        
+        The chunks of all uncached documents are encoded in one batch; a
+        document that fits the model input gets the same embedding as encode.
+        Chunks after the first MAX_DOCUMENT_CHUNKS of a document are dropped.
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            texts: Documents to encode
+            max_tokens: Token budget of a chunk (default: from the model's input length)
+            
+        Returns:
+            Embedding vectors aligned with texts
+        """
+        texts = list(texts)
+        keys = [self._document_key(model, text) for text in texts]
+        vectors = [self.vectors.get(key) for key in keys]
+        
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if not missing:
+            return vectors
+        
+        max_tokens = max_tokens or chunk_tokens(model)
+        count_tokens = token_counter(model)
+        with self.model_lock(model):
+            chunked = [chunk_text(texts[index], max_tokens, count_tokens) for index in missing]
+        
+        dropped = [len(chunks) - MAX_DOCUMENT_CHUNKS for chunks in chunked if len(chunks) > MAX_DOCUMENT_CHUNKS]
+        if dropped:
+            with self.counts_lock:
+                self.truncated_documents += len(dropped)
+                self.dropped_chunks += sum(dropped)
+            chunked = [chunks[:MAX_DOCUMENT_CHUNKS] for chunks in chunked]
+        
+        chunk_vectors = self.encode_many(model, [chunk for chunks in chunked for chunk, _ in chunks])
+        position = 0
+        for index, chunks in zip(missing, chunked):
+            document_vectors = chunk_vectors[position:position + len(chunks)]
+            position += len(chunks)
+            if len(chunks) == 1:
+                vector = document_vectors[0]
+            else:
+                pooled = np.average(np.stack(document_vectors), axis=0, weights=[count for _, count in chunks])
+                vector = pooled.astype(document_vectors[0].dtype)
+            vectors[index] = self._store(keys[index], vector)
+        
+        return vectors
+    
+    def encode_document(self, model: Any, text: str) -> Any:
+        """
+        Get the pooled embedding of a document (see encode_documents).
+        
+        Args:
+            model: SentenceTransformer-compatible model
+            text: Document to encode
+            
+        Returns:
+            Embedding vector
+        """
+        vector = self.vectors.get(self._document_key(model, text))
+        if vector is None:
+            vector = self.encode_documents(model, [text])[0]
+        return vector
+    
+    def put_document(self, model: Any, text: str, vector: Any):
+        """
+        Register a document embedding computed elsewhere.
+        
+        Args:
+            model: Model that produced the vector
+            text: Encoded document
+            vector: Pooled embedding vector
+        """
+        self._store(self._document_key(model, text), vector)
+    
+    def put(self, model: Any, text: str, vector: Any):
+        """
+        Register an embedding computed elsewhere.
+        
+        Args:
+            model: Model that produced the vector
+            text: Encoded text
+            vector: Embedding vector
+        """
+        self._store(self._key(model, text), vector)
+    
+    def clear(self):
+        """Remove all vectors."""
+        self.vectors.clear()
+        with self.model_locks_lock:
+            self.anonymous_models.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entries, hits, misses, and the number of documents
+            pooled over their first MAX_DOCUMENT_CHUNKS chunks and of chunks
+            they dropped
+        """
+        stats = self.vectors.stats()
+        with self.counts_lock:
+            stats["truncated_documents"] = self.truncated_documents
+            stats["dropped_chunks"] = self.dropped_chunks
+        return stats
+
+
+# Embeddings shared by all scripts in the process
+EMBEDDING_CACHE = EmbeddingCache()
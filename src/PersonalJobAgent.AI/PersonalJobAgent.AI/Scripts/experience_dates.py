@@ -0,0 +1,222 @@
+"""
+Experience Dates for Personal Job Agent
+
+This module turns the date strings of experience entries ("Jan 2020",
+"2019-03", "2018", "Present") into month-precision intervals, and computes
+total experience by merging overlapping intervals, so concurrent roles are not
+counted twice. Parsed date strings are memoized, and the experience summary of
+a profile is cached by content, so a profile's dates are parsed once however
+many listings it is matched against.
+
+Months are counted as year * 12 + month - 1. Intervals are half-open: an end
+date with a month includes that month, a year-only end date ends at the start
+of that year (so "2018 - 2020" is two years), and "Present" includes the
+current month.
+"""
+
+import datetime
+import json
+import re
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+from regex_registry import registry
+from result_cache import LRUCache, content_hash
+
+
+MONTH_NAMES = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+
+MONTH_YEAR = registry.compile(
+    "dates.month_year",
+    r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s*((?:19|20)\d{2})\b",
+    re.IGNORECASE
+)
+YEAR_MONTH = registry.compile("dates.year_month", r"\b((?:19|20)\d{2})[-/.](\d{1,2})\b")
+MONTH_NUMBER_YEAR = registry.compile("dates.month_number_year", r"\b(\d{1,2})[-/.]((?:19|20)\d{2})\b")
+YEAR = registry.compile("dates.year", r"\b(?:19|20)\d{2}\b")
+PRESENT = registry.compile("dates.present", r"\b(?:present|current|currently|now|today|ongoing)\b", re.IGNORECASE)
+
+# A hyphen followed by a one or two digit month belongs to a date ("2019-03")
+DATE_RANGE_SEPARATOR = registry.compile(
+    "dates.range_separator",
+    r"\s*(?:–|—|\bto\b|\buntil\b|-(?!\d{1,2}\b))\s*",
+    re.IGNORECASE
+)
+
+# Parsed date strings: text -> MonthDate, _PRESENT or _UNPARSEABLE
+PARSED_DATES = LRUCache(max_entries=4096)
+_PRESENT = "present"
+_UNPARSEABLE = "unparseable"
+
+# Experience summaries of profiles, by content
+EXPERIENCE_SUMMARIES = LRUCache(max_entries=256)
+
+
+class MonthDate(NamedTuple):
+    """A date at month precision."""
+    month: int
+    has_month: bool
+
+
+class ExperienceSummary(NamedTuple):
+    """Merged experience of a profile."""
+    intervals: Tuple[Tuple[int, int], ...]
+    months: int
+    # Experience given only as a duration, which cannot be placed in time
+    undated_years: float
+    
+    @property
+    def years(self) -> float:
+        """Total years of experience."""
+        return self.months / 12 + self.undated_years
+
+
+def current_month(today: Optional[datetime.date] = None) -> int:
+    """
+    Get the month index of a date.
+    
+    Args:
+        today: Date (default: today)
+    
+    Returns:
+        Month index
+    """
+    today = today or datetime.date.today()
+    return today.year * 12 + today.month - 1
+
+
+def _parse_fixed_date(text: str) -> Optional[MonthDate]:
+    """Parse a date string that does not depend on the current date."""
+    match = MONTH_YEAR.search(text)
+    if match:
+        return MonthDate(int(match.group(2)) * 12 + MONTH_NAMES.index(match.group(1).lower()), True)
+    
+    for pattern, year_group, month_group in ((YEAR_MONTH, 1, 2), (MONTH_NUMBER_YEAR, 2, 1)):
+        match = pattern.search(text)
+        if match and 1 <= int(match.group(month_group)) <= 12:
+            return MonthDate(int(match.group(year_group)) * 12 + int(match.group(month_group)) - 1, True)
+    
+    match = YEAR.search(text)
+    if match:
+        return MonthDate(int(match.group(0)) * 12, False)
+    
+    return None
+
+
+def parse_date(text: str, today: Optional[datetime.date] = None) -> Optional[MonthDate]:
+    """
+    Parse a date string at month precision.
+    
+    Args:
+        text: Date string, e.g. "Jan 2020", "2020-01", "01/2020", "2020" or "Present"
+        today: Date "Present" refers to (default: today)
+    
+    Returns:
+        Parsed date, or None if the string is not a date
+    """
+    if not text:
+        return None
+    
+    parsed = PARSED_DATES.get(text)
+    if parsed is None:
+        if PRESENT.search(text):
+            parsed = _PRESENT
+        else:
+            parsed = _parse_fixed_date(text) or _UNPARSEABLE
+        PARSED_DATES.put(text, parsed)
+    
+    if parsed == _PRESENT:
+        return MonthDate(current_month(today), True)
+    if parsed == _UNPARSEABLE:
+        return None
+    return parsed
+
+
+def experience_interval(experience: Dict[str, Any],
+                        today: Optional[datetime.date] = None) -> Optional[Tuple[int, int]]:
+    """
+    Get the month interval of an experience entry.
+    
+    Args:
+        experience: Experience entry with start_date and end_date (missing end
+            dates mean "Present"), or a date_range such as "Jan 2020 - Present"
+        today: Date "Present" refers to (default: today)
+    
+    Returns:
+        Half-open (start, end) month interval, or None if the entry has no usable dates
+    """
+    interval = _date_interval(experience.get("start_date"), experience.get("end_date"), today)
+    if interval is None and experience.get("date_range"):
+        # Also covers entries whose start and end dates lack a year
+        parts = DATE_RANGE_SEPARATOR.split(experience["date_range"], maxsplit=1)
+        interval = _date_interval(parts[0], parts[1] if len(parts) > 1 else None, today)
+    return interval
+
+
+def _date_interval(start_text: Optional[str], end_text: Optional[str],
+                   today: Optional[datetime.date]) -> Optional[Tuple[int, int]]:
+    """Get the month interval between two date strings (a missing end means "Present")."""
+    start = parse_date(start_text, today) if start_text else None
+    end = parse_date(end_text or "Present", today)
+    if start is None or end is None:
+        return None
+    
+    # A month-precision end date includes its month
+    end_month = end.month + 1 if end.has_month else end.month
+    if end_month <= start.month:
+        return None
+    return start.month, end_month
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping and adjacent intervals.
+    
+    Args:
+        intervals: Half-open intervals
+    
+    Returns:
+        Disjoint intervals in order
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def summarize_experience(experiences: List[Dict[str, Any]],
+                         today: Optional[datetime.date] = None) -> ExperienceSummary:
+    """
+    Merge the experience entries of a profile.
+    
+    Entries with a precomputed "duration_years" use it as is.
+    
+    Args:
+        experiences: Experience entries
+        today: Date "Present" refers to (default: today)
+    
+    Returns:
+        Experience summary
+    """
+    today = today or datetime.date.today()
+    key = content_hash(today.isoformat(), json.dumps(experiences, sort_keys=True, default=str))
+    summary = EXPERIENCE_SUMMARIES.get(key)
+    if summary is None:
+        intervals = []
+        undated_years = 0.0
+        for experience in experiences:
+            if "duration_years" in experience:
+                undated_years += float(experience["duration_years"])
+                continue
+            interval = experience_interval(experience, today)
+            if interval is not None:
+                intervals.append(interval)
+        
+        merged = merge_intervals(intervals)
+        summary = ExperienceSummary(tuple(merged), sum(end - start for start, end in merged), undated_years)
+        EXPERIENCE_SUMMARIES.put(key, summary)
+    
+    return summary
@@ -0,0 +1,334 @@
+"""
+Embedding Inference Backends for Personal Job Agent
+
+The matcher model (all-MiniLM-L6-v2) runs on CPU. Besides the default
+SentenceTransformer in fp32, this module can load it:
+
+- "quantized": the SentenceTransformer with its linear layers dynamically
+  quantized to int8 by PyTorch
+- "onnx": an exported ONNX graph run by onnxruntime, with the Hugging Face
+  tokenizer stored next to it
+
+Set the PJA_EMBEDDING_BACKEND environment variable to "sentence-transformers"
+(the default), "quantized" or "onnx", and PJA_EMBEDDING_MODEL_DIR to a local
+model directory (required for "onnx"; the other backends load the named model
+when it is not set). A backend that cannot be loaded falls back to the default
+one. `python benchmarks.py inference_backend` checks that a backend ranks the
+benchmark listings like the fp32 model.
+
+Every loaded model has an identity naming its backend and model, which keys
+its cached embeddings and stored component scores, so results of different
+backends are never mixed.
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+DEFAULT_BACKEND = "sentence-transformers"
+
+BACKEND = os.environ.get("PJA_EMBEDDING_BACKEND", DEFAULT_BACKEND)
+
+MODEL_DIR = os.environ.get("PJA_EMBEDDING_MODEL_DIR") or None
+
+# Graph file names looked for in the model directory and its onnx/ subdirectory
+ONNX_FILE_NAMES = ["model.onnx", "model_quantized.onnx"]
+
+
+class SentenceTransformerEncoder:
+    """
+    SentenceTransformer wrapper that threads can share without serializing on it.
+    
+    SentenceTransformer.encode tokenizes and runs the model in one call, and
+    the tokenizer cannot be used by several threads at once. This wrapper
+    tokenizes each batch under tokenizer_lock and runs the forward pass outside
+    it, where torch releases the GIL, so threads sharing the model encode in
+    parallel. Texts are batched longest first, as SentenceTransformer.encode
+    batches them.
+    """
+    
+    # Backend and model the embeddings come from (set by load_backend)
+    identity = None
+    
+    def __init__(self, model: Any):
+        """
+        Wrap a loaded model.
+        
+        Args:
+            model: SentenceTransformer (possibly quantized)
+        """
+        self.model = model.eval()
+        self.tokenizer_lock = threading.Lock()
+        # Called tokenize before sentence-transformers 6
+        self._preprocess = getattr(model, "preprocess", None) or model.tokenize
+    
+    @property
+    def tokenizer(self) -> Any:
+        return self.model.tokenizer
+    
+    def get_max_seq_length(self) -> int:
+        return self.model.get_max_seq_length()
+    
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32,
+               normalize_embeddings: bool = False, convert_to_numpy: bool = True) -> np.ndarray:
+        """
+        Encode texts like SentenceTransformer.encode.
+        
+        Args:
+            sentences: Text or list of texts
+            batch_size: Number of texts per forward pass
+            normalize_embeddings: Whether to scale the embeddings to unit length
+            convert_to_numpy: Must be True; embeddings are always NumPy arrays
+            
+        Returns:
+            Embedding vector for a single text, or one row per text
+        """
+        import torch
+        
+        _check_numpy(convert_to_numpy)
+        if isinstance(sentences, str):
+            return self.encode([sentences], batch_size, normalize_embeddings)[0]
+        if not sentences:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        order = np.argsort([-len(text) for text in sentences])
+        embeddings = [None] * len(sentences)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            with self.tokenizer_lock:
+                features = self._preprocess([sentences[index] for index in batch])
+            features = {
+                name: value.to(self.model.device) if isinstance(value, torch.Tensor) else value
+                for name, value in features.items()
+            }
+            with torch.inference_mode():
+                output = self.model(features)["sentence_embedding"]
+            for index, vector in zip(batch, output.float().cpu().numpy()):
+                embeddings[index] = vector
+        embeddings = np.stack(embeddings)
+        return _normalized(embeddings) if normalize_embeddings else embeddings
+
+
+class OnnxSentenceEncoder:
+    """
+    SentenceTransformer-compatible encoder running an exported graph with onnxruntime.
+    
+    Reproduces the SentenceTransformer pipeline of the exported model: token
+    embeddings are mean-pooled over the attention mask, and normalized if the
+    model directory's modules.json includes a Normalize module. Only
+    tokenizing holds tokenizer_lock; onnxruntime runs the graph for several
+    threads at once.
+    """
+    
+    # Backend and model the embeddings come from (set by load_backend)
+    identity = None
+    
+    def __init__(self, model_dir: str, threads: Optional[int] = None):
+        """
+        Load the graph and tokenizer.
+        
+        Args:
+            model_dir: Directory with the ONNX graph and tokenizer files
+            threads: Number of intra-op threads (default: onnxruntime's choice)
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+        
+        path = self._find_graph(model_dir)
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {item.name for item in self.session.get_inputs()}
+        self.output_names = [item.name for item in self.session.get_outputs()]
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.tokenizer_lock = threading.Lock()
+        config = self._read_json(os.path.join(model_dir, "sentence_bert_config.json")) or {}
+        self.max_seq_length = config.get("max_seq_length") or min(self.tokenizer.model_max_length, 512)
+        
+        modules = self._read_json(os.path.join(model_dir, "modules.json")) or []
+        self.normalize = any(module.get("type", "").endswith("Normalize") for module in modules)
+    
+    @staticmethod
+    def _find_graph(model_dir: str) -> str:
+        """Get the path of the ONNX graph in a model directory."""
+        for directory in (model_dir, os.path.join(model_dir, "onnx")):
+            for name in ONNX_FILE_NAMES:
+                path = os.path.join(directory, name)
+                if os.path.isfile(path):
+                    return path
+        raise FileNotFoundError(f"No ONNX graph ({', '.join(ONNX_FILE_NAMES)}) in {model_dir}")
+    
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        """Read a JSON file, or return None if it does not exist."""
+        if not os.path.isfile(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def get_max_seq_length(self) -> int:
+        return self.max_seq_length
+    
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode one batch of texts."""
+        with self.tokenizer_lock:
+            tokens = self.tokenizer(
+                texts, padding=True, truncation=True, max_length=self.max_seq_length, return_tensors="np"
+            )
+        feed = {name: tokens[name].astype(np.int64) for name in self.input_names if name in tokens}
+        outputs = dict(zip(self.output_names, self.session.run(None, feed)))
+        
+        if "sentence_embedding" in outputs:
+            embeddings = outputs["sentence_embedding"]
+        else:
+            token_embeddings = outputs[self.output_names[0]]
+            mask = tokens["attention_mask"][..., np.newaxis].astype(token_embeddings.dtype)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        
+        if self.normalize:
+            embeddings = _normalized(embeddings)
+        return embeddings.astype(np.float32)
+    
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32,
+               normalize_embeddings: bool = False, convert_to_numpy: bool = True) -> np.ndarray:
+        """
+        Encode texts like SentenceTransformer.encode.
+        
+        Args:
+            sentences: Text or list of texts
+            batch_size: Number of texts per graph run
+            normalize_embeddings: Whether to scale the embeddings to unit length
+            convert_to_numpy: Must be True; embeddings are always NumPy arrays
+        
+        Returns:
+            Embedding vector for a single text, or one row per text
+        """
+        _check_numpy(convert_to_numpy)
+        if isinstance(sentences, str):
+            return self.encode([sentences], batch_size, normalize_embeddings)[0]
+        if not sentences:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        # Batch texts of similar length together to reduce padding
+        order = sorted(range(len(sentences)), key=lambda index: -len(sentences[index]))
+        embeddings = [None] * len(sentences)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            for index, vector in zip(batch, self._encode_batch([sentences[index] for index in batch])):
+                embeddings[index] = vector
+        embeddings = np.stack(embeddings)
+        return _normalized(embeddings) if normalize_embeddings and not self.normalize else embeddings
+
+
+def _normalized(embeddings: np.ndarray) -> np.ndarray:
+    """Scale embedding rows to unit length."""
+    return embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+
+
+def _check_numpy(convert_to_numpy: bool):
+    """Reject a request for embeddings other than NumPy arrays."""
+    if not convert_to_numpy:
+        raise ValueError("Embeddings are only returned as NumPy arrays (convert_to_numpy=False)")
+
+
+def model_identity(model: Any) -> str:
+    """
+    Identify the backend and model a model computes embeddings with.
+    
+    Args:
+        model: Model returned by load_model, another SentenceTransformer-compatible model, or None
+        
+    Returns:
+        Identity set by load_backend, "none" for no model, or the type of a model not loaded here
+    """
+    if model is None:
+        return "none"
+    return getattr(model, "identity", None) or type(model).__name__
+
+
+def _shareable(model: Any) -> Any:
+    """Wrap a SentenceTransformer in SentenceTransformerEncoder if it can tokenize separately."""
+    if hasattr(model, "preprocess") or hasattr(model, "tokenize"):
+        return SentenceTransformerEncoder(model)
+    return model
+
+
+def _load_sentence_transformer(model_dir: Optional[str]) -> Any:
+    """Load the fp32 SentenceTransformer."""
+    from sentence_transformers import SentenceTransformer
+    
+    return _shareable(SentenceTransformer(model_dir or MODEL_NAME))
+
+
+def _load_quantized(model_dir: Optional[str]) -> Any:
+    """Load the SentenceTransformer with int8 dynamically quantized linear layers."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+    
+    model = SentenceTransformer(model_dir or MODEL_NAME, device="cpu")
+    return _shareable(torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8))
+
+
+def _load_onnx(model_dir: Optional[str]) -> Any:
+    """Load the exported ONNX graph."""
+    if not model_dir:
+        raise ValueError("The onnx backend needs PJA_EMBEDDING_MODEL_DIR")
+    return OnnxSentenceEncoder(model_dir)
+
+
+BACKENDS: Dict[str, Callable[[Optional[str]], Any]] = {
+    DEFAULT_BACKEND: _load_sentence_transformer,
+    "quantized": _load_quantized,
+    "onnx": _load_onnx
+}
+
+
+def load_backend(backend: str, model_dir: Optional[str] = MODEL_DIR) -> Any:
+    """
+    Load the matcher model with a given backend, without falling back.
+    
+    Args:
+        backend: Backend name (see BACKENDS)
+        model_dir: Local model directory (default: PJA_EMBEDDING_MODEL_DIR)
+    
+    Returns:
+        SentenceTransformer-compatible model, with its identity set
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{backend}' (expected one of: {', '.join(BACKENDS)})")
+    model = BACKENDS[backend](model_dir)
+    model.identity = f"{backend}:{model_dir or MODEL_NAME}"
+    return model
+
+
+def load_model(backend: Optional[str] = None, model_dir: Optional[str] = MODEL_DIR) -> Any:
+    """
+    Load the matcher model with the configured backend.
+    
+    A backend other than the default that fails to load falls back to the
+    default SentenceTransformer.
+    
+    Args:
+        backend: Backend name (default: PJA_EMBEDDING_BACKEND)
+        model_dir: Local model directory (default: PJA_EMBEDDING_MODEL_DIR)
+    
+    Returns:
+        SentenceTransformer-compatible model
+    """
+    backend = backend or BACKEND
+    if backend != DEFAULT_BACKEND:
+        try:
+            return load_backend(backend, model_dir)
+        except Exception as e:
+            print(f"Warning: Could not load the {backend} embedding backend: {e}", file=sys.stderr)
+            print(f"Falling back to the {DEFAULT_BACKEND} backend.", file=sys.stderr)
+    return load_backend(DEFAULT_BACKEND, model_dir)
@@ -6,19 +6,61 @@ materials based on job listings and user profiles.
 """
 
 import re
+import copy
 import random
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple, Callable
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from result_cache import LRUCache, content_hash
+from question_bank import QuestionBank, load_question_bank, role_from_title, seniority_from_title
+from json_boundary import JsonInput, dumps, loads
+from job_description import bound_description, tokenize_job_description
+from boilerplate import listing_description
+from education_taxonomy import degree_required
+from regex_registry import (
+    registry, YEARS_OF_EXPERIENCE, FIELD_OF_STUDY_PATTERNS
+)
+
+SPECIFIC_EXPERIENCE_PATTERNS = [
+    registry.compile("interview.experience_area", r"experience (?:in|with) ([\w\s,/&+#]+)", re.IGNORECASE),
+    registry.compile("interview.background_area", r"background (?:in|with) ([\w\s,/&+#]+)", re.IGNORECASE)
+]
+
+# Number of questions of each non-technical category in a full question set;
+# technical questions are asked once per required skill
+QUESTION_QUOTAS = {
+    "behavioral": 5,
+    "company": 2,
+    "role": 3
+}
+
+# Bump when a change alters the results of the listing analyses
+ANALYSIS_VERSION = "1"
+
+# Listing analyses shared by all modules in the process, keyed by a hash of the description
+LISTING_ANALYSES = ("skills", "experience", "education", "responsibilities")
+ANALYSIS_CACHE = LRUCache(max_entries=512)
+
 
 class InterviewPreparationModule:
     """
     Class for generating interview questions and preparation materials.
     """
     
-    def __init__(self):
-        """Initialize the interview preparation module."""
+    def __init__(self, analysis_cache: Optional[LRUCache] = ANALYSIS_CACHE,
+                 question_bank: Optional[QuestionBank] = None):
+        """
+        Initialize the interview preparation module.
+        
+        Args:
+            analysis_cache: Cache of listing analyses, or None to disable caching
+            question_bank: Bank of skill-specific questions (default: the bundled bank)
+        """
         self.question_templates = self._load_question_templates()
         self.answer_templates = self._load_answer_templates()
+        self.analysis_cache = analysis_cache
+        self.question_bank = question_bank if question_bank is not None else _load_default_question_bank()
         
     def generate_interview_questions(self, job_listing: Dict[str, Any], count: int = 10) -> List[Dict[str, Any]]:
         """
@@ -31,32 +73,60 @@ class InterviewPreparationModule:
         Returns:
             List of generated questions with suggested answers
         """
+        return list(self.iter_interview_questions(job_listing, count))
+    
+    def iter_interview_questions(self, job_listing: Dict[str, Any], count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Generate interview questions one at a time.
+        
+        The full question set has one technical question per required skill plus
+        a fixed quota of behavioral, company and role questions. Instead of
+        building and shuffling that whole set, the positions of the returned
+        questions are sampled up front and only those questions are formatted,
+        which gives the same distribution as shuffling and taking the first
+        count questions.
+        
+        Args:
+            job_listing: Job listing data
+            count: Number of questions to generate (default: the full set)
+            
+        Returns:
+            Iterator of questions with suggested answers, in random order
+        """
         # Extract key information from job listing
         job_title = job_listing.get("title", "")
         company = job_listing.get("company", "")
-        description = job_listing.get("description", "")
         
         # Extract required skills
         required_skills = self._extract_required_skills(job_listing)
         
-        # Generate different types of questions
-        technical_questions = self._generate_technical_questions(job_title, description, required_skills)
-        behavioral_questions = self._generate_behavioral_questions(job_title, description)
-        company_questions = self._generate_company_questions(company, description)
-        role_questions = self._generate_role_questions(job_title, description)
-        
-        # Combine all questions
-        all_questions = []
-        all_questions.extend(technical_questions)
-        all_questions.extend(behavioral_questions)
-        all_questions.extend(company_questions)
-        all_questions.extend(role_questions)
-        
-        # Shuffle questions
-        random.shuffle(all_questions)
-        
-        # Return requested number of questions
-        return all_questions[:count]
+        # One slot per question of the full set
+        slots = [("technical", skill) for skill in required_skills]
+        for category, quota in QUESTION_QUOTAS.items():
+            slots.extend([(category, None)] * min(quota, len(self.question_templates[category])))
+        
+        # Tags used to pick skill-specific questions from the bank
+        role = role_from_title(job_title)
+        seniority = seniority_from_title(job_title)
+        
+        # Sample the returned questions (with slice semantics for count)
+        selected = random.sample(slots, len(slots[:count]))
+        
+        # Draw distinct templates for each category's share of the selection
+        category_templates = {}
+        for category in QUESTION_QUOTAS:
+            quota = sum(1 for selected_category, _ in selected if selected_category == category)
+            category_templates[category] = iter(random.sample(self.question_templates[category], quota))
+        
+        for category, skill in selected:
+            if category == "technical":
+                yield self._technical_question(skill, role, seniority)
+            elif category == "behavioral":
+                yield self._behavioral_question(next(category_templates[category]))
+            elif category == "company":
+                yield self._company_question(next(category_templates[category]), company)
+            else:
+                yield self._role_question(next(category_templates[category]), job_title)
     
     def generate_preparation_tips(self, job_listing: Dict[str, Any], user_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -107,7 +177,7 @@ class InterviewPreparationModule:
         """
         # Extract key information
         job_title = job_listing.get("title", "")
-        description = job_listing.get("description", "")
+        description = listing_description(job_listing)
         
         # Extract requirements
         required_skills = self._extract_required_skills(job_listing)
@@ -125,6 +195,101 @@ class InterviewPreparationModule:
             "key_responsibilities": responsibilities
         }
     
+    def prepare_many(self, applications: Iterable[Dict[str, Any]], count: int = 10, workers: int = 1,
+                     max_pending: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Prepare interview packs for many applications.
+        
+        Templates are loaded once, and each distinct job description is analyzed
+        once while it is in flight or cached. With several workers the analyses
+        run in a process pool while packs are formatted here; packs are yielded
+        in input order as soon as their listing has been analyzed.
+        
+        Args:
+            applications: Records with "interview_id", "job" and an optional "profile"
+            count: Number of questions per interview
+            workers: Number of worker processes (1 analyzes in this process)
+            max_pending: Maximum number of applications in flight (default 4 per worker)
+            
+        Returns:
+            Iterator of dictionaries with the interview id, InterviewQuestion rows,
+            preparation tips and the requirements analysis
+        """
+        if workers <= 1:
+            for application in applications:
+                yield self._prepare_application(application, count)
+            return
+        
+        max_pending = max_pending or workers * 4
+        module = self
+        if self.analysis_cache is None:
+            # Without a cache, worker results are still needed until their applications are formatted
+            module = copy.copy(self)
+            module.analysis_cache = LRUCache(max_entries=max_pending * len(LISTING_ANALYSES))
+        
+        pending = deque()
+        # Futures of descriptions with applications in flight, and how many
+        in_flight = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_preparation_worker) as executor:
+            for application in applications:
+                description = listing_description(application["job"])
+                key = content_hash(description)
+                entry = in_flight.get(key)
+                if entry is None and not module._has_analyses(description):
+                    entry = in_flight[key] = [executor.submit(_analyze_in_worker, description), 0]
+                if entry is not None:
+                    entry[1] += 1
+                pending.append((application, description, key, entry))
+                
+                if len(pending) >= max_pending:
+                    yield module._finish_pending(pending.popleft(), count, in_flight)
+            
+            while pending:
+                yield module._finish_pending(pending.popleft(), count, in_flight)
+    
+    def _finish_pending(self, item: Tuple[Dict[str, Any], str, str, Optional[List[Any]]], count: int,
+                        in_flight: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Install a worker's analyses and format the application's pack."""
+        application, description, key, entry = item
+        if entry is not None:
+            self._store_analyses(description, entry[0].result())
+            entry[1] -= 1
+            if entry[1] == 0:
+                del in_flight[key]
+        return self._prepare_application(application, count)
+    
+    def _prepare_application(self, application: Dict[str, Any], count: int) -> Dict[str, Any]:
+        """
+        Build the interview pack for one application.
+        
+        Args:
+            application: Record with "interview_id", "job" and an optional "profile"
+            count: Number of questions
+            
+        Returns:
+            Dictionary with the interview id, InterviewQuestion rows, preparation
+            tips and the requirements analysis
+        """
+        interview_id = application.get("interview_id")
+        job_listing = application["job"]
+        
+        questions = [
+            {
+                "InterviewID": interview_id,
+                "Question": question["question"],
+                "Answer": question["suggested_answer"],
+                "IsUserGenerated": False
+            }
+            for question in self.iter_interview_questions(job_listing, count)
+        ]
+        
+        return {
+            "interview_id": interview_id,
+            "questions": questions,
+            "tips": self.generate_preparation_tips(job_listing, application.get("profile")),
+            "requirements": self.analyze_job_requirements(job_listing)
+        }
+    
     def _load_question_templates(self) -> Dict[str, List[str]]:
         """
         Load question templates.
@@ -212,31 +377,55 @@ class InterviewPreparationModule:
         Returns:
             List of technical questions with suggested answers
         """
-        technical_questions = []
-        templates = self.question_templates["technical"]
-        answer_templates = self.answer_templates["technical"]
+        role = role_from_title(job_title)
+        seniority = seniority_from_title(job_title)
         
         # Generate questions for each required skill
-        for skill in required_skills:
-            # Select random template
-            template = random.choice(templates)
-            
-            # Format question
-            question = template.format(skill=skill)
-            
-            # Generate suggested answer
-            answer_template = random.choice(answer_templates)
-            answer = answer_template.format(skill=skill)
+        return [self._technical_question(skill, role, seniority) for skill in required_skills]
+    
+    def _technical_question(self, skill: str, role: Optional[str] = None,
+                            seniority: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate a technical question about one skill.
+        
+        Questions from the question bank are preferred; skills the bank does
+        not cover get a generic templated question.
+        
+        Args:
+            skill: Required skill
+            role: Role tag of the job, if known
+            seniority: Seniority level of the job, if known
             
-            # Add to questions list
-            technical_questions.append({
-                "question": question,
+        Returns:
+            Technical question with suggested answer
+        """
+        question_ids = self.question_bank.lookup(skill, role, seniority) if self.question_bank else []
+        if question_ids:
+            record = self.question_bank.get(random.choice(question_ids))
+            answer = record.get("answer") or random.choice(self.answer_templates["technical"]).format(skill=skill)
+            return {
+                "question": record["question"],
                 "type": "technical",
                 "skill": skill,
                 "suggested_answer": answer
-            })
+            }
+        
+        # Select random template
+        template = random.choice(self.question_templates["technical"])
+        
+        # Format question
+        question = template.format(skill=skill)
         
-        return technical_questions
+        # Generate suggested answer
+        answer_template = random.choice(self.answer_templates["technical"])
+        answer = answer_template.format(skill=skill)
+        
+        return {
+            "question": question,
+            "type": "technical",
+            "skill": skill,
+            "suggested_answer": answer
+        }
     
     def _generate_behavioral_questions(self, job_title: str, description: str) -> List[Dict[str, Any]]:
         """
@@ -249,29 +438,29 @@ class InterviewPreparationModule:
         Returns:
             List of behavioral questions with suggested answers
         """
-        behavioral_questions = []
         templates = self.question_templates["behavioral"]
-        answer_templates = self.answer_templates["behavioral"]
         
         # Select random templates
-        selected_templates = random.sample(templates, min(5, len(templates)))
+        selected_templates = random.sample(templates, min(QUESTION_QUOTAS["behavioral"], len(templates)))
         
         # Generate questions
-        for template in selected_templates:
-            # Format question
-            question = template
-            
-            # Generate suggested answer
-            answer = random.choice(answer_templates)
-            
-            # Add to questions list
-            behavioral_questions.append({
-                "question": question,
-                "type": "behavioral",
-                "suggested_answer": answer
-            })
+        return [self._behavioral_question(template) for template in selected_templates]
+    
+    def _behavioral_question(self, template: str) -> Dict[str, Any]:
+        """
+        Generate a behavioral question from a template.
         
-        return behavioral_questions
+        Args:
+            template: Question template
+            
+        Returns:
+            Behavioral question with suggested answer
+        """
+        return {
+            "question": template,
+            "type": "behavioral",
+            "suggested_answer": random.choice(self.answer_templates["behavioral"])
+        }
     
     def _generate_company_questions(self, company: str, description: str) -> List[Dict[str, Any]]:
         """
@@ -284,29 +473,30 @@ class InterviewPreparationModule:
         Returns:
             List of company questions with suggested answers
         """
-        company_questions = []
         templates = self.question_templates["company"]
-        answer_templates = self.answer_templates["company"]
         
         # Select random templates
-        selected_templates = random.sample(templates, min(2, len(templates)))
+        selected_templates = random.sample(templates, min(QUESTION_QUOTAS["company"], len(templates)))
         
         # Generate questions
-        for template in selected_templates:
-            # Format question
-            question = template.format(company=company)
-            
-            # Generate suggested answer
-            answer = random.choice(answer_templates).format(company=company)
-            
-            # Add to questions list
-            company_questions.append({
-                "question": question,
-                "type": "company",
-                "suggested_answer": answer
-            })
+        return [self._company_question(template, company) for template in selected_templates]
+    
+    def _company_question(self, template: str, company: str) -> Dict[str, Any]:
+        """
+        Generate a company question from a template.
         
-        return company_questions
+        Args:
+            template: Question template
+            company: Company name
+            
+        Returns:
+            Company question with suggested answer
+        """
+        return {
+            "question": template.format(company=company),
+            "type": "company",
+            "suggested_answer": random.choice(self.answer_templates["company"]).format(company=company)
+        }
     
     def _generate_role_questions(self, job_title: str, description: str) -> List[Dict[str, Any]]:
         """
@@ -319,29 +509,94 @@ class InterviewPreparationModule:
         Returns:
             List of role questions with suggested answers
         """
-        role_questions = []
         templates = self.question_templates["role"]
-        answer_templates = self.answer_templates["role"]
         
         # Select random templates
-        selected_templates = random.sample(templates, min(3, len(templates)))
+        selected_templates = random.sample(templates, min(QUESTION_QUOTAS["role"], len(templates)))
         
         # Generate questions
-        for template in selected_templates:
-            # Format question
-            question = template.format(role=job_title)
+        return [self._role_question(template, job_title) for template in selected_templates]
+    
+    def _role_question(self, template: str, job_title: str) -> Dict[str, Any]:
+        """
+        Generate a role question from a template.
+        
+        Args:
+            template: Question template
+            job_title: Job title
             
-            # Generate suggested answer
-            answer = random.choice(answer_templates).format(role=job_title)
+        Returns:
+            Role question with suggested answer
+        """
+        return {
+            "question": template.format(role=job_title),
+            "type": "role",
+            "suggested_answer": random.choice(self.answer_templates["role"]).format(role=job_title)
+        }
+    
+    def _analyze(self, analysis: str, description: str, compute: Callable[[str], Any]) -> Any:
+        """
+        Run an analysis of a job description once per description and process.
+        
+        Args:
+            analysis: Analysis name, part of the cache key
+            description: Job description
+            compute: Function computing the analysis from the description
             
-            # Add to questions list
-            role_questions.append({
-                "question": question,
-                "type": "role",
-                "suggested_answer": answer
-            })
+        Returns:
+            Analysis result (a copy, so callers may modify it)
+        """
+        if self.analysis_cache is None:
+            return compute(bound_description(description))
+        
+        key = self._analysis_key(analysis, description)
+        result = self.analysis_cache.get(key)
+        if result is None:
+            result = compute(bound_description(description))
+            self.analysis_cache.put(key, result)
+        
+        return copy.deepcopy(result)
+    
+    def _analysis_key(self, analysis: str, description: str) -> str:
+        """Get the cache key of an analysis of a job description."""
+        return content_hash(ANALYSIS_VERSION, analysis, description)
+    
+    def _analyze_description(self, description: str) -> Dict[str, Any]:
+        """
+        Run every listing analysis on a job description, bypassing the cache.
         
-        return role_questions
+        Args:
+            description: Job description
+            
+        Returns:
+            Dictionary mapping analysis names to results
+        """
+        description = bound_description(description)
+        return {
+            "skills": self._find_required_skills(description),
+            "experience": self._find_required_experience(description),
+            "education": self._find_required_education(description),
+            "responsibilities": self._find_responsibilities(description)
+        }
+    
+    def _has_analyses(self, description: str) -> bool:
+        """Check whether every listing analysis of a description is cached."""
+        if self.analysis_cache is None:
+            return False
+        return all(self._analysis_key(analysis, description) in self.analysis_cache for analysis in LISTING_ANALYSES)
+    
+    def _store_analyses(self, description: str, analyses: Dict[str, Any]):
+        """
+        Add analyses computed elsewhere (e.g. in a worker process) to the cache.
+        
+        Args:
+            description: Job description
+            analyses: Dictionary mapping analysis names to results
+        """
+        if self.analysis_cache is None:
+            return
+        for analysis, result in analyses.items():
+            self.analysis_cache.put(self._analysis_key(analysis, description), result)
     
     def _extract_required_skills(self, job_listing: Dict[str, Any]) -> List[str]:
         """
@@ -358,61 +613,19 @@ class InterviewPreparationModule:
             return job_listing["skills"]
         
         # Otherwise, extract skills from description
-        description = job_listing.get("description", "")
-        
-        # Common skill section indicators
-        skill_indicators = [
-            r"skills required",
-            r"required skills",
-            r"technical skills",
-            r"qualifications",
-            r"requirements",
-            r"you have",
-            r"you should have",
-            r"what you'll need",
-            r"what we're looking for"
-        ]
-        
-        # Try to find skills section
-        skills_section = None
-        for indicator in skill_indicators:
-            match = re.search(f"{indicator}:?(.*?)(?:\n\n|\Z)", description, re.IGNORECASE | re.DOTALL)
-            if match:
-                skills_section = match.group(1)
-                break
-        
-        if not skills_section:
-            # If no clear skills section, use the whole description
-            skills_section = description
-        
-        # Extract skills using common patterns
-        skills = []
-        
-        # Look for bullet points or list items
-        bullet_items = re.findall(r"[•\-*]\s*(.*?)(?:\n|$)", skills_section)
-        for item in bullet_items:
-            # If item is short, it's likely a skill
-            if len(item.split()) <= 5:
-                skills.append(item.strip())
-            else:
-                # Try to extract skill phrases from longer items
-                skill_phrases = re.findall(r"(?:knowledge of|experience with|proficiency in|familiar with)\s+([\w\s,/&+#]+)", item, re.IGNORECASE)
-                skills.extend([phrase.strip() for phrase in skill_phrases])
-        
-        # Look for common programming languages and technologies
-        tech_keywords = [
-            "Python", "Java", "JavaScript", "C#", "C\\+\\+", "Ruby", "PHP", "Swift",
-            "SQL", "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django",
-            "Flask", "Spring", "ASP.NET", "Express", "TensorFlow", "PyTorch",
-            "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "REST", "GraphQL"
-        ]
-        
-        for keyword in tech_keywords:
-            if re.search(r"\b" + keyword + r"\b", description, re.IGNORECASE):
-                skills.append(keyword)
+        return self._analyze("skills", listing_description(job_listing), self._find_required_skills)
+    
+    def _find_required_skills(self, description: str) -> List[str]:
+        """
+        Find required skills in a job description.
         
-        # Remove duplicates and return
-        return list(set(skills))
+        Args:
+            description: Job description
+            
+        Returns:
+            List of required skills
+        """
+        return tokenize_job_description(description).required_skills()
     
     def _extract_required_experience(self, description: str) -> Dict[str, Any]:
         """
@@ -424,30 +637,28 @@ class InterviewPreparationModule:
         Returns:
             Dictionary with experience requirements
         """
-        # Common patterns for years of experience
-        patterns = [
-            r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*experience",
-            r"experience\s*(?:of)?\s*(\d+)\+?\s*(?:years|yrs)",
-            r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*work\s*experience",
-            r"minimum\s*(?:of)?\s*(\d+)\s*(?:years|yrs)"
-        ]
+        return self._analyze("experience", description, self._find_required_experience)
+    
+    def _find_required_experience(self, description: str) -> Dict[str, Any]:
+        """
+        Find required experience in a job description.
         
+        Args:
+            description: Job description
+            
+        Returns:
+            Dictionary with experience requirements
+        """
+        # Common patterns for years of experience
         years = 0
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                years = int(match.group(1))
-                break
+        match = YEARS_OF_EXPERIENCE.first_alternative(description)
+        if match:
+            years = int(match.groups[0])
         
         # Look for specific experience requirements
         specific_experience = []
-        exp_patterns = [
-            r"experience (?:in|with) ([\w\s,/&+#]+)",
-            r"background (?:in|with) ([\w\s,/&+#]+)"
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
+        for pattern in SPECIFIC_EXPERIENCE_PATTERNS:
+            matches = pattern.findall(description)
             for match in matches:
                 if len(match.split()) <= 5:  # Limit to short phrases
                     specific_experience.append(match.strip())
@@ -467,34 +678,25 @@ class InterviewPreparationModule:
         Returns:
             Dictionary with education requirements
         """
-        # Common degree patterns
-        degree_patterns = {
-            "bachelor": [r"bachelor'?s?", r"ba", r"bs", r"b\.a", r"b\.s", r"undergraduate"],
-            "master": [r"master'?s?", r"ma", r"ms", r"m\.a", r"m\.s", r"graduate"],
-            "phd": [r"ph\.?d", r"doctorate", r"doctoral"],
-            "associate": [r"associate'?s?", r"a\.a", r"a\.s"]
-        }
-        
-        degree = ""
-        for deg, patterns in degree_patterns.items():
-            for pattern in patterns:
-                if re.search(r"\b" + pattern + r"\b", description, re.IGNORECASE):
-                    degree = deg
-                    break
-            if degree:
-                break
+        return self._analyze("education", description, self._find_required_education)
+    
+    def _find_required_education(self, description: str) -> Dict[str, Any]:
+        """
+        Find required education in a job description.
         
-        # Extract field of study
-        field_patterns = [
-            r"degree in ([\w\s]+)",
-            r"([\w\s]+) degree",
-            r"background in ([\w\s]+)",
-            r"([\w\s]+) background"
-        ]
+        Args:
+            description: Job description
+            
+        Returns:
+            Dictionary with education requirements
+        """
+        # Degree class from the education taxonomy
+        degree = degree_required(description)
         
+        # Extract field of study with the first pattern, in priority order, that matches
         field = ""
-        for pattern in field_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in FIELD_OF_STUDY_PATTERNS:
+            match = pattern.search(description)
             if match:
                 field = match.group(1).strip()
                 break
@@ -514,32 +716,21 @@ class InterviewPreparationModule:
         Returns:
             List of key responsibilities
         """
-        # Common responsibility section indicators
-        resp_indicators = [
-            r"responsibilities",
-            r"duties",
-            r"what you'll do",
-            r"job description",
-            r"the role",
-            r"your role"
-        ]
-        
-        # Try to find responsibilities section
-        resp_section = None
-        for indicator in resp_indicators:
-            match = re.search(f"{indicator}:?(.*?)(?:\n\n|\Z)", description, re.IGNORECASE | re.DOTALL)
-            if match:
-                resp_section = match.group(1)
-                break
-        
-        if not resp_section:
-            return []
+        return self._analyze("responsibilities", description, self._find_responsibilities)
+    
+    def _find_responsibilities(self, description: str) -> List[str]:
+        """
+        Find key responsibilities in a job description.
         
-        # Extract responsibilities from bullet points
+        Args:
+            description: Job description
+            
+        Returns:
+            List of key responsibilities
+        """
+        # Extract responsibilities from the bullet points of the responsibilities section
         responsibilities = []
-        bullet_items = re.findall(r"[•\-*]\s*(.*?)(?:\n|$)", resp_section)
-        
-        for item in bullet_items:
+        for item in tokenize_job_description(description).bullets("responsibilities"):
             if item.strip():
                 responsibilities.append(item.strip())
         
@@ -682,6 +873,14 @@ class InterviewPreparationModule:
         }
 
 
+def _load_default_question_bank() -> Optional[QuestionBank]:
+    """Load the bundled question bank, or None if it is not installed."""
+    try:
+        return load_question_bank()
+    except (OSError, ValueError):
+        return None
+
+
 def generate_interview_questions(job_listing: Dict[str, Any], count: int = 10) -> List[Dict[str, Any]]:
     """
     Generate interview questions based on job listing.
@@ -697,6 +896,21 @@ def generate_interview_questions(job_listing: Dict[str, Any], count: int = 10) -
     return module.generate_interview_questions(job_listing, count)
 
 
+def iter_interview_questions(job_listing: Dict[str, Any], count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Generate interview questions one at a time.
+    
+    Args:
+        job_listing: Job listing data
+        count: Number of questions to generate (default: the full set)
+        
+    Returns:
+        Iterator of questions with suggested answers
+    """
+    module = InterviewPreparationModule()
+    return module.iter_interview_questions(job_listing, count)
+
+
 def generate_preparation_tips(job_listing: Dict[str, Any], user_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Generate interview preparation tips based on job listing and user profile.
@@ -726,6 +940,74 @@ def analyze_job_requirements(job_listing: Dict[str, Any]) -> Dict[str, Any]:
     return module.analyze_job_requirements(job_listing)
 
 
+def prepare_interview(user_profile: Optional[Dict[str, Any]], job_listing: Dict[str, Any],
+                      count: int = 10) -> Dict[str, Any]:
+    """
+    Prepare questions, tips and a requirement analysis for one interview.
+    
+    Args:
+        user_profile: Optional user profile data
+        job_listing: Job listing data
+        count: Number of questions to generate
+        
+    Returns:
+        Dictionary with questions, tips and requirements
+    """
+    module = InterviewPreparationModule()
+    return {
+        "questions": module.generate_interview_questions(job_listing, count),
+        "tips": module.generate_preparation_tips(job_listing, user_profile),
+        "requirements": module.analyze_job_requirements(job_listing)
+    }
+
+
+def prepare_interview_json(user_profile_json: Optional[JsonInput], job_listing_json: JsonInput,
+                           count: int = 10) -> bytes:
+    """
+    Prepare one interview for a user profile and job listing given as JSON.
+    
+    Args:
+        user_profile_json: User profile as JSON text or bytes (may be None)
+        job_listing_json: Job listing as JSON text or bytes
+        count: Number of questions to generate
+        
+    Returns:
+        Questions, tips and requirements as UTF-8 JSON bytes
+    """
+    return dumps(prepare_interview(loads(user_profile_json), loads(job_listing_json), count))
+
+
+def prepare_many(applications: Iterable[Dict[str, Any]], count: int = 10, workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Prepare interview packs for many applications.
+    
+    Args:
+        applications: Records with "interview_id", "job" and an optional "profile"
+        count: Number of questions per interview
+        workers: Number of worker processes
+        
+    Returns:
+        Iterator of interview packs, in input order
+    """
+    module = InterviewPreparationModule()
+    return module.prepare_many(applications, count, workers)
+
+
+# Per-process state for parallel preparation
+_worker_module = None
+
+
+def _init_preparation_worker():
+    """Load the module once in each worker process."""
+    global _worker_module
+    _worker_module = InterviewPreparationModule()
+
+
+def _analyze_in_worker(description: str) -> Dict[str, Any]:
+    """Run every listing analysis on a description in a worker process."""
+    return _worker_module._analyze_description(description)
+
+
 if __name__ == "__main__":
     # Example usage
     sample_job = {
@@ -0,0 +1,251 @@
+"""
+Job Description Tokenizer for Personal Job Agent
+
+This module segments a job description into typed sections (requirements,
+responsibilities, benefits, about) once per description, instead of every
+extractor searching the text with its own header regexes. Headers are literal
+phrases matched case-insensitively with plain substring search over a
+lowercased copy of the text; each section runs from its header to the next
+blank line.
+
+Tokenized descriptions are cached by content, so the scripts that analyze the
+same listing (job matching, interview preparation, cover letters) share one
+tokenization and its derived results.
+"""
+
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from result_cache import LRUCache, content_hash
+from regex_registry import registry, BULLET_ITEM, SKILL_PHRASE, TECH_KEYWORDS, TECH_KEYWORD
+
+
+# Lowercase section headers by section type, in priority order within each
+# type. When a type has several headers in a description, the highest-priority
+# one wins, and the earliest occurrence of that header is used.
+SECTION_HEADERS = {
+    "requirements": [
+        "skills required",
+        "required skills",
+        "technical skills",
+        "qualifications",
+        "requirements",
+        "you have",
+        "you should have",
+        "what you'll need",
+        "what we're looking for"
+    ],
+    "responsibilities": [
+        "responsibilities",
+        "duties",
+        "what you'll do",
+        "job description",
+        "the role",
+        "your role"
+    ],
+    "benefits": [
+        "benefits",
+        "perks",
+        "what we offer",
+        "compensation"
+    ],
+    "about": [
+        "about us",
+        "about the company",
+        "who we are",
+        "our mission"
+    ]
+}
+
+SECTION_KINDS = list(SECTION_HEADERS)
+
+# Fallback for texts whose lowercased form has a different length, where
+# positions in the lowercased copy would not line up with the original
+SECTION_HEADER_PATTERNS = {
+    kind: [registry.compile(f"job.section_header.{kind}[{index}]", re.escape(header), re.IGNORECASE)
+           for index, header in enumerate(headers)]
+    for kind, headers in SECTION_HEADERS.items()
+}
+
+# Hardened extraction: descriptions are cut to PJA_MAX_DESCRIPTION_CHARS
+# characters (default 100000, far beyond any real posting) before any extraction
+# runs, which bounds the work a single scraped listing can cause. 0 analyzes the
+# full text.
+DEFAULT_MAX_DESCRIPTION_CHARS = 100000
+MAX_DESCRIPTION_CHARS = int(os.environ.get("PJA_MAX_DESCRIPTION_CHARS", str(DEFAULT_MAX_DESCRIPTION_CHARS))) or None
+
+# Tokenized descriptions shared by all scripts in the process
+TOKENIZED_DESCRIPTIONS = LRUCache(max_entries=1024)
+
+
+class Section(NamedTuple):
+    """A typed section of a job description."""
+    kind: str
+    header: str
+    start: int
+    end: int
+
+
+class JobDescription:
+    """
+    A job description split into typed sections.
+    
+    Derived results (section bullets, required skills) are computed on first
+    use and kept with the tokenization.
+    """
+    
+    def __init__(self, text: str):
+        """
+        Tokenize a description.
+        
+        Args:
+            text: Job description
+        """
+        self.text = text
+        self.sections = self._tokenize(text)
+        self._bullets = {}
+        self._required_skills = None
+    
+    @staticmethod
+    def _tokenize(text: str) -> Dict[str, Section]:
+        """
+        Find the section of each type.
+        
+        The section of a type starts at the earliest occurrence of its
+        highest-priority header that occurs in the text.
+        
+        Args:
+            text: Job description
+        
+        Returns:
+            Dictionary mapping section types to their sections
+        """
+        lowered = text.lower()
+        aligned = len(lowered) == len(text)
+        
+        best = {}
+        for kind, headers in SECTION_HEADERS.items():
+            for index, header in enumerate(headers):
+                if aligned:
+                    position = lowered.find(header)
+                    header_end = position + len(header)
+                else:
+                    match = SECTION_HEADER_PATTERNS[kind][index].search(text)
+                    position, header_end = match.span() if match else (-1, -1)
+                if position >= 0:
+                    best[kind] = (position, header_end)
+                    break
+        
+        sections = {}
+        for kind, (header_start, header_end) in best.items():
+            # The body follows an optional colon and runs to the next blank line
+            start = header_end + 1 if text.startswith(":", header_end) else header_end
+            end = text.find("\n\n", start)
+            sections[kind] = Section(kind, text[header_start:header_end], start, len(text) if end < 0 else end)
+        
+        return sections
+    
+    def section_text(self, kind: str) -> Optional[str]:
+        """
+        Get the body of a section.
+        
+        Args:
+            kind: Section type (see SECTION_KINDS)
+        
+        Returns:
+            Section text, or None if the description has no such section
+        """
+        section = self.sections.get(kind)
+        if section is None:
+            return None
+        return self.text[section.start:section.end]
+    
+    def bullets(self, kind: str) -> List[str]:
+        """
+        Get the bullet items of a section.
+        
+        Args:
+            kind: Section type (see SECTION_KINDS)
+        
+        Returns:
+            Raw bullet item texts (empty if the section is missing)
+        """
+        items = self._bullets.get(kind)
+        if items is None:
+            section_text = self.section_text(kind)
+            items = BULLET_ITEM.findall(section_text) if section_text else []
+            self._bullets[kind] = items
+        return list(items)
+    
+    def required_skills(self) -> List[str]:
+        """
+        Find the skills a description asks for.
+        
+        Short bullet items of the requirements section (or of the whole
+        description if there is none) count as skills, longer ones contribute
+        skill phrases, and known technologies are picked up anywhere.
+        
+        Returns:
+            List of skills, without duplicates
+        """
+        if self._required_skills is None:
+            skills_section = self.section_text("requirements")
+            if skills_section:
+                bullet_items = self.bullets("requirements")
+            else:
+                # If no clear skills section, use the whole description
+                bullet_items = BULLET_ITEM.findall(self.text)
+            
+            skills = []
+            for item in bullet_items:
+                # If item is short, it's likely a skill
+                if len(item.split()) <= 5:
+                    skills.append(item.strip())
+                else:
+                    # Try to extract skill phrases from longer items
+                    skills.extend(phrase.strip() for phrase in SKILL_PHRASE.findall(item))
+            
+            # Look for common programming languages and technologies
+            for index in TECH_KEYWORD.matching_alternatives(self.text):
+                skills.append(TECH_KEYWORDS[index])
+            
+            self._required_skills = list(set(skills))
+        
+        return list(self._required_skills)
+
+
+def bound_description(description: str, max_chars: Optional[int] = None) -> str:
+    """
+    Cut a description to the extraction length cap.
+    
+    Args:
+        description: Job description
+        max_chars: Maximum length (default: MAX_DESCRIPTION_CHARS)
+        
+    Returns:
+        The description, truncated if a cap is set and exceeded
+    """
+    max_chars = max_chars or MAX_DESCRIPTION_CHARS
+    if max_chars and len(description) > max_chars:
+        return description[:max_chars]
+    return description
+
+
+def tokenize_job_description(description: str) -> JobDescription:
+    """
+    Tokenize a job description, reusing an earlier tokenization of the same text.
+    
+    Args:
+        description: Job description (cut to MAX_DESCRIPTION_CHARS)
+    
+    Returns:
+        Tokenized description
+    """
+    description = bound_description(description)
+    key = content_hash(description)
+    tokenized = TOKENIZED_DESCRIPTIONS.get(key)
+    if tokenized is None:
+        tokenized = JobDescription(description)
+        TOKENIZED_DESCRIPTIONS.put(key, tokenized)
+    return tokenized
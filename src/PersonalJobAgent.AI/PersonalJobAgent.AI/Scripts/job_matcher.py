@@ -5,34 +5,150 @@ This module provides functionality to match user profiles with job listings
 using NLP and machine learning techniques.
 """
 
-import re
+import heapq
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, BinaryIO, NamedTuple
 import json
-from sentence_transformers import SentenceTransformer
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from inference_backend import load_model, model_identity
+from embedding_cache import EMBEDDING_CACHE
+from result_cache import content_hash
+from shared_arrays import SHARED_ARRAYS, SharedArrayHandle, attach
+from json_boundary import JsonInput, loads, dumps_array, write_array
+from job_description import bound_description, tokenize_job_description
+from boilerplate import SHARED_INDEX, BoilerplateIndex, listing_description
+from experience_dates import summarize_experience
+from component_scores import COMPONENTS, ComponentScoreStore, profile_key, job_key
+from education_taxonomy import degree_required, field_required, highest_degree, is_degree_sufficient
+from regex_registry import YEARS_OF_EXPERIENCE
 
-# Initialize sentence transformer model
+# Initialize sentence transformer model with the configured inference backend
 # In production, would use a more sophisticated model
 try:
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    model = load_model()
 except Exception as e:
-    print(f"Warning: Could not load sentence transformer model: {e}")
-    print("Using mock embeddings for development purposes.")
+    print(f"Warning: Could not load sentence transformer model: {e}", file=sys.stderr)
+    print("Using mock embeddings for development purposes.", file=sys.stderr)
     model = None
 
 
+def build_job_text(job: Dict[str, Any], boilerplate: Optional[BoilerplateIndex] = None) -> str:
+    """
+    Build the text a job listing is embedded from.
+    
+    Args:
+        job: Job listing data
+        boilerplate: Index of learned boilerplate to strip (default: strip nothing)
+        
+    Returns:
+        Title followed by description
+    """
+    job_text = ""
+    
+    # Add title
+    if "title" in job:
+        job_text += job["title"] + " "
+    
+    # Add description, without the company's boilerplate
+    if "description" in job:
+        job_text += listing_description(job, boilerplate)
+    
+    return job_text
+
+
+class MatchWeights(NamedTuple):
+    """Weights of the match score components."""
+    skill: float = 0.5
+    experience: float = 0.3
+    education: float = 0.2
+    # Mix of the weighted component score and the semantic similarity
+    profile: float = 0.7
+    semantic: float = 0.3
+
+
+DEFAULT_MATCH_WEIGHTS = MatchWeights()
+
+# Number of listings whose texts are encoded in one model batch
+MATCH_CHUNK_SIZE = 64
+
+# Upper bound of a cosine similarity, with slack for rounding
+SIMILARITY_BOUND = 1.0 + 1e-6
+
+
+class ProfileFeatures(NamedTuple):
+    """Profile-side values of a match run, computed once and shared by every listing."""
+    skills: Tuple[str, ...]
+    total_years: float
+    highest_degree: str
+    profile_text: str
+
+
+class JobRequirements(NamedTuple):
+    """Requirements extracted from a job listing, shared by the score bound and the full score."""
+    skills: List[str]
+    years: int
+    degree: str
+    field: str
+
+
+class TopKMatches(NamedTuple):
+    """Result of top-k matching, with pruning statistics."""
+    matches: List[Dict[str, Any]]
+    listings: int
+    scored: int
+    pruned: int
+
+
 class JobMatcher:
     """
     Class for matching user profiles with job listings using NLP techniques.
+    
+    A matcher holds only read-only state after construction, so one instance
+    can be shared by many threads. The model is only called through the shared
+    embedding cache, which serializes its tokenizer; the forward passes of
+    threads sharing the model run in parallel (see inference_backend).
+    
+    When given a ComponentScoreStore, the matcher records the component scores
+    of every pair it scores, so other weightings can be ranked from the store
+    (see ComponentScoreStore.rank) without matching again.
+    
+    When given a BoilerplateIndex, the matcher learns company boilerplate from
+    every batch it matches and strips it from descriptions before scanning and
+    embedding them, so a listing's scores then depend on the listings the index
+    has seen. Without one, descriptions are used as they are.
     """
     
-    def __init__(self):
-        """Initialize the job matcher with necessary components."""
-        self.model = model
-        self.skill_weight = 0.5
-        self.experience_weight = 0.3
-        self.education_weight = 0.2
+    def __init__(self, weights: MatchWeights = DEFAULT_MATCH_WEIGHTS,
+                 score_store: Optional[ComponentScoreStore] = None,
+                 boilerplate: Optional[BoilerplateIndex] = None):
+        """
+        Initialize the job matcher with necessary components.
         
+        Args:
+            weights: Weights of the match score components
+            score_store: Store that records component scores, or None
+            boilerplate: Index that learns company boilerplate from matched
+                listings and strips it from their descriptions, or None
+        """
+        self.model = model
+        self.embeddings = EMBEDDING_CACHE
+        self.weights = weights
+        self.score_store = score_store
+        self.boilerplate = boilerplate
+    
+    @property
+    def skill_weight(self) -> float:
+        return self.weights.skill
+    
+    @property
+    def experience_weight(self) -> float:
+        return self.weights.experience
+    
+    @property
+    def education_weight(self) -> float:
+        return self.weights.education
+    
     def match_jobs(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Match user profile with job listings and return ranked results.
@@ -44,82 +160,398 @@ class JobMatcher:
         Returns:
             List of job listings with match scores
         """
+        # Learn the company boilerplate of the listings before they are scanned
+        if self.boilerplate is not None:
+            self.boilerplate.learn(job_listings)
+        features = self._profile_features(user_profile)
         results = []
+        for start in range(0, len(job_listings), MATCH_CHUNK_SIZE):
+            results.extend(self._match_chunk(user_profile, job_listings[start:start + MATCH_CHUNK_SIZE], features))
+        self._record_scores(user_profile, job_listings, results)
+        
+        # Sort by match score (descending)
+        results.sort(key=lambda x: x["match_score"], reverse=True)
+        
+        return results
+    
+    def match_jobs_top_k(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                         k: int = 10) -> TopKMatches:
+        """
+        Find the k best matching job listings, skipping listings that cannot make the cut.
         
-        for job in job_listings:
-            match_score, match_details = self._calculate_match_score(user_profile, job)
+        Every listing gets a score bound from its cheap components (see
+        _score_upper_bound), and listings are scored in order of decreasing
+        bound. Once k listings are scored, a listing whose bound is below the
+        k-th best score so far cannot be among the best k, so it and all
+        listings after it are skipped along with their embeddings and
+        similarity computations. The matches are identical to the first k
+        results of match_jobs.
+        
+        Args:
+            user_profile: User profile data
+            job_listings: List of job listings to match against
+            k: Number of matches to return
             
-            # Add match information to job listing
-            job_result = job.copy()
-            job_result["match_score"] = match_score
-            job_result["match_details"] = match_details
+        Returns:
+            Best k listings with match scores, and the number of listings scored and pruned
+        """
+        if k <= 0:
+            return TopKMatches([], len(job_listings), 0, len(job_listings))
+        
+        # Learn the company boilerplate of the listings before they are scanned
+        if self.boilerplate is not None:
+            self.boilerplate.learn(job_listings)
+        features = self._profile_features(user_profile)
+        requirements = [self._job_requirements(job) for job in job_listings]
+        
+        # The bound only holds while every weight is non-negative
+        if min(self.weights) >= 0:
+            bounds = [
+                self._score_upper_bound(user_profile, job, features, job_requirements)
+                for job, job_requirements in zip(job_listings, requirements)
+            ]
+            order = sorted(range(len(job_listings)), key=bounds.__getitem__, reverse=True)
+        else:
+            bounds = None
+            order = list(range(len(job_listings)))
+        
+        best_scores = []
+        scored = []
+        for start in range(0, len(order), MATCH_CHUNK_SIZE):
+            chunk = order[start:start + MATCH_CHUNK_SIZE]
+            if bounds is not None and len(best_scores) == k:
+                chunk = [index for index in chunk if bounds[index] >= best_scores[0]]
+                if not chunk:
+                    # Bounds only decrease from here
+                    break
             
-            results.append(job_result)
+            chunk_results = self._match_chunk(
+                user_profile, [job_listings[index] for index in chunk], features,
+                [requirements[index] for index in chunk]
+            )
+            for index, job_result in zip(chunk, chunk_results):
+                scored.append((index, job_result))
+                if len(best_scores) < k:
+                    heapq.heappush(best_scores, job_result["match_score"])
+                elif job_result["match_score"] > best_scores[0]:
+                    heapq.heapreplace(best_scores, job_result["match_score"])
+        
+        scored.sort(key=lambda item: item[0])
+        self._record_scores(user_profile, [job_listings[index] for index, _ in scored],
+                            [job_result for _, job_result in scored])
+        
+        # Sort by match score (descending), ties in input order as in match_jobs
+        scored.sort(key=lambda item: -item[1]["match_score"])
+        matches = [job_result for _, job_result in scored[:k]]
+        
+        return TopKMatches(matches, len(job_listings), len(scored), len(job_listings) - len(scored))
+    
+    def match_jobs_parallel(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                            workers: int = 2, chunk_size: int = 256) -> List[Dict[str, Any]]:
+        """
+        Match user profile with job listings across worker processes.
+        
+        The listings' embedding matrix is computed once in this process and
+        published in shared memory; workers read their rows through read-only
+        views instead of receiving pickled copies or encoding the listings again.
+        Results are identical to match_jobs.
+        
+        Args:
+            user_profile: User profile data
+            job_listings: List of job listings to match against
+            workers: Number of worker processes
+            chunk_size: Number of listings per task
+            
+        Returns:
+            List of job listings with match scores
+        """
+        if workers <= 1 or len(job_listings) <= chunk_size:
+            return self.match_jobs(user_profile, job_listings)
+        
+        # Learn the company boilerplate of the listings before they are scanned
+        boilerplate = None
+        if self.boilerplate is not None:
+            self.boilerplate.learn(job_listings)
+            boilerplate = self.boilerplate.snapshot(job.get("company") for job in job_listings)
+        
+        name = None
+        handle = None
+        if self.model:
+            job_texts = [build_job_text(job, self.boilerplate) for job in job_listings]
+            name = content_hash("job_embeddings", self.embeddings.model_key(self.model), *job_texts)
+            handle = SHARED_ARRAYS.publish(name, np.stack(self.embeddings.encode_documents(self.model, job_texts)))
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_match_worker,
+                                     initargs=(user_profile, handle, self.weights, boilerplate)) as executor:
+                futures = [
+                    executor.submit(_match_job_chunk, start, job_listings[start:start + chunk_size])
+                    for start in range(0, len(job_listings), chunk_size)
+                ]
+                results = [job_result for future in futures for job_result in future.result()]
+        finally:
+            if name is not None:
+                SHARED_ARRAYS.release(name)
+        self._record_scores(user_profile, job_listings, results)
         
         # Sort by match score (descending)
         results.sort(key=lambda x: x["match_score"], reverse=True)
         
         return results
     
-    def _calculate_match_score(self, user_profile: Dict[str, Any], job: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
+    def _record_scores(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                       results: List[Dict[str, Any]]):
+        """
+        Record the component scores of scored listings in the score store, if any.
+        
+        Args:
+            user_profile: User profile data
+            job_listings: Scored job listings
+            results: Match results aligned with job_listings
+        """
+        if self.score_store is None:
+            return
+        
+        # Listings score differently once their boilerplate is stripped
+        fingerprint = self.boilerplate.fingerprint if self.boilerplate is not None else lambda company: ""
+        self.score_store.add_many(
+            profile_key(user_profile, model_identity(self.model)),
+            [job_key(job, fingerprint(job.get("company"))) for job in job_listings],
+            [[job_result["match_details"][f"{component}_score"] for component in COMPONENTS] for job_result in results]
+        )
+    
+    def _match_chunk(self, user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                     features: ProfileFeatures,
+                     requirements: Optional[List[JobRequirements]] = None) -> List[Dict[str, Any]]:
+        """
+        Score a chunk of job listings, encoding their texts in one batch first.
+        
+        Args:
+            user_profile: User profile data
+            job_listings: Job listings of the chunk
+            features: Precomputed profile features
+            requirements: Precomputed requirements of each listing (extracted if not given)
+            
+        Returns:
+            Copies of the job listings with match information, in input order
+        """
+        if self.model:
+            self.embeddings.encode_documents(self.model, [build_job_text(job, self.boilerplate) for job in job_listings])
+            self.embeddings.encode_many(self.model, [job.get("title", "").lower() for job in job_listings])
+        
+        if requirements is None:
+            return [self._match_job(user_profile, job, features) for job in job_listings]
+        return [
+            self._match_job(user_profile, job, features, job_requirements)
+            for job, job_requirements in zip(job_listings, requirements)
+        ]
+    
+    def _match_job(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                   features: Optional[ProfileFeatures] = None,
+                   requirements: Optional[JobRequirements] = None) -> Dict[str, Any]:
+        """
+        Score one job listing against the user profile.
+        
+        Args:
+            user_profile: User profile data
+            job: Job listing data
+            features: Precomputed profile features (computed if not given)
+            requirements: Precomputed job requirements (extracted if not given)
+            
+        Returns:
+            Copy of the job listing with match information
+        """
+        match_score, match_details = self._calculate_match_score(user_profile, job, features, requirements)
+        
+        # Add match information to job listing
+        job_result = job.copy()
+        job_result["match_score"] = match_score
+        job_result["match_details"] = match_details
+        
+        return job_result
+    
+    def _profile_features(self, user_profile: Dict[str, Any]) -> ProfileFeatures:
+        """
+        Compute the profile-side values used to score every listing.
+        
+        Args:
+            user_profile: User profile data
+            
+        Returns:
+            Profile features
+        """
+        # Total years of user experience, with overlapping roles counted once
+        total_years = summarize_experience(user_profile.get("experience", [])).years
+        
+        # Create profile text
+        profile_text = ""
+        
+        # Add summary
+        if "summary" in user_profile:
+            profile_text += user_profile["summary"] + " "
+        
+        # Add experience descriptions
+        for exp in user_profile.get("experience", []):
+            if "description" in exp:
+                profile_text += exp["description"] + " "
+        
+        # Add skills
+        skill_text = " ".join(skill["name"] for skill in user_profile.get("skills", []))
+        profile_text += skill_text
+        
+        return ProfileFeatures(
+            skills=tuple(skill["name"].lower() for skill in user_profile.get("skills", [])),
+            total_years=total_years,
+            highest_degree=self._get_highest_degree(user_profile.get("education", [])),
+            profile_text=profile_text
+        )
+    
+    def _job_requirements(self, job: Dict[str, Any]) -> JobRequirements:
+        """
+        Extract the requirements of a job listing.
+        
+        Args:
+            job: Job listing data
+            
+        Returns:
+            Job requirements
+        """
+        job_description = bound_description(listing_description(job, self.boilerplate)).lower()
+        return JobRequirements(
+            skills=self._extract_skills_from_job(job),
+            years=self._extract_years_required(job_description),
+            degree=self._extract_degree_required(job_description),
+            field=self._extract_field_required(job_description)
+        )
+    
+    def _calculate_match_score(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                               features: Optional[ProfileFeatures] = None,
+                               requirements: Optional[JobRequirements] = None) -> Tuple[float, Dict[str, Any]]:
         """
         Calculate match score between user profile and job listing.
         
         Args:
             user_profile: User profile data
             job: Job listing data
+            features: Precomputed profile features (computed if not given)
+            requirements: Precomputed job requirements (extracted if not given)
             
         Returns:
             Tuple of (match_score, match_details)
         """
+        if features is None:
+            features = self._profile_features(user_profile)
+        if requirements is None:
+            requirements = self._job_requirements(job)
+        
         match_details = {}
         
         # Calculate skill match
-        skill_score, skill_matches = self._calculate_skill_match(user_profile, job)
+        skill_score, skill_matches = self._calculate_skill_match(user_profile, job, features, requirements)
         match_details["skill_score"] = skill_score
         match_details["skill_matches"] = skill_matches
         
         # Calculate experience match
-        experience_score, experience_matches = self._calculate_experience_match(user_profile, job)
+        experience_score, experience_matches = self._calculate_experience_match(user_profile, job, features, requirements)
         match_details["experience_score"] = experience_score
         match_details["experience_matches"] = experience_matches
         
         # Calculate education match
-        education_score, education_matches = self._calculate_education_match(user_profile, job)
+        education_score, education_matches = self._calculate_education_match(user_profile, job, features, requirements)
         match_details["education_score"] = education_score
         match_details["education_matches"] = education_matches
         
         # Calculate semantic similarity between profile and job description
-        semantic_score = self._calculate_semantic_similarity(user_profile, job)
+        semantic_score = self._calculate_semantic_similarity(user_profile, job, features)
         match_details["semantic_score"] = semantic_score
         
         # Calculate overall match score (weighted average)
         match_score = (
-            self.skill_weight * skill_score +
-            self.experience_weight * experience_score +
-            self.education_weight * education_score
+            self.weights.skill * skill_score +
+            self.weights.experience * experience_score +
+            self.weights.education * education_score
         )
         
         # Adjust score based on semantic similarity
-        match_score = match_score * 0.7 + semantic_score * 0.3
+        match_score = match_score * self.weights.profile + semantic_score * self.weights.semantic
         
         return match_score, match_details
     
-    def _calculate_skill_match(self, user_profile: Dict[str, Any], job: Dict[str, Any]) -> Tuple[float, List[Dict[str, Any]]]:
+    def _score_upper_bound(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                           features: ProfileFeatures, requirements: JobRequirements) -> float:
+        """
+        Bound the match score of a listing without computing any embeddings.
+        
+        The skill, years of experience and degree scores are computed exactly;
+        the title, field and semantic similarities are replaced by their maximum.
+        
+        Args:
+            user_profile: User profile data
+            job: Job listing data
+            features: Precomputed profile features
+            requirements: Precomputed job requirements
+            
+        Returns:
+            Upper bound of the listing's match score
+        """
+        skill_score, _ = self._calculate_skill_match(user_profile, job, features, requirements)
+        
+        experience_bound = 0.0
+        user_experiences = user_profile.get("experience", [])
+        if user_experiences:
+            years_required = requirements.years
+            if years_required > 0 and features.total_years < years_required:
+                experience_bound = features.total_years / years_required
+            else:
+                experience_bound = 1.0
+            
+            # A title match averages in a similarity of at most 1
+            if self.model and any(exp.get("title", "") for exp in user_experiences):
+                experience_bound = max(experience_bound, (experience_bound + SIMILARITY_BOUND) / 2)
+        
+        education_bound = 0.0
+        user_education = user_profile.get("education", [])
+        if user_education:
+            degree_required = requirements.degree
+            if degree_required and not self._is_degree_sufficient(features.highest_degree, degree_required):
+                education_bound = 0.0
+            else:
+                education_bound = 1.0
+            
+            # A field requirement averages in the best field similarity
+            if requirements.field:
+                has_field = any(edu.get("field_of_study", "") for edu in user_education)
+                education_bound = (education_bound + (SIMILARITY_BOUND if has_field else 0.0)) / 2
+        
+        semantic_bound = SIMILARITY_BOUND if self.model else 0.5
+        
+        bound = (
+            self.weights.skill * skill_score +
+            self.weights.experience * experience_bound +
+            self.weights.education * education_bound
+        )
+        return bound * self.weights.profile + semantic_bound * self.weights.semantic
+    
+    def _calculate_skill_match(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                               features: Optional[ProfileFeatures] = None,
+                               requirements: Optional[JobRequirements] = None) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Calculate skill match between user profile and job listing.
         
         Args:
             user_profile: User profile data
             job: Job listing data
+            features: Precomputed profile features (computed if not given)
+            requirements: Precomputed job requirements (skills extracted if not given)
             
         Returns:
             Tuple of (skill_score, skill_matches)
         """
-        user_skills = [skill["name"].lower() for skill in user_profile.get("skills", [])]
+        features = features or self._profile_features(user_profile)
+        user_skills = features.skills
         
         # Extract skills from job description
-        job_skills = self._extract_skills_from_job(job)
+        job_skills = requirements.skills if requirements else self._extract_skills_from_job(job)
         
         if not job_skills or not user_skills:
             return 0.0, []
@@ -171,76 +603,26 @@ class JobMatcher:
             return job["skills"]
         
         # Otherwise, extract skills from description
-        description = job.get("description", "")
-        
-        # Common skill section indicators
-        skill_indicators = [
-            r"skills required",
-            r"required skills",
-            r"technical skills",
-            r"qualifications",
-            r"requirements",
-            r"you have",
-            r"you should have",
-            r"what you'll need",
-            r"what we're looking for"
-        ]
-        
-        # Try to find skills section
-        skills_section = None
-        for indicator in skill_indicators:
-            match = re.search(f"{indicator}:?(.*?)(?:\n\n|\Z)", description, re.IGNORECASE | re.DOTALL)
-            if match:
-                skills_section = match.group(1)
-                break
-        
-        if not skills_section:
-            # If no clear skills section, use the whole description
-            skills_section = description
-        
-        # Extract skills using common patterns
-        skills = []
-        
-        # Look for bullet points or list items
-        bullet_items = re.findall(r"[•\-*]\s*(.*?)(?:\n|$)", skills_section)
-        for item in bullet_items:
-            # If item is short, it's likely a skill
-            if len(item.split()) <= 5:
-                skills.append(item.strip())
-            else:
-                # Try to extract skill phrases from longer items
-                skill_phrases = re.findall(r"(?:knowledge of|experience with|proficiency in|familiar with)\s+([\w\s,/&+#]+)", item, re.IGNORECASE)
-                skills.extend([phrase.strip() for phrase in skill_phrases])
-        
-        # Look for common programming languages and technologies
-        tech_keywords = [
-            "Python", "Java", "JavaScript", "C#", "C\\+\\+", "Ruby", "PHP", "Swift",
-            "SQL", "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django",
-            "Flask", "Spring", "ASP.NET", "Express", "TensorFlow", "PyTorch",
-            "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "REST", "GraphQL"
-        ]
-        
-        for keyword in tech_keywords:
-            if re.search(r"\b" + keyword + r"\b", description, re.IGNORECASE):
-                skills.append(keyword)
-        
-        # Remove duplicates and return
-        return list(set(skills))
+        return tokenize_job_description(listing_description(job, self.boilerplate)).required_skills()
     
-    def _calculate_experience_match(self, user_profile: Dict[str, Any], job: Dict[str, Any]) -> Tuple[float, List[Dict[str, Any]]]:
+    def _calculate_experience_match(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                                    features: Optional[ProfileFeatures] = None,
+                                    requirements: Optional[JobRequirements] = None) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Calculate experience match between user profile and job listing.
         
         Args:
             user_profile: User profile data
             job: Job listing data
+            features: Precomputed profile features (computed if not given)
+            requirements: Precomputed job requirements (extracted if not given)
             
         Returns:
             Tuple of (experience_score, experience_matches)
         """
+        features = features or self._profile_features(user_profile)
         user_experiences = user_profile.get("experience", [])
         job_title = job.get("title", "").lower()
-        job_description = job.get("description", "").lower()
         
         if not user_experiences:
             return 0.0, []
@@ -248,14 +630,14 @@ class JobMatcher:
         experience_matches = []
         
         # Extract years of experience required from job
-        years_required = self._extract_years_required(job_description)
+        if requirements:
+            years_required = requirements.years
+        else:
+            description = listing_description(job, self.boilerplate)
+            years_required = self._extract_years_required(bound_description(description).lower())
         
-        # Calculate total years of user experience
-        total_years = 0
-        for exp in user_experiences:
-            # Try to extract years from date range
-            years = self._calculate_experience_years(exp)
-            total_years += years
+        # Total years of user experience
+        total_years = features.total_years
         
         # Check if user meets years requirement
         years_match = {
@@ -323,78 +705,29 @@ class JobMatcher:
             Number of years required (0 if not specified)
         """
         # Common patterns for years of experience
-        patterns = [
-            r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*experience",
-            r"experience\s*(?:of)?\s*(\d+)\+?\s*(?:years|yrs)",
-            r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*work\s*experience",
-            r"minimum\s*(?:of)?\s*(\d+)\s*(?:years|yrs)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
+        match = YEARS_OF_EXPERIENCE.first_alternative(job_description)
+        if match:
+            return int(match.groups[0])
         
         return 0
     
-    def _calculate_experience_years(self, experience: Dict[str, Any]) -> float:
-        """
-        Calculate years of experience from an experience entry.
-        
-        Args:
-            experience: Experience entry
-            
-        Returns:
-            Years of experience (float)
-        """
-        # If there's a pre-calculated duration, use it
-        if "duration_years" in experience:
-            return float(experience["duration_years"])
-        
-        # Try to calculate from start and end dates
-        start_date = experience.get("start_date")
-        end_date = experience.get("end_date", "Present")
-        
-        if not start_date:
-            return 0.0
-        
-        # Extract years from dates
-        start_year = self._extract_year(start_date)
-        end_year = self._extract_year(end_date) if end_date != "Present" else 2025  # Use current year for "Present"
-        
-        if start_year and end_year:
-            return end_year - start_year
-        
-        return 0.0
-    
-    def _extract_year(self, date_str: str) -> Optional[int]:
-        """
-        Extract year from date string.
-        
-        Args:
-            date_str: Date string
-            
-        Returns:
-            Year as integer, or None if not found
-        """
-        year_match = re.search(r"\b(19|20)\d{2}\b", date_str)
-        if year_match:
-            return int(year_match.group(0))
-        return None
-    
-    def _calculate_education_match(self, user_profile: Dict[str, Any], job: Dict[str, Any]) -> Tuple[float, List[Dict[str, Any]]]:
+    def _calculate_education_match(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                                   features: Optional[ProfileFeatures] = None,
+                                   requirements: Optional[JobRequirements] = None) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Calculate education match between user profile and job listing.
         
         Args:
             user_profile: User profile data
             job: Job listing data
+            features: Precomputed profile features (computed if not given)
+            requirements: Precomputed job requirements (extracted if not given)
             
         Returns:
             Tuple of (education_score, education_matches)
         """
+        features = features or self._profile_features(user_profile)
         user_education = user_profile.get("education", [])
-        job_description = job.get("description", "").lower()
         
         if not user_education:
             return 0.0, []
@@ -402,11 +735,16 @@ class JobMatcher:
         education_matches = []
         
         # Extract education requirements from job
-        degree_required = self._extract_degree_required(job_description)
-        field_required = self._extract_field_required(job_description)
+        if requirements:
+            degree_required = requirements.degree
+            field_required = requirements.field
+        else:
+            job_description = bound_description(listing_description(job, self.boilerplate)).lower()
+            degree_required = self._extract_degree_required(job_description)
+            field_required = self._extract_field_required(job_description)
         
         # Check if user meets degree requirement
-        user_highest_degree = self._get_highest_degree(user_education)
+        user_highest_degree = features.highest_degree
         degree_match = {
             "type": "degree_match",
             "job_requirement": degree_required,
@@ -477,20 +815,7 @@ class JobMatcher:
         Returns:
             Degree requirement (empty string if not specified)
         """
-        # Common degree patterns
-        degree_patterns = {
-            "bachelor": [r"bachelor'?s?", r"ba", r"bs", r"b\.a", r"b\.s", r"undergraduate"],
-            "master": [r"master'?s?", r"ma", r"ms", r"m\.a", r"m\.s", r"graduate"],
-            "phd": [r"ph\.?d", r"doctorate", r"doctoral"],
-            "associate": [r"associate'?s?", r"a\.a", r"a\.s"]
-        }
-        
-        for degree, patterns in degree_patterns.items():
-            for pattern in patterns:
-                if re.search(r"\b" + pattern + r"\b", job_description, re.IGNORECASE):
-                    return degree
-        
-        return ""
+        return degree_required(job_description)
     
     def _extract_field_required(self, job_description: str) -> str:
         """
@@ -502,38 +827,7 @@ class JobMatcher:
         Returns:
             Field requirement (empty string if not specified)
         """
-        # Common field patterns
-        field_patterns = [
-            r"degree in ([\w\s]+)",
-            r"([\w\s]+) degree",
-            r"background in ([\w\s]+)",
-            r"([\w\s]+) background"
-        ]
-        
-        # Common fields of study
-        common_fields = [
-            "computer science", "information technology", "software engineering",
-            "data science", "mathematics", "statistics", "business",
-            "engineering", "economics", "finance", "accounting",
-            "marketing", "psychology", "biology", "chemistry", "physics"
-        ]
-        
-        # First try to extract field from patterns
-        for pattern in field_patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE)
-            if match:
-                field = match.group(1).lower()
-                # Check if the extracted field contains a common field
-                for common_field in common_fields:
-                    if common_field in field:
-                        return common_field
-        
-        # If no match from patterns, check for common fields directly
-        for field in common_fields:
-            if field in job_description:
-                return field
-        
-        return ""
+        return field_required(job_description)
     
     def _get_highest_degree(self, education: List[Dict[str, Any]]) -> str:
         """
@@ -545,48 +839,7 @@ class JobMatcher:
         Returns:
             Highest degree (empty string if none found)
         """
-        # Degree hierarchy
-        degree_hierarchy = {
-            "phd": 4,
-            "master": 3,
-            "bachelor": 2,
-            "associate": 1
-        }
-        
-        highest_degree = ""
-        highest_level = 0
-        
-        for edu in education:
-            degree = edu.get("degree", "").lower()
-            
-            # Check for degree types
-            for degree_type, level in degree_hierarchy.items():
-                if degree_type in degree or any(pattern in degree for pattern in self._get_degree_patterns(degree_type)):
-                    if level > highest_level:
-                        highest_degree = degree_type
-                        highest_level = level
-                    break
-        
-        return highest_degree
-    
-    def _get_degree_patterns(self, degree_type: str) -> List[str]:
-        """
-        Get patterns for a degree type.
-        
-        Args:
-            degree_type: Type of degree
-            
-        Returns:
-            List of patterns for the degree type
-        """
-        patterns = {
-            "bachelor": ["bachelor", "ba", "bs", "b.a", "b.s", "undergraduate"],
-            "master": ["master", "ma", "ms", "m.a", "m.s", "graduate"],
-            "phd": ["phd", "ph.d", "doctorate", "doctoral"],
-            "associate": ["associate", "a.a", "a.s"]
-        }
-        
-        return patterns.get(degree_type, [])
+        return highest_degree(education)
     
     def _is_degree_sufficient(self, user_degree: str, required_degree: str) -> bool:
         """
@@ -599,27 +852,17 @@ class JobMatcher:
         Returns:
             True if user's degree is sufficient, False otherwise
         """
-        # Degree hierarchy
-        degree_hierarchy = {
-            "phd": 4,
-            "master": 3,
-            "bachelor": 2,
-            "associate": 1,
-            "": 0
-        }
-        
-        user_level = degree_hierarchy.get(user_degree, 0)
-        required_level = degree_hierarchy.get(required_degree, 0)
-        
-        return user_level >= required_level
+        return is_degree_sufficient(user_degree, required_degree)
     
-    def _calculate_semantic_similarity(self, user_profile: Dict[str, Any], job: Dict[str, Any]) -> float:
+    def _calculate_semantic_similarity(self, user_profile: Dict[str, Any], job: Dict[str, Any],
+                                       features: Optional[ProfileFeatures] = None) -> float:
         """
         Calculate semantic similarity between user profile and job listing.
         
         Args:
             user_profile: User profile data
             job: Job listing data
+            features: Precomputed profile features (computed if not given)
             
         Returns:
             Semantic similarity score
@@ -628,37 +871,17 @@ class JobMatcher:
             # If model not available, return a default score
             return 0.5
         
-        # Create profile text
-        profile_text = ""
-        
-        # Add summary
-        if "summary" in user_profile:
-            profile_text += user_profile["summary"] + " "
-        
-        # Add experience descriptions
-        for exp in user_profile.get("experience", []):
-            if "description" in exp:
-                profile_text += exp["description"] + " "
-        
-        # Add skills
-        skill_text = " ".join(skill["name"] for skill in user_profile.get("skills", []))
-        profile_text += skill_text
+        profile_text = (features or self._profile_features(user_profile)).profile_text
         
         # Create job text
-        job_text = ""
-        
-        # Add title
-        if "title" in job:
-            job_text += job["title"] + " "
+        job_text = build_job_text(job, self.boilerplate)
         
-        # Add description
-        if "description" in job:
-            job_text += job["description"]
-        
-        # Calculate similarity
+        # Calculate similarity (long texts are embedded in pooled chunks, the
+        # profile is encoded once per match run, and job embeddings are shared
+        # with the other scripts)
         try:
-            profile_embedding = self.model.encode(profile_text)
-            job_embedding = self.model.encode(job_text)
+            profile_embedding = self.embeddings.encode_document(self.model, profile_text)
+            job_embedding = self.embeddings.encode_document(self.model, job_text)
             
             # Cosine similarity
             similarity = np.dot(profile_embedding, job_embedding) / (
@@ -667,7 +890,7 @@ class JobMatcher:
             
             return float(similarity)
         except Exception as e:
-            print(f"Error calculating semantic similarity: {e}")
+            print(f"Error calculating semantic similarity: {e}", file=sys.stderr)
             return 0.5
     
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
@@ -693,8 +916,8 @@ class JobMatcher:
             return overlap / max(len(words1), len(words2))
         
         try:
-            embedding1 = self.model.encode(text1)
-            embedding2 = self.model.encode(text2)
+            embedding1 = self.embeddings.encode(self.model, text1)
+            embedding2 = self.embeddings.encode(self.model, text2)
             
             # Cosine similarity
             similarity = np.dot(embedding1, embedding2) / (
@@ -703,25 +926,128 @@ class JobMatcher:
             
             return float(similarity)
         except Exception as e:
-            print(f"Error calculating text similarity: {e}")
+            print(f"Error calculating text similarity: {e}", file=sys.stderr)
             return 0.0
 
 
-def match_jobs(user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def match_jobs(user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+               weights: Optional[Dict[str, float]] = None,
+               boilerplate: Optional[BoilerplateIndex] = SHARED_INDEX) -> List[Dict[str, Any]]:
     """
     Match user profile with job listings and return ranked results.
     
     Args:
         user_profile: User profile data
         job_listings: List of job listings to match against
+        weights: Score weights overriding the defaults (keys as in MatchWeights)
+        boilerplate: Index of company boilerplate to learn and strip (default:
+            the process-wide index if PJA_STRIP_BOILERPLATE is 1, else none)
         
     Returns:
         List of job listings with match scores
     """
-    matcher = JobMatcher()
+    weights = DEFAULT_MATCH_WEIGHTS._replace(**weights) if weights else DEFAULT_MATCH_WEIGHTS
+    matcher = JobMatcher(weights, boilerplate=boilerplate)
     return matcher.match_jobs(user_profile, job_listings)
 
 
+def match_top_jobs(user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                   k: int = 10,
+                   boilerplate: Optional[BoilerplateIndex] = SHARED_INDEX) -> List[Dict[str, Any]]:
+    """
+    Find the k best matching job listings.
+    
+    Args:
+        user_profile: User profile data
+        job_listings: List of job listings to match against
+        k: Number of matches to return
+        boilerplate: Index of company boilerplate to learn and strip (see match_jobs)
+        
+    Returns:
+        Best k job listings with match scores
+    """
+    matcher = JobMatcher(boilerplate=boilerplate)
+    return matcher.match_jobs_top_k(user_profile, job_listings, k).matches
+
+
+def match_jobs_parallel(user_profile: Dict[str, Any], job_listings: List[Dict[str, Any]],
+                        workers: int = 2,
+                        boilerplate: Optional[BoilerplateIndex] = SHARED_INDEX) -> List[Dict[str, Any]]:
+    """
+    Match user profile with job listings across worker processes.
+    
+    Args:
+        user_profile: User profile data
+        job_listings: List of job listings to match against
+        workers: Number of worker processes
+        boilerplate: Index of company boilerplate to learn and strip (see match_jobs)
+        
+    Returns:
+        List of job listings with match scores
+    """
+    matcher = JobMatcher(boilerplate=boilerplate)
+    return matcher.match_jobs_parallel(user_profile, job_listings, workers)
+
+
+# Per-process state for parallel matching
+_worker_matcher = None
+_worker_profile = None
+_worker_features = None
+_worker_job_embeddings = None
+
+
+def _init_match_worker(user_profile: Dict[str, Any], handle: Optional[SharedArrayHandle],
+                       weights: MatchWeights = DEFAULT_MATCH_WEIGHTS,
+                       boilerplate: Optional[Dict[str, frozenset]] = None):
+    """Create the matcher and attach to the shared job embeddings once in each worker process."""
+    global _worker_matcher, _worker_profile, _worker_features, _worker_job_embeddings
+    index = None
+    if boilerplate is not None:
+        index = BoilerplateIndex()
+        index.load(boilerplate)
+    _worker_matcher = JobMatcher(weights, boilerplate=index)
+    _worker_profile = user_profile
+    _worker_features = _worker_matcher._profile_features(user_profile)
+    _worker_job_embeddings = attach(handle) if handle is not None else None
+
+
+def _match_job_chunk(start: int, job_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score a contiguous chunk of listings in a worker process."""
+    if _worker_job_embeddings is not None:
+        # Serve the listings' embeddings from the shared matrix
+        for offset, job in enumerate(job_listings):
+            _worker_matcher.embeddings.put_document(
+                _worker_matcher.model, build_job_text(job, _worker_matcher.boilerplate),
+                _worker_job_embeddings[start + offset]
+            )
+    
+    return [_worker_matcher._match_job(_worker_profile, job, _worker_features) for job in job_listings]
+
+
+def match_jobs_json(user_profile_json: JsonInput, job_listings_json: JsonInput,
+                    output: Optional[BinaryIO] = None) -> Optional[bytes]:
+    """
+    Match a user profile with job listings given and returned as JSON.
+    
+    Company boilerplate is stripped as in match_jobs.
+    
+    Args:
+        user_profile_json: User profile as JSON text or bytes
+        job_listings_json: Array of job listings as JSON text or bytes
+        output: Binary stream to write the results to as they are encoded,
+            instead of returning them (for very large batches)
+            
+    Returns:
+        Ranked listings with match scores as UTF-8 JSON bytes, or None if
+        written to output
+    """
+    results = match_jobs(loads(user_profile_json), loads(job_listings_json))
+    if output is not None:
+        write_array(results, output)
+        return None
+    return dumps_array(results)
+
+
 if __name__ == "__main__":
     # Example usage
     sample_profile = {
@@ -0,0 +1,143 @@
+"""
+JSON Boundary for Personal Job Agent
+
+This module converts between the JSON exchanged with callers (the C# host, the
+batch CLI) and the Python objects the AI scripts work on. Input may be a JSON
+str or UTF-8 bytes; output is compact UTF-8 JSON bytes, which the host decodes
+in one copy instead of converting Python objects field by field.
+
+orjson is used when it is installed; otherwise the standard json module is.
+Large arrays can be written element by element, so a 10k-listing result is
+never held as a single encoded document.
+"""
+
+import json
+from typing import Any, BinaryIO, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+# Elements encoded per chunk when streaming an array
+STREAM_CHUNK_SIZE = 256
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the encoders do not handle natively (NumPy scalars and arrays, sets)."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def _loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+    
+    def _loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return _ENCODER.encode(obj).encode("utf-8")
+
+
+def loads(data: Union[JsonInput, Any]) -> Any:
+    """
+    Decode a JSON document.
+    
+    Already decoded values (dicts, lists, ...) are returned unchanged, so script
+    entry points accept both JSON and Python objects.
+    
+    Args:
+        data: JSON text or UTF-8 bytes, or an already decoded value
+        
+    Returns:
+        Decoded value
+    """
+    if isinstance(data, str):
+        return _loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return _loads(bytes(data))
+    return data
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode a value as compact JSON.
+    
+    Args:
+        obj: Value to encode
+        
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return _dumps(obj)
+
+
+def iter_array(items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode an array incrementally.
+    
+    Args:
+        items: Array elements
+        chunk_size: Number of elements encoded per yielded chunk
+        
+    Returns:
+        Iterator of byte chunks that concatenate to the encoded array
+    """
+    chunk = [b"["]
+    count = 0
+    for item in items:
+        if count:
+            chunk.append(b",")
+        chunk.append(_dumps(item))
+        count += 1
+        if count % chunk_size == 0:
+            yield b"".join(chunk)
+            chunk = []
+    chunk.append(b"]")
+    yield b"".join(chunk)
+
+
+def write_array(items: Iterable[Any], stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+    """
+    Stream an encoded array to a binary file.
+    
+    Args:
+        items: Array elements
+        stream: Binary stream the array is written to
+        chunk_size: Number of elements encoded per write
+        
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in iter_array(items, chunk_size):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def dumps_array(items: Iterable[Any]) -> bytes:
+    """
+    Encode an array from an iterable, without building an intermediate list.
+    
+    Args:
+        items: Array elements
+        
+    Returns:
+        UTF-8 JSON bytes of the array
+    """
+    return b"".join(iter_array(items))
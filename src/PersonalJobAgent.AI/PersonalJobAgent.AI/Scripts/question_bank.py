@@ -0,0 +1,318 @@
+"""
+Question Bank for Personal Job Agent
+
+This module provides an indexed store of interview questions tagged by skill,
+role and seniority. Questions are written as JSON lines and compiled into a
+compact binary file that is memory-mapped on load: the inverted indexes (from
+normalized skill, role and seniority to question ids) are read up front, and
+question records are decoded only when a question is picked.
+
+Usage:
+    python question_bank.py build [source.jsonl] [output.qbank]
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from typing import Dict, Any, List, Optional, Iterable, Union
+
+from template_engine import TEMPLATES_DIRECTORY
+
+
+QUESTION_BANK_SOURCE = os.path.join(TEMPLATES_DIRECTORY, "question_bank", "questions.jsonl")
+
+MAGIC = b"PJAQB1\n"
+
+# Job title words that indicate a seniority level
+SENIORITY_WORDS = {
+    "intern": "junior", "junior": "junior", "jr": "junior", "entry": "junior", "graduate": "junior",
+    "senior": "senior", "sr": "senior", "lead": "senior", "principal": "senior", "staff": "senior"
+}
+
+# Job title words that indicate a role tag
+ROLE_WORDS = {
+    "backend": "backend", "back-end": "backend", "frontend": "frontend", "front-end": "frontend",
+    "fullstack": "fullstack", "full-stack": "fullstack", "data": "data", "ml": "ml", "ai": "ml",
+    "devops": "devops", "sre": "devops", "infrastructure": "devops", "platform": "devops",
+    "cloud": "cloud", "mobile": "mobile", "ios": "mobile", "android": "mobile", "systems": "systems",
+    "embedded": "systems", "web": "frontend"
+}
+
+
+def normalize_tag(tag: str) -> str:
+    """
+    Normalize a skill or role for index lookups.
+    
+    Args:
+        tag: Skill or role as written in a listing or question
+        
+    Returns:
+        Lowercased tag with collapsed whitespace
+    """
+    return " ".join(tag.lower().split())
+
+
+def seniority_from_title(job_title: str) -> Optional[str]:
+    """
+    Guess the seniority level of a job from its title.
+    
+    Args:
+        job_title: Job title
+        
+    Returns:
+        "junior", "senior", or None if the title does not say
+    """
+    for word in job_title.lower().replace(".", " ").split():
+        if word in SENIORITY_WORDS:
+            return SENIORITY_WORDS[word]
+    return None
+
+
+def role_from_title(job_title: str) -> Optional[str]:
+    """
+    Guess the role tag of a job from its title.
+    
+    Args:
+        job_title: Job title
+        
+    Returns:
+        Role tag (e.g. "backend", "data"), or None if the title does not say
+    """
+    for word in job_title.lower().replace("/", " ").split():
+        if word in ROLE_WORDS:
+            return ROLE_WORDS[word]
+    return None
+
+
+class QuestionBank:
+    """
+    Read-only question bank backed by a compiled (usually memory-mapped) file.
+    
+    File layout: magic, header length, JSON header with the indexes, one
+    8-byte offset per question plus an end offset, and the question records
+    as concatenated JSON documents.
+    """
+    
+    def __init__(self, data: Union[bytes, mmap.mmap], source_stamp: Optional[List[int]] = None):
+        """
+        Open a compiled bank.
+        
+        Args:
+            data: Compiled bank contents
+            source_stamp: Expected [size, mtime_ns] of the source, to detect stale files
+            
+        Raises:
+            ValueError: If the data is not a compiled bank
+        """
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a compiled question bank")
+        
+        header_start = len(MAGIC) + 8
+        (header_length,) = struct.unpack_from("<Q", data, len(MAGIC))
+        header = json.loads(bytes(data[header_start:header_start + header_length]))
+        
+        self.data = data
+        self.count = header["count"]
+        self.source_stamp = header.get("source_stamp")
+        self.index = header["index"]
+        
+        self.offsets_start = header_start + header_length
+        self.records_start = self.offsets_start + 8 * (self.count + 1)
+        self._tag_sets = {}
+        
+        if source_stamp is not None and self.source_stamp != source_stamp:
+            raise ValueError("Compiled question bank is out of date")
+    
+    @classmethod
+    def open(cls, path: str, source_stamp: Optional[List[int]] = None) -> "QuestionBank":
+        """
+        Memory-map a compiled bank file.
+        
+        Args:
+            path: Path of the compiled bank
+            source_stamp: Expected [size, mtime_ns] of the source, to detect stale files
+            
+        Returns:
+            Opened question bank
+        """
+        with open(path, "rb") as bank_file:
+            data = mmap.mmap(bank_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, source_stamp)
+    
+    @staticmethod
+    def compile(records: Iterable[Dict[str, Any]], source_stamp: Optional[List[int]] = None) -> bytes:
+        """
+        Compile question records into the bank format.
+        
+        Args:
+            records: Question records with "question", optional "answer", and
+                "skills", "roles" and "seniority" tags
+            source_stamp: [size, mtime_ns] of the source the records came from
+            
+        Returns:
+            Compiled bank contents
+        """
+        index = {"skill": {}, "role": {}, "seniority": {}}
+        blobs = []
+        for question_id, record in enumerate(records):
+            for skill in record.get("skills", []):
+                index["skill"].setdefault(normalize_tag(skill), []).append(question_id)
+            for role in record.get("roles", []):
+                index["role"].setdefault(normalize_tag(role), []).append(question_id)
+            if record.get("seniority"):
+                index["seniority"].setdefault(record["seniority"], []).append(question_id)
+            blobs.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        
+        header = json.dumps({
+            "count": len(blobs),
+            "source_stamp": source_stamp,
+            "index": index
+        }, separators=(",", ":")).encode("utf-8")
+        
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        
+        return b"".join([
+            MAGIC,
+            struct.pack("<Q", len(header)),
+            header,
+            struct.pack(f"<{len(offsets)}Q", *offsets),
+            *blobs
+        ])
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def get(self, question_id: int) -> Dict[str, Any]:
+        """
+        Decode one question record.
+        
+        Args:
+            question_id: Question id
+            
+        Returns:
+            Question record
+        """
+        start, end = struct.unpack_from("<QQ", self.data, self.offsets_start + 8 * question_id)
+        return json.loads(bytes(self.data[self.records_start + start:self.records_start + end]))
+    
+    def lookup(self, skill: str, role: Optional[str] = None, seniority: Optional[str] = None) -> List[int]:
+        """
+        Find questions about a skill, preferring ones that also fit the role and seniority.
+        
+        Args:
+            skill: Skill as written in the listing
+            role: Optional role tag
+            seniority: Optional seniority level
+            
+        Returns:
+            Ids of the best-fitting questions (empty if the skill is unknown)
+        """
+        skill_ids = self.index["skill"].get(normalize_tag(skill))
+        if not skill_ids:
+            return []
+        
+        role_ids = self._tag_set("role", normalize_tag(role)) if role else frozenset()
+        seniority_ids = self._tag_set("seniority", seniority) if seniority else frozenset()
+        
+        # Narrowest non-empty match first
+        for required in (role_ids & seniority_ids, seniority_ids, role_ids):
+            if required:
+                ids = [question_id for question_id in skill_ids if question_id in required]
+                if ids:
+                    return ids
+        
+        return skill_ids
+    
+    def _tag_set(self, kind: str, tag: str) -> frozenset:
+        """Get the ids of questions with a role or seniority tag as a set, built on first use."""
+        key = (kind, tag)
+        ids = self._tag_sets.get(key)
+        if ids is None:
+            ids = frozenset(self.index[kind].get(tag, ()))
+            self._tag_sets[key] = ids
+        return ids
+
+
+def _source_stamp(source: str) -> List[int]:
+    """Get the [size, mtime_ns] stamp of a source file."""
+    stat = os.stat(source)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _read_records(source: str) -> List[Dict[str, Any]]:
+    """Read question records from a JSON lines file."""
+    with open(source, "r", encoding="utf-8") as source_file:
+        return [json.loads(line) for line in source_file if line.strip()]
+
+
+def build_question_bank(source: str = QUESTION_BANK_SOURCE, output: Optional[str] = None) -> str:
+    """
+    Compile a JSON lines question source into a bank file.
+    
+    Args:
+        source: Path of the JSON lines source
+        output: Path of the compiled bank (default: the source path with a .qbank extension)
+        
+    Returns:
+        Path of the compiled bank
+    """
+    output = output or os.path.splitext(source)[0] + ".qbank"
+    data = QuestionBank.compile(_read_records(source), _source_stamp(source))
+    
+    temp_path = f"{output}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as bank_file:
+        bank_file.write(data)
+    os.replace(temp_path, output)
+    
+    return output
+
+
+_banks = {}
+_banks_lock = threading.Lock()
+
+
+def load_question_bank(source: str = QUESTION_BANK_SOURCE) -> QuestionBank:
+    """
+    Load a question bank once per process.
+    
+    The compiled file next to the source is memory-mapped if it is up to date;
+    otherwise it is rebuilt, or the bank is compiled in memory if the
+    directory is not writable.
+    
+    Args:
+        source: Path of the JSON lines source
+        
+    Returns:
+        Question bank
+    """
+    with _banks_lock:
+        bank = _banks.get(source)
+        if bank is not None:
+            return bank
+        
+        stamp = _source_stamp(source)
+        compiled = os.path.splitext(source)[0] + ".qbank"
+        try:
+            bank = QuestionBank.open(compiled, stamp)
+        except (OSError, ValueError):
+            try:
+                bank = QuestionBank.open(build_question_bank(source, compiled), stamp)
+            except OSError:
+                bank = QuestionBank(QuestionBank.compile(_read_records(source), stamp))
+        
+        _banks[source] = bank
+        return bank
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        print(__doc__)
+        sys.exit(1)
+    
+    built = build_question_bank(*sys.argv[2:4])
+    print(f"Compiled {len(QuestionBank.open(built))} questions into {built}")
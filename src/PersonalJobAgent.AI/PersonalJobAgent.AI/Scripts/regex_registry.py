@@ -0,0 +1,383 @@
+"""
+Regex Registry for Personal Job Agent
+
+This module provides a shared registry of precompiled regular expressions used by
+the AI scripts. Every pattern is compiled once at import time, and patterns that
+were previously tried one after another are combined into a single alternation.
+
+Set the PJA_REGEX_PROFILE environment variable to 1 (or call
+registry.enable_profiling()) to record per-pattern call counts, hit counts and
+time spent.
+"""
+
+import os
+import re
+import time
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple, Callable
+
+
+class AlternativeMatch(NamedTuple):
+    """Match of one alternative of an AlternationPattern."""
+    index: int
+    text: str
+    groups: Tuple[Optional[str], ...]
+
+
+class RegisteredPattern:
+    """
+    A compiled regex registered under a name.
+    
+    Exposes the usual ``re.Pattern`` methods. When profiling is off they are the
+    compiled pattern's own bound methods, so there is no per-call overhead.
+    """
+    
+    PROFILED_METHODS = ("search", "match", "fullmatch", "findall", "finditer", "split", "sub")
+    
+    def __init__(self, name: str, regex: "re.Pattern"):
+        """
+        Initialize the registered pattern.
+        
+        Args:
+            name: Registry name of the pattern
+            regex: Compiled regular expression
+        """
+        self.name = name
+        self.regex = regex
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+        self.groups = regex.groups
+        self.reset_stats()
+        self.set_profiling(False)
+    
+    def reset_stats(self):
+        """Reset profiling counters."""
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+    
+    def set_profiling(self, enabled: bool):
+        """
+        Switch profiling on or off for this pattern.
+        
+        Args:
+            enabled: Whether calls should be counted and timed
+        """
+        for method in self.PROFILED_METHODS:
+            target = self._target(method)
+            setattr(self, method, self._profiled(method, target) if enabled else target)
+    
+    def _target(self, method: str) -> Callable:
+        """Get the unprofiled implementation of a method."""
+        return getattr(self.regex, method)
+    
+    def _profiled(self, method: str, target: Callable) -> Callable:
+        """
+        Wrap a method so each call updates the profiling counters.
+        
+        Args:
+            method: Method name
+            target: Unprofiled implementation
+            
+        Returns:
+            Profiling wrapper
+        """
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            result = target(*args, **kwargs)
+            if method == "finditer":
+                # Consume the iterator so the scan is included in the timing
+                result = list(result)
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+            if (len(result) > 1) if method == "split" else bool(result):
+                self.hits += 1
+            return result
+        
+        return profiled
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get profiling counters.
+        
+        Returns:
+            Dictionary with calls, hits and seconds
+        """
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "seconds": self.seconds
+        }
+
+
+class AlternationPattern(RegisteredPattern):
+    """
+    Several patterns combined into one prioritized alternation.
+    
+    Each alternative sits in its own capturing group inside a lookahead, so a
+    single ``finditer`` pass reports a candidate at every position without
+    consuming text. At each position the regex engine reports the first
+    alternative (in priority order) that matches there, which is what lets one
+    scan replace a loop of ``re.search`` calls.
+    """
+    
+    PROFILED_METHODS = RegisteredPattern.PROFILED_METHODS + (
+        "first_alternative", "matching_alternatives", "matches_any"
+    )
+    
+    def __init__(self, name: str, alternatives: List[str], flags: int = 0, word_boundary: bool = False):
+        """
+        Compile the alternation.
+        
+        Args:
+            name: Registry name of the pattern
+            alternatives: Regex sources in priority order
+            flags: Regex flags applied to every alternative
+            word_boundary: Whether to wrap each alternative in \\b anchors
+        """
+        self.alternatives = list(alternatives)
+        self.group_index = {}
+        self.group_spans = []
+        
+        # The leading \b is shared by all alternatives so that positions inside
+        # words are rejected before any alternative is tried
+        boundary = r"\b" if word_boundary else ""
+        parts = []
+        next_group = 1
+        for index, alternative in enumerate(self.alternatives):
+            inner_groups = re.compile(alternative, flags).groups
+            parts.append("(" + alternative + ")" + boundary)
+            self.group_index[next_group] = index
+            self.group_spans.append((next_group, inner_groups))
+            next_group += inner_groups + 1
+        
+        regex = re.compile("(?=" + boundary + "(?:" + "|".join(parts) + "))", flags)
+        super().__init__(name, regex)
+    
+    def _target(self, method: str) -> Callable:
+        """Get the unprofiled implementation of a method."""
+        if hasattr(self.regex, method):
+            return getattr(self.regex, method)
+        return getattr(self, "_" + method)
+    
+    def _to_alternative_match(self, match: "re.Match", index: int) -> AlternativeMatch:
+        """Convert a lookahead match into an AlternativeMatch."""
+        group, inner_groups = self.group_spans[index]
+        return AlternativeMatch(
+            index,
+            match.group(group),
+            tuple(match.group(group + offset) for offset in range(1, inner_groups + 1))
+        )
+    
+    def _first_alternative(self, string: str) -> Optional[AlternativeMatch]:
+        """
+        Find the highest-priority alternative that matches anywhere in the string.
+        
+        This is equivalent to calling ``re.search`` with each alternative in turn
+        and keeping the first hit, but scans the string once.
+        
+        Args:
+            string: Text to scan
+            
+        Returns:
+            The leftmost match of the winning alternative, or None
+        """
+        best_index = None
+        best_match = None
+        for match in self.regex.finditer(string):
+            index = self.group_index[match.lastindex]
+            if best_index is None or index < best_index:
+                best_index = index
+                best_match = match
+                if index == 0:
+                    break
+        
+        if best_match is None:
+            return None
+        
+        return self._to_alternative_match(best_match, best_index)
+    
+    def _matching_alternatives(self, string: str) -> List[int]:
+        """
+        Find every alternative that matches somewhere in the string.
+        
+        An alternative is only reported at positions where no higher-priority
+        alternative also matches, which makes no difference for word-bounded
+        keyword lists.
+        
+        Args:
+            string: Text to scan
+            
+        Returns:
+            Sorted list of alternative indices
+        """
+        return sorted({self.group_index[match.lastindex] for match in self.regex.finditer(string)})
+    
+    def _matches_any(self, string: str) -> bool:
+        """
+        Check whether any alternative matches the string.
+        
+        Args:
+            string: Text to scan
+            
+        Returns:
+            True if at least one alternative matches
+        """
+        return self.regex.search(string) is not None
+
+
+class RegexRegistry:
+    """
+    Registry of named, precompiled regular expressions.
+    """
+    
+    def __init__(self, profiling: bool = False):
+        """
+        Initialize an empty registry.
+        
+        Args:
+            profiling: Whether to profile patterns as they are registered
+        """
+        self.patterns = {}
+        self.profiling = profiling
+    
+    def compile(self, name: str, pattern: str, flags: int = 0) -> RegisteredPattern:
+        """
+        Compile and register a pattern.
+        
+        Registering the same name twice returns the existing pattern if the
+        source and flags are identical.
+        
+        Args:
+            name: Registry name, conventionally prefixed with the owning module
+            pattern: Regex source
+            flags: Regex flags
+            
+        Returns:
+            The registered pattern
+        """
+        return self._register(name, (pattern, flags), lambda: RegisteredPattern(name, re.compile(pattern, flags)))
+    
+    def alternation(self, name: str, alternatives: List[str], flags: int = 0,
+                    word_boundary: bool = False) -> AlternationPattern:
+        """
+        Compile and register a prioritized alternation.
+        
+        Args:
+            name: Registry name, conventionally prefixed with the owning module
+            alternatives: Regex sources in priority order
+            flags: Regex flags applied to every alternative
+            word_boundary: Whether to wrap each alternative in \\b anchors
+            
+        Returns:
+            The registered alternation
+        """
+        key = (tuple(alternatives), flags, word_boundary)
+        return self._register(name, key, lambda: AlternationPattern(name, alternatives, flags, word_boundary))
+    
+    def _register(self, name: str, key: Tuple, factory: Callable[[], RegisteredPattern]) -> RegisteredPattern:
+        """Register a pattern built by factory unless an identical one exists."""
+        existing = self.patterns.get(name)
+        if existing is not None:
+            if existing[0] != key:
+                raise ValueError(f"Pattern '{name}' is already registered with a different definition")
+            return existing[1]
+        
+        registered = factory()
+        registered.set_profiling(self.profiling)
+        self.patterns[name] = (key, registered)
+        return registered
+    
+    def get(self, name: str) -> RegisteredPattern:
+        """
+        Look up a registered pattern.
+        
+        Args:
+            name: Registry name
+            
+        Returns:
+            The registered pattern
+        """
+        return self.patterns[name][1]
+    
+    def enable_profiling(self):
+        """Start counting and timing calls on every registered pattern."""
+        self._set_profiling(True)
+    
+    def disable_profiling(self):
+        """Stop counting and timing calls."""
+        self._set_profiling(False)
+    
+    def _set_profiling(self, enabled: bool):
+        """Switch profiling on every registered pattern."""
+        self.profiling = enabled
+        for _, registered in self.patterns.values():
+            registered.set_profiling(enabled)
+    
+    def reset_stats(self):
+        """Reset profiling counters on every registered pattern."""
+        for _, registered in self.patterns.values():
+            registered.reset_stats()
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get profiling counters for every pattern that has been called.
+        
+        Returns:
+            Dictionary mapping pattern names to their counters, slowest first
+        """
+        stats = {
+            name: registered.stats()
+            for name, (_, registered) in self.patterns.items()
+            if registered.calls
+        }
+        return dict(sorted(stats.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+
+registry = RegexRegistry(profiling=os.environ.get("PJA_REGEX_PROFILE") == "1")
+
+
+# Patterns shared by several scripts
+
+BULLET_ITEM = registry.compile("job.bullet_item", r"[•\-*]\s*(.*?)(?:\n|$)")
+
+SKILL_PHRASE = registry.compile(
+    "job.skill_phrase",
+    r"(?:knowledge of|experience with|proficiency in|familiar with)\s+([\w\s,/&+#]+)",
+    re.IGNORECASE
+)
+
+# Common programming languages and technologies; entries are regex sources
+TECH_KEYWORDS = [
+    "Python", "Java", "JavaScript", "C#", "C\\+\\+", "Ruby", "PHP", "Swift",
+    "SQL", "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Django",
+    "Flask", "Spring", "ASP.NET", "Express", "TensorFlow", "PyTorch",
+    "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "REST", "GraphQL"
+]
+
+TECH_KEYWORD = registry.alternation("job.tech_keyword", TECH_KEYWORDS, re.IGNORECASE, word_boundary=True)
+
+YEARS_OF_EXPERIENCE = registry.alternation("job.years_of_experience", [
+    r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*experience",
+    r"experience\s*(?:of)?\s*(\d+)\+?\s*(?:years|yrs)",
+    r"(\d+)\+?\s*(?:years|yrs)(?:\s*of)?\s*work\s*experience",
+    r"minimum\s*(?:of)?\s*(\d+)\s*(?:years|yrs)"
+], re.IGNORECASE)
+
+# The leading run of the suffix forms only starts where a run of word and space
+# characters starts. A search finds the same match as without the lookbehind
+# (the leftmost match always starts at a run start), but a failed attempt no
+# longer rescans the rest of the run from every position inside it, which made
+# long descriptions without the suffix take quadratic time. The patterns are
+# searched one at a time: a single lookahead alternation would capture to the
+# end of the run at every "degree in"/"background in" inside it.
+FIELD_OF_STUDY_SOURCES = [
+    r"degree in ([\w\s]+)",
+    r"(?<![\w\s])([\w\s]+) degree",
+    r"background in ([\w\s]+)",
+    r"(?<![\w\s])([\w\s]+) background"
+]
+
+FIELD_OF_STUDY_PATTERNS = [
+    registry.compile(f"job.field_of_study[{index}]", source, re.IGNORECASE)
+    for index, source in enumerate(FIELD_OF_STUDY_SOURCES)
+]
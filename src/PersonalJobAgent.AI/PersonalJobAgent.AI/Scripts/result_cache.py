@@ -0,0 +1,331 @@
+"""
+Result Cache for Personal Job Agent
+
+This module provides small, dependency-free caches used by the AI scripts to
+avoid recomputing results for inputs they have already seen: a size-bounded
+in-memory LRU cache, a size-bounded on-disk JSON cache, and a tiered cache that
+combines the two.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Hashable
+
+
+def content_hash(*parts: str) -> str:
+    """
+    Hash one or more strings into a stable cache key.
+    
+    Args:
+        parts: Strings to hash, e.g. a version tag and the normalized content
+        
+    Returns:
+        Hex digest identifying the content
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache that evicts the least recently used entry.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in memory
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default
+        """
+        with self.lock:
+            try:
+                value = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Store an entry, evicting the least recently used ones if needed.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            self.entries.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        with self.lock:
+            return key in self.entries
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entries, hits and misses
+        """
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class DiskCache:
+    """
+    On-disk cache of JSON-serializable values, one file per key.
+    
+    The total size of the cache directory is bounded; when it is exceeded the
+    least recently used files (by modification time, refreshed on every hit)
+    are deleted.
+    
+    Several processes may share a directory. Each one re-scans the directory
+    before evicting and after writing 1/RESCAN_FRACTION of the size limit, so
+    the directory exceeds the limit by at most that much per writing process.
+    """
+    
+    RESCAN_FRACTION = 16
+    
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache, creating the directory if needed.
+        
+        Args:
+            directory: Directory holding the cache files
+            max_bytes: Maximum total size of the cache files
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        os.makedirs(directory, exist_ok=True)
+        
+        # Index existing files so eviction works across restarts
+        self._scan()
+    
+    def _scan(self):
+        """Index the files in the directory, including those written by other processes."""
+        sizes = {}
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    sizes[entry.name[:-5]] = entry.stat().st_size
+                except OSError:
+                    # Deleted by another process since the directory was listed
+                    continue
+        self.sizes = sizes
+        self.total_bytes = sum(sizes.values())
+        self.unscanned_bytes = 0
+    
+    def _path(self, key: str) -> str:
+        """Get the file path for a key."""
+        return os.path.join(self.directory, key + ".json")
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key: Cache key (must be a valid file name, e.g. a content hash)
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                value = json.load(cache_file)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return default
+        
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any):
+        """
+        Store an entry, evicting old files if the size limit is exceeded.
+        
+        Args:
+            key: Cache key (must be a valid file name, e.g. a content hash)
+            value: JSON-serializable value to cache
+        """
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(data)
+        os.replace(temp_path, path)
+        
+        with self.lock:
+            self.total_bytes += len(data) - self.sizes.get(key, 0)
+            self.sizes[key] = len(data)
+            self.unscanned_bytes += len(data)
+            if self.total_bytes > self.max_bytes or self.unscanned_bytes > self.max_bytes // self.RESCAN_FRACTION:
+                self._scan()
+                if self.total_bytes > self.max_bytes:
+                    self._evict()
+    
+    def _evict(self):
+        """Delete least recently used files until the cache fits its size limit."""
+        def last_used(key):
+            try:
+                return os.path.getmtime(self._path(key))
+            except OSError:
+                return 0.0
+        
+        for key in sorted(self.sizes, key=last_used):
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            self.total_bytes -= self.sizes.pop(key)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            for key in list(self.sizes):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self.sizes.clear()
+            self.total_bytes = 0
+            self.unscanned_bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entries, bytes, hits and misses
+        """
+        return {
+            "entries": len(self.sizes),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class TieredCache:
+    """
+    Memory cache backed by an optional disk cache.
+    
+    Disk hits are promoted to memory; writes go to both tiers.
+    """
+    
+    def __init__(self, memory: LRUCache, disk: Optional[DiskCache] = None):
+        """
+        Initialize the tiered cache.
+        
+        Args:
+            memory: In-memory tier
+            disk: Optional on-disk tier
+        """
+        self.memory = memory
+        self.disk = disk
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up an entry in memory, then on disk.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+                return value
+        
+        return default
+    
+    def put(self, key: str, value: Any):
+        """
+        Store an entry in every tier.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+        """
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+    
+    def clear(self):
+        """Remove all entries from every tier."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get statistics for every tier.
+        
+        Returns:
+            Dictionary mapping tier names to their statistics
+        """
+        stats = {"memory": self.memory.stats()}
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
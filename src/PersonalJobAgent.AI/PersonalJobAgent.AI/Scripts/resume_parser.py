@@ -7,8 +7,14 @@ It uses spaCy for NLP processing and custom logic for information extraction.
 
 import re
 import spacy
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, NamedTuple, Callable, Union
+import copy
 import json
+import os
+import sys
+from json_boundary import dumps
+from regex_registry import registry
+from result_cache import LRUCache, DiskCache, TieredCache, content_hash
 
 # Load spaCy model - in production would use a larger model
 try:
@@ -16,7 +22,115 @@ try:
 except OSError:
     # If model not available, use blank model with basic components
     nlp = spacy.blank("en")
-    print("Warning: Using blank spaCy model. For production, install en_core_web_sm.")
+    print("Warning: Using blank spaCy model. For production, install en_core_web_sm.", file=sys.stderr)
+
+# Bump whenever extraction logic changes so cached parse results are not reused
+PARSER_VERSION = "1"
+
+# Section header vocabulary, in priority order: when a line contains headers of
+# several sections, the section listed first wins
+SECTION_HEADERS = {
+    "personal_info": ["personal information", "contact", "profile"],
+    "summary": ["summary", "professional summary", "profile summary", "about me"],
+    "experience": ["experience", "work experience", "employment history", "work history"],
+    "education": ["education", "academic background", "educational background"],
+    "skills": ["skills", "technical skills", "core competencies", "competencies"],
+    "certifications": ["certifications", "certificates", "professional certifications"],
+    "projects": ["projects", "key projects", "professional projects"],
+    "languages": ["languages", "language proficiency"],
+    "interests": ["interests", "hobbies", "activities"]
+}
+
+
+class SectionSpan(NamedTuple):
+    """Location of a resume section as character offsets into the source text."""
+    name: str
+    start: int
+    end: int
+
+
+class SectionHeaderMatcher:
+    """
+    Matches every section header of a vocabulary with a single compiled regex.
+    
+    The headers become one prioritized alternation, ordered by section, so a
+    single scan of a line finds the highest-priority section it mentions.
+    """
+    
+    def __init__(self, sections: Dict[str, List[str]], name: str = "resume.section_header"):
+        """
+        Compile the header vocabulary.
+        
+        Args:
+            sections: Mapping of section names to their header phrases, in priority order
+            name: Registry name of the compiled alternation
+        """
+        self.alternative_sections = [key for key, headers in sections.items() for _ in headers]
+        self.pattern = registry.alternation(
+            name,
+            [re.escape(header) for headers in sections.values() for header in headers],
+            word_boundary=True
+        )
+    
+    def match_line(self, line: str) -> Optional[str]:
+        """
+        Find the section a line introduces.
+        
+        Args:
+            line: A single lowercased line of text
+            
+        Returns:
+            Section name if the line contains a header, None otherwise
+        """
+        match = self.pattern.first_alternative(line)
+        return self.alternative_sections[match.index] if match else None
+
+
+SECTION_HEADER_MATCHER = SectionHeaderMatcher(SECTION_HEADERS)
+
+# Plain substring match over every header, used to reject name candidates
+ANY_HEADER_PATTERN = registry.compile("resume.any_header", '|'.join(
+    re.escape(header) for headers in SECTION_HEADERS.values() for header in headers
+))
+
+EMAIL_PATTERN = registry.compile("resume.email", r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = registry.compile("resume.phone", r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}')
+URL_PATTERN = registry.compile(
+    "resume.url",
+    r'(https?://)?([www]\.)?([-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b)([-a-zA-Z0-9()@:%_\+.~#?&//=]*)'
+)
+
+LOCATION_PATTERN = registry.alternation("resume.location", [
+    r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',  # City, State
+    r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'  # City, Country
+])
+
+# Entries within experience/education sections start on a capitalized line
+ENTRY_SPLIT_PATTERN = registry.compile("resume.entry_split", r'\n(?=[A-Z])')
+TITLE_COMPANY_PATTERN = registry.compile("resume.title_company", r'(.*?)\s*(?:at|@|,)\s*(.*)')
+DATE_RANGE_PATTERN = registry.compile(
+    "resume.date_range",
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}\s*(?:-|–|to)\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(\d{4})\s*(?:-|–|to)\s*(\d{4}|Present|Current)'
+)
+
+DEGREE_PATTERN = registry.alternation("resume.degree", [
+    r'Bachelor[\'s]* of [A-Za-z\s]+',
+    r'Master[\'s]* of [A-Za-z\s]+',
+    r'Doctor of [A-Za-z\s]+',
+    r'Ph\.?D\.?',
+    r'B\.?S\.?',
+    r'M\.?S\.?',
+    r'B\.?A\.?',
+    r'M\.?A\.?',
+    r'M\.?B\.?A\.?',
+    r'Associate[\'s]* Degree'
+])
+FIELD_OF_STUDY_PATTERN = registry.compile("resume.field_of_study", r'in\s+([A-Za-z\s]+)')
+GPA_PATTERN = registry.compile("resume.gpa", r'GPA:?\s*(\d+\.\d+)')
+
+SKILL_SPLIT_PATTERN = registry.compile("resume.skill_split", r'[,;\n]')
+PROFICIENCY_PATTERN = registry.compile("resume.proficiency", r'(.*?)\s*\(([^)]+)\)')
+LIST_ITEM_SPLIT_PATTERN = registry.compile("resume.list_item_split", r'[,;\n•]')
 
 
 class ResumeParser:
@@ -26,22 +140,16 @@ class ResumeParser:
     
     def __init__(self):
         """Initialize the resume parser with necessary components."""
-        self.sections = {
-            "personal_info": ["personal information", "contact", "profile"],
-            "summary": ["summary", "professional summary", "profile summary", "about me"],
-            "experience": ["experience", "work experience", "employment history", "work history"],
-            "education": ["education", "academic background", "educational background"],
-            "skills": ["skills", "technical skills", "core competencies", "competencies"],
-            "certifications": ["certifications", "certificates", "professional certifications"],
-            "projects": ["projects", "key projects", "professional projects"],
-            "languages": ["languages", "language proficiency"],
-            "interests": ["interests", "hobbies", "activities"]
-        }
+        self.sections = SECTION_HEADERS
+        
+        # Compiled once at import, shared by every parser instance
+        self.section_header_matcher = SECTION_HEADER_MATCHER
+        self.any_header_pattern = ANY_HEADER_PATTERN
         
         # Regex patterns for common information
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}'
-        self.url_pattern = r'(https?://)?([www]\.)?([-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b)([-a-zA-Z0-9()@:%_\+.~#?&//=]*)'
+        self.email_pattern = EMAIL_PATTERN
+        self.phone_pattern = PHONE_PATTERN
+        self.url_pattern = URL_PATTERN
         
     def parse_resume(self, text: str) -> Dict[str, Any]:
         """
@@ -56,6 +164,22 @@ class ResumeParser:
         # Process the text with spaCy
         doc = nlp(text)
         
+        return self._build_result(text)
+    
+    def _build_result(self, text: str,
+                      extract_section: Optional[Callable[[str, str], Any]] = None) -> Dict[str, Any]:
+        """
+        Build the structured result from the resume text.
+        
+        Args:
+            text: The resume text
+            extract_section: Optional replacement for _extract_section, e.g. a cached one
+            
+        Returns:
+            Dictionary containing structured resume information
+        """
+        extract_section = extract_section or self._extract_section
+        
         # Initialize result dictionary
         result = {
             "personal_info": {},
@@ -75,28 +199,40 @@ class ResumeParser:
         # Extract personal information
         result["personal_info"] = self._extract_personal_info(text)
         
-        # Extract summary
-        if "summary" in sections:
-            result["summary"] = sections["summary"]
+        # Extract the content of each section found
+        for section_name, section_text in sections.items():
+            if section_name != "personal_info":
+                result[section_name] = extract_section(section_name, section_text)
         
-        # Extract experience
-        if "experience" in sections:
-            result["experience"] = self._extract_experience(sections["experience"])
+        return result
+    
+    def _extract_section(self, section_name: str, section_text: str) -> Any:
+        """
+        Extract structured information from one section.
         
-        # Extract education
-        if "education" in sections:
-            result["education"] = self._extract_education(sections["education"])
+        The result depends only on the section name and text, which is what
+        makes per-section caching possible.
         
-        # Extract skills
-        if "skills" in sections:
-            result["skills"] = self._extract_skills(sections["skills"])
+        Args:
+            section_name: Name of the section
+            section_text: Text content of the section
+            
+        Returns:
+            Extracted section value
+        """
+        if section_name == "summary":
+            return section_text
         
-        # Extract other sections
-        for section_name in ["certifications", "projects", "languages", "interests"]:
-            if section_name in sections:
-                result[section_name] = self._extract_list_items(sections[section_name])
+        if section_name == "experience":
+            return self._extract_experience(section_text)
         
-        return result
+        if section_name == "education":
+            return self._extract_education(section_text)
+        
+        if section_name == "skills":
+            return self._extract_skills(section_text)
+        
+        return self._extract_list_items(section_text)
     
     def _identify_sections(self, text: str) -> Dict[str, str]:
         """
@@ -108,48 +244,75 @@ class ResumeParser:
         Returns:
             Dictionary mapping section names to their content
         """
-        # Split text into lines
-        lines = text.split('\n')
+        return {
+            span.name: self._section_text(text, span)
+            for span in self._identify_section_spans(text)
+        }
+    
+    def _identify_section_spans(self, text: str) -> List[SectionSpan]:
+        """
+        Locate the sections of the resume in a single pass over its lines.
         
-        # Initialize variables
-        current_section = None
-        sections = {}
-        section_content = []
+        A section runs from the line after its header up to the line before the
+        next header. If a header repeats, the later occurrence wins.
         
-        # Process each line
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        Args:
+            text: The resume text
             
-            # Check if this line is a section header
-            found_section = False
-            for section_key, section_headers in self.sections.items():
-                for header in section_headers:
-                    # Case-insensitive match for section headers
-                    if re.search(r'\b' + re.escape(header) + r'\b', line.lower()):
-                        # If we were already in a section, save its content
-                        if current_section:
-                            sections[current_section] = '\n'.join(section_content)
-                        
-                        # Start new section
-                        current_section = section_key
-                        section_content = []
-                        found_section = True
-                        break
-                
-                if found_section:
-                    break
+        Returns:
+            List of section spans in document order
+        """
+        spans = {}
+        current_section = None
+        content_start = 0
+        content_end = 0
+        has_content = False
+        
+        # Walk the text line by line, tracking offsets instead of copying lines
+        line_start = 0
+        text_length = len(text)
+        while line_start <= text_length:
+            line_end = text.find('\n', line_start)
+            if line_end == -1:
+                line_end = text_length
             
-            # If not a section header, add to current section content
-            if not found_section and current_section:
-                section_content.append(line)
+            line = text[line_start:line_end].strip()
+            if line:
+                section_key = self.section_header_matcher.match_line(line.lower())
+                if section_key:
+                    # Close the section we were in, then start the new one
+                    if current_section:
+                        spans[current_section] = SectionSpan(current_section, content_start, content_end)
+                    
+                    current_section = section_key
+                    content_start = line_end + 1
+                    content_end = content_start
+                    has_content = False
+                elif current_section:
+                    content_end = line_end
+                    has_content = True
+            
+            line_start = line_end + 1
         
         # Save the last section
-        if current_section and section_content:
-            sections[current_section] = '\n'.join(section_content)
+        if current_section and has_content:
+            spans[current_section] = SectionSpan(current_section, content_start, content_end)
+        
+        return sorted(spans.values(), key=lambda span: span.start)
+    
+    def _section_text(self, text: str, span: SectionSpan) -> str:
+        """
+        Materialize the content of a section span.
         
-        return sections
+        Args:
+            text: The resume text
+            span: Span returned by _identify_section_spans
+            
+        Returns:
+            Non-empty stripped lines of the section joined with newlines
+        """
+        lines = (line.strip() for line in text[span.start:span.end].split('\n'))
+        return '\n'.join(line for line in lines if line)
     
     def _extract_personal_info(self, text: str) -> Dict[str, str]:
         """
@@ -169,40 +332,33 @@ class ResumeParser:
             line = line.strip()
             if line and len(line) < 50:  # Name is typically short
                 # Check if line doesn't match common headers or contact info
-                if not re.search(self.email_pattern, line) and \
-                   not re.search(self.phone_pattern, line) and \
-                   not re.search(self.url_pattern, line) and \
-                   not any(header in line.lower() for header in sum(self.sections.values(), [])):
+                if not self.email_pattern.search(line) and \
+                   not self.phone_pattern.search(line) and \
+                   not self.url_pattern.search(line) and \
+                   not self.any_header_pattern.search(line.lower()):
                     personal_info["name"] = line
                     break
         
         # Extract email
-        email_match = re.search(self.email_pattern, text)
+        email_match = self.email_pattern.search(text)
         if email_match:
             personal_info["email"] = email_match.group(0)
         
         # Extract phone
-        phone_match = re.search(self.phone_pattern, text)
+        phone_match = self.phone_pattern.search(text)
         if phone_match:
             personal_info["phone"] = phone_match.group(0)
         
         # Extract LinkedIn or other URLs
-        url_match = re.search(self.url_pattern, text)
+        url_match = self.url_pattern.search(text)
         if url_match:
             personal_info["url"] = url_match.group(0)
         
         # Extract location (this is more complex and would need refinement)
         # For now, we'll use a simple heuristic to look for location patterns
-        location_patterns = [
-            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',  # City, State
-            r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'  # City, Country
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, text)
-            if location_match:
-                personal_info["location"] = location_match.group(0)
-                break
+        location_match = LOCATION_PATTERN.first_alternative(text)
+        if location_match:
+            personal_info["location"] = location_match.text
         
         return personal_info
     
@@ -220,7 +376,7 @@ class ResumeParser:
         
         # Split by potential job entries (this is a simplified approach)
         # In a real implementation, would use more sophisticated pattern matching
-        job_entries = re.split(r'\n(?=[A-Z])', experience_text)
+        job_entries = ENTRY_SPLIT_PATTERN.split(experience_text)
         
         for entry in job_entries:
             if not entry.strip():
@@ -235,7 +391,7 @@ class ResumeParser:
                 first_line = lines[0].strip()
                 
                 # Try to extract title and company
-                title_company_match = re.search(r'(.*?)\s*(?:at|@|,)\s*(.*)', first_line)
+                title_company_match = TITLE_COMPANY_PATTERN.search(first_line)
                 if title_company_match:
                     experience["title"] = title_company_match.group(1).strip()
                     experience["company"] = title_company_match.group(2).strip()
@@ -244,8 +400,7 @@ class ResumeParser:
                     experience["company"] = first_line
             
             # Extract dates
-            date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}\s*(?:-|–|to)\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(\d{4})\s*(?:-|–|to)\s*(\d{4}|Present|Current)'
-            date_match = re.search(date_pattern, entry)
+            date_match = DATE_RANGE_PATTERN.search(entry)
             if date_match:
                 date_str = date_match.group(0)
                 experience["date_range"] = date_str
@@ -288,7 +443,7 @@ class ResumeParser:
         education_entries = []
         
         # Split by potential education entries
-        entries = re.split(r'\n(?=[A-Z])', education_text)
+        entries = ENTRY_SPLIT_PATTERN.split(education_text)
         
         for entry in entries:
             if not entry.strip():
@@ -302,40 +457,22 @@ class ResumeParser:
                 education["institution"] = lines[0].strip()
             
             # Extract degree
-            degree_patterns = [
-                r'Bachelor[\'s]* of [A-Za-z\s]+',
-                r'Master[\'s]* of [A-Za-z\s]+',
-                r'Doctor of [A-Za-z\s]+',
-                r'Ph\.?D\.?',
-                r'B\.?S\.?',
-                r'M\.?S\.?',
-                r'B\.?A\.?',
-                r'M\.?A\.?',
-                r'M\.?B\.?A\.?',
-                r'Associate[\'s]* Degree'
-            ]
-            
-            for pattern in degree_patterns:
-                degree_match = re.search(pattern, entry)
-                if degree_match:
-                    education["degree"] = degree_match.group(0)
-                    break
+            degree_match = DEGREE_PATTERN.first_alternative(entry)
+            if degree_match:
+                education["degree"] = degree_match.text
             
             # Extract field of study
-            field_pattern = r'in\s+([A-Za-z\s]+)'
-            field_match = re.search(field_pattern, entry)
+            field_match = FIELD_OF_STUDY_PATTERN.search(entry)
             if field_match:
                 education["field_of_study"] = field_match.group(1).strip()
             
             # Extract dates
-            date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}\s*(?:-|–|to)\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(\d{4})\s*(?:-|–|to)\s*(\d{4}|Present|Current)'
-            date_match = re.search(date_pattern, entry)
+            date_match = DATE_RANGE_PATTERN.search(entry)
             if date_match:
                 education["date_range"] = date_match.group(0)
             
             # Extract GPA
-            gpa_pattern = r'GPA:?\s*(\d+\.\d+)'
-            gpa_match = re.search(gpa_pattern, entry)
+            gpa_match = GPA_PATTERN.search(entry)
             if gpa_match:
                 education["gpa"] = gpa_match.group(1)
             
@@ -356,7 +493,7 @@ class ResumeParser:
         skills = []
         
         # Split by lines, commas, or semicolons
-        skill_items = re.split(r'[,;\n]', skills_text)
+        skill_items = SKILL_SPLIT_PATTERN.split(skills_text)
         
         for item in skill_items:
             item = item.strip()
@@ -364,7 +501,7 @@ class ResumeParser:
                 continue
             
             # Check for skill with proficiency level
-            proficiency_match = re.search(r'(.*?)\s*\(([^)]+)\)', item)
+            proficiency_match = PROFICIENCY_PATTERN.search(item)
             if proficiency_match:
                 skill_name = proficiency_match.group(1).strip()
                 proficiency = proficiency_match.group(2).strip()
@@ -388,26 +525,171 @@ class ResumeParser:
             List of extracted items
         """
         # Split by lines, bullets, commas, or semicolons
-        items = re.split(r'[,;\n•]', text)
+        items = LIST_ITEM_SPLIT_PATTERN.split(text)
         
         # Clean and filter items
         return [item.strip() for item in items if item.strip()]
 
 
-def parse_resume(resume_text: str) -> Dict[str, Any]:
+def normalize_resume_text(text: str) -> str:
+    """
+    Normalize resume text so that trivially different uploads share a cache entry.
+    
+    Line endings are unified and each line is stripped; blank lines are kept
+    because the name heuristic looks at line positions.
+    
+    Args:
+        text: The resume text
+        
+    Returns:
+        Normalized resume text
+    """
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.strip() for line in lines)
+
+
+class ResumeParseCache:
+    """
+    Cache of parse results keyed by normalized text hash and parser version.
+    
+    Whole-document results are kept in a memory tier and, optionally, an on-disk
+    tier. Extraction results are also cached per section, so when a resume is
+    edited only the sections whose text changed are extracted again. Parsing
+    always runs on the normalized text, so a cached result is exactly what a
+    fresh parse of the same upload would return.
+    """
+    
+    def __init__(self, parser: Optional[ResumeParser] = None, max_entries: int = 256,
+                 max_section_entries: int = 4096, cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            parser: Parser used on cache misses
+            max_entries: Maximum number of parsed documents kept in memory
+            max_section_entries: Maximum number of extracted sections kept in memory
+            cache_dir: Directory for the on-disk tier, or None for memory only
+            max_disk_bytes: Maximum size of the on-disk tier
+        """
+        self.parser = parser or ResumeParser()
+        disk = DiskCache(cache_dir, max_disk_bytes) if cache_dir else None
+        self.documents = TieredCache(LRUCache(max_entries), disk)
+        self.sections = LRUCache(max_section_entries)
+    
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        Parse resume text, reusing cached results where possible.
+        
+        Args:
+            text: The resume text to parse
+            
+        Returns:
+            Dictionary containing structured resume information
+        """
+        normalized = normalize_resume_text(text)
+        key = content_hash(PARSER_VERSION, normalized)
+        
+        result = self.documents.get(key)
+        if result is None:
+            # spaCy's document is not used by the extraction steps, so a miss
+            # only runs the section extractors
+            result = self.parser._build_result(normalized, self._extract_section)
+            self.documents.put(key, result)
+        
+        # Callers may mutate the result, so never hand out the cached object
+        return copy.deepcopy(result)
+    
+    def _extract_section(self, section_name: str, section_text: str) -> Any:
+        """
+        Extract one section, reusing the cached result if its text is unchanged.
+        
+        Args:
+            section_name: Name of the section
+            section_text: Text content of the section
+            
+        Returns:
+            Extracted section value
+        """
+        key = content_hash(PARSER_VERSION, section_name, section_text)
+        value = self.sections.get(key)
+        if value is None:
+            value = self.parser._extract_section(section_name, section_text)
+            self.sections.put(key, value)
+        
+        return copy.deepcopy(value)
+    
+    def clear(self):
+        """Remove all cached results."""
+        self.documents.clear()
+        self.sections.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with document and section cache statistics
+        """
+        return {
+            "documents": self.documents.stats(),
+            "sections": self.sections.stats()
+        }
+
+
+_parse_cache = None
+
+
+def get_parse_cache() -> ResumeParseCache:
+    """
+    Get the process-wide parse cache, creating it on first use.
+    
+    The on-disk tier is enabled when the PJA_PARSE_CACHE_DIR environment
+    variable is set.
+    
+    Returns:
+        Shared ResumeParseCache instance
+    """
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ResumeParseCache(cache_dir=os.environ.get("PJA_PARSE_CACHE_DIR"))
+    return _parse_cache
+
+
+def parse_resume(resume_text: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Parse a resume and return structured information.
     
     Args:
         resume_text: The text content of the resume
+        use_cache: Whether to serve repeated or partially edited resumes from the parse cache
         
     Returns:
         Dictionary containing structured resume information
     """
+    if use_cache:
+        return get_parse_cache().parse(resume_text)
+    
     parser = ResumeParser()
     return parser.parse_resume(resume_text)
 
 
+def parse_resume_json(resume_text: Union[str, bytes], use_cache: bool = True) -> bytes:
+    """
+    Parse a resume and return structured information as JSON.
+    
+    Args:
+        resume_text: The text content of the resume, as str or UTF-8 bytes
+        use_cache: Whether to serve repeated or partially edited resumes from the parse cache
+        
+    Returns:
+        Structured resume information as UTF-8 JSON bytes
+    """
+    if not isinstance(resume_text, str):
+        resume_text = bytes(resume_text).decode("utf-8")
+    return dumps(parse_resume(resume_text, use_cache))
+
+
 if __name__ == "__main__":
     # Example usage
     sample_resume = """
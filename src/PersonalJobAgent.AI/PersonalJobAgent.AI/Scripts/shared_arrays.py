@@ -0,0 +1,203 @@
+"""
+Shared Arrays for Personal Job Agent
+
+This module shares large NumPy arrays (corpus embedding matrices, precomputed
+job features) between processes without pickling or copying them. The
+publishing process copies each array once into a shared memory block and hands
+out a small picklable handle; worker processes attach to the block and get a
+read-only view of it, so per-worker memory does not grow with the corpus.
+
+Publishing is reference counted: publishing the same name again (e.g. a second
+caller matching against the same corpus) reuses the block, and the block is
+unlinked when the last publisher releases it. Attachments are reference
+counted per process in the same way.
+"""
+
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+if os.name == "posix":
+    from multiprocessing import resource_tracker
+else:
+    resource_tracker = None
+
+
+class SharedArrayHandle(NamedTuple):
+    """Picklable reference to a published array."""
+    name: str
+    block_name: str
+    shape: Tuple[int, ...]
+    dtype: str
+    tracker: Optional[Tuple[int, int]]
+
+
+def _tracker_id() -> Optional[Tuple[int, int]]:
+    """
+    Identify the resource tracker of this process (POSIX only), starting it if needed.
+    
+    Child processes share their parent's tracker through an inherited pipe, so
+    the pipe's device and inode identify the tracker across processes.
+    """
+    if resource_tracker is None:
+        return None
+    stat = os.fstat(resource_tracker.getfd())
+    return (stat.st_dev, stat.st_ino)
+
+
+class SharedArrayStore:
+    """
+    Publishes arrays into shared memory blocks owned by this process.
+    """
+    
+    def __init__(self):
+        """Initialize an empty store."""
+        self.blocks = {}
+        self.lock = threading.Lock()
+    
+    def publish(self, name: str, array: Any) -> SharedArrayHandle:
+        """
+        Copy an array into shared memory, or reuse the block already published under the name.
+        
+        Each call must be paired with a call to release.
+        
+        Args:
+            name: Name identifying the array's content (e.g. a hash of the corpus)
+            array: Array to publish
+        
+        Returns:
+            Handle workers attach with
+        """
+        with self.lock:
+            entry = self.blocks.get(name)
+            if entry is not None:
+                entry[2] += 1
+                return entry[1]
+            
+            array = np.ascontiguousarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            
+            handle = SharedArrayHandle(name, block.name, array.shape, array.dtype.str, _tracker_id())
+            self.blocks[name] = [block, handle, 1]
+            return handle
+    
+    def release(self, name: str):
+        """
+        Drop one reference to a published array, unlinking its block after the last one.
+        
+        Workers that are still attached keep their mapping until they detach.
+        
+        Args:
+            name: Name the array was published under
+        """
+        with self.lock:
+            entry = self.blocks.get(name)
+            if entry is None:
+                return
+            entry[2] -= 1
+            if entry[2] > 0:
+                return
+            del self.blocks[name]
+        
+        block = entry[0]
+        block.close()
+        block.unlink()
+    
+    def close(self):
+        """Unlink every block regardless of outstanding references."""
+        with self.lock:
+            entries = list(self.blocks.values())
+            self.blocks.clear()
+        
+        for block, _, _ in entries:
+            block.close()
+            block.unlink()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+        
+        Returns:
+            Dictionary with the number of blocks, their total size and the references per name
+        """
+        with self.lock:
+            return {
+                "blocks": len(self.blocks),
+                "bytes": sum(block.size for block, _, _ in self.blocks.values()),
+                "references": {name: count for name, (_, _, count) in self.blocks.items()}
+            }
+    
+    def __enter__(self) -> "SharedArrayStore":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Arrays published by this process
+SHARED_ARRAYS = SharedArrayStore()
+
+# Blocks this process is attached to: block name -> [block, view, references]
+_attached = {}
+_attached_lock = threading.Lock()
+
+
+def attach(handle: SharedArrayHandle) -> np.ndarray:
+    """
+    Attach to a published array.
+    
+    Each call must be paired with a call to detach.
+    
+    Args:
+        handle: Handle returned by SharedArrayStore.publish
+    
+    Returns:
+        Read-only view of the shared array
+    """
+    with _attached_lock:
+        entry = _attached.get(handle.block_name)
+        if entry is None:
+            block = shared_memory.SharedMemory(name=handle.block_name)
+            if resource_tracker is not None and _tracker_id() != handle.tracker:
+                # Only the publisher may unlink the block; a tracker other than
+                # the publisher's would unlink it as soon as this process exits
+                resource_tracker.unregister(block._name, "shared_memory")
+            
+            view = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf)
+            view.setflags(write=False)
+            entry = [block, view, 0]
+            _attached[handle.block_name] = entry
+        
+        entry[2] += 1
+        return entry[1]
+
+
+def detach(handle: SharedArrayHandle):
+    """
+    Drop one attachment to a published array, unmapping it after the last one.
+    
+    Views returned by attach must not be used after their last detach.
+    
+    Args:
+        handle: Handle the array was attached with
+    """
+    with _attached_lock:
+        entry = _attached.get(handle.block_name)
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del _attached[handle.block_name]
+    
+    block, view, _ = entry
+    del view, entry
+    try:
+        block.close()
+    except BufferError:
+        # A caller still holds a view; the mapping is released with it
+        pass
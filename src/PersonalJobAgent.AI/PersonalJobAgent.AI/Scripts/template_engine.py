@@ -0,0 +1,215 @@
+"""
+Template Engine for Personal Job Agent
+
+This module provides precompiled text templates for the AI scripts. Templates
+use Python format-string placeholders ("{company_name}"), but are parsed once
+when loaded into alternating literal/field segments, so rendering is a single
+join over pre-split parts.
+
+Templates are grouped into per-locale packs stored as JSON files. A
+TemplateStore loads each pack once and, if a reload interval is set, reloads
+packs whose file changed on disk.
+"""
+
+import json
+import os
+import threading
+import time
+from string import Formatter
+from typing import Dict, Any, List, Optional, Union
+
+
+TEMPLATES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+DEFAULT_LOCALE = "en"
+
+
+class CompiledTemplate:
+    """
+    A format-string template pre-split into literal and field segments.
+    """
+    
+    __slots__ = ("source", "parts", "field_slots", "fields")
+    
+    def __init__(self, source: str):
+        """
+        Parse the template.
+        
+        Args:
+            source: Template text with {field} placeholders ({{ and }} escape braces)
+        
+        Raises:
+            ValueError: If a placeholder uses a format spec, conversion or attribute access
+        """
+        self.source = source
+        self.parts = []
+        self.field_slots = []
+        
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            if literal:
+                self.parts.append(literal)
+            if field_name is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                raise ValueError(f"Unsupported placeholder '{{{field_name}}}' in template")
+            self.field_slots.append((len(self.parts), field_name))
+            self.parts.append("")
+        
+        self.fields = frozenset(field for _, field in self.field_slots)
+    
+    def render(self, values: Dict[str, Any]) -> str:
+        """
+        Render the template.
+        
+        Args:
+            values: Mapping of field names to values; non-strings are converted with str()
+        
+        Returns:
+            Rendered text
+        """
+        parts = self.parts.copy()
+        for slot, field in self.field_slots:
+            value = values[field]
+            parts[slot] = value if isinstance(value, str) else str(value)
+        return "".join(parts)
+    
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.source!r})"
+
+
+class TemplatePack:
+    """
+    A named set of compiled templates for one locale.
+    
+    Each entry of the pack is either a single template or a list of
+    alternatives to choose from.
+    """
+    
+    def __init__(self, locale: str, entries: Dict[str, Union[str, List[str]]], path: Optional[str] = None):
+        """
+        Compile the pack.
+        
+        Args:
+            locale: Locale code of the pack
+            entries: Mapping of entry names to template text or lists of template text
+            path: File the pack was loaded from, if any
+        """
+        self.locale = locale
+        self.path = path
+        self.mtime = os.path.getmtime(path) if path else None
+        self.entries = {}
+        for name, value in entries.items():
+            if isinstance(value, list):
+                self.entries[name] = [CompiledTemplate(source) for source in value]
+            else:
+                self.entries[name] = CompiledTemplate(value)
+    
+    @classmethod
+    def load(cls, path: str, locale: Optional[str] = None) -> "TemplatePack":
+        """
+        Load and compile a pack from a JSON file.
+        
+        Args:
+            path: Path of the JSON file
+            locale: Locale code (default: the file name without extension)
+        
+        Returns:
+            Compiled template pack
+        """
+        with open(path, "r", encoding="utf-8") as pack_file:
+            entries = json.load(pack_file)
+        return cls(locale or os.path.splitext(os.path.basename(path))[0], entries, path)
+    
+    def __getitem__(self, name: str) -> Union[CompiledTemplate, List[CompiledTemplate]]:
+        return self.entries[name]
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+
+class TemplateStore:
+    """
+    Loads template packs for a template family (e.g. "cover_letter") by locale.
+    
+    Packs live in <directory>/<family>/<locale>.json. Unknown locales fall back
+    to the default locale.
+    """
+    
+    def __init__(self, family: str, directory: str = TEMPLATES_DIRECTORY,
+                 default_locale: str = DEFAULT_LOCALE, reload_interval: Optional[float] = None):
+        """
+        Initialize the store.
+        
+        Args:
+            family: Sub-directory holding the family's packs
+            directory: Root templates directory
+            default_locale: Locale used when a requested locale has no pack
+            reload_interval: Seconds between modification checks, or None to never reload
+        """
+        self.directory = os.path.join(directory, family)
+        self.default_locale = default_locale
+        self.reload_interval = reload_interval
+        self.packs = {}
+        self.checked_at = {}
+        self.lock = threading.Lock()
+    
+    def get(self, locale: Optional[str] = None) -> TemplatePack:
+        """
+        Get the compiled pack for a locale, loading or reloading it if needed.
+        
+        Args:
+            locale: Locale code (default: the store's default locale)
+        
+        Returns:
+            Compiled template pack
+        """
+        locale = locale or self.default_locale
+        pack = self.packs.get(locale)
+        if pack is not None and not self._is_stale(locale, pack):
+            return pack
+        
+        path = self._path(locale)
+        if not os.path.exists(path):
+            if locale == self.default_locale:
+                raise FileNotFoundError(f"No template pack found at {path}")
+            # Remember the fallback so missing locales cost one lookup
+            pack = self.get(self.default_locale)
+            self.packs[locale] = pack
+            return pack
+        
+        with self.lock:
+            pack = self.packs.get(locale)
+            if pack is None or pack.path != path or self._is_stale(locale, pack, force=True):
+                pack = TemplatePack.load(path, locale)
+                self.packs[locale] = pack
+                self.checked_at[locale] = time.monotonic()
+        
+        return pack
+    
+    def _path(self, locale: str) -> str:
+        """Get the pack file path for a locale."""
+        return os.path.join(self.directory, locale + ".json")
+    
+    def _is_stale(self, locale: str, pack: TemplatePack, force: bool = False) -> bool:
+        """Check (at most once per reload interval, unless forced) whether a pack's file changed."""
+        if self.reload_interval is None or pack.path is None:
+            return False
+        
+        now = time.monotonic()
+        if not force and now - self.checked_at.get(locale, 0.0) < self.reload_interval:
+            return False
+        
+        self.checked_at[locale] = now
+        if pack.locale != locale and os.path.exists(self._path(locale)):
+            # The locale got a pack of its own since it fell back to the default
+            return True
+        try:
+            return os.path.getmtime(pack.path) != pack.mtime
+        except OSError:
+            return False
+    
+    def reload(self):
+        """Drop all loaded packs so they are read again on next use."""
+        with self.lock:
+            self.packs.clear()
+            self.checked_at.clear()
@@ -1,5 +1,6 @@
 using System;
 using System.IO;
+using System.Text;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using PersonalJobAgent.Core.Interfaces;
@@ -87,11 +88,11 @@ namespace PersonalJobAgent.Core.Services
                         // Import the resume parser module
                         dynamic resumeParser = Py.Import("resume_parser");
                         
-                        // Call the parse_resume function
-                        dynamic result = resumeParser.parse_resume(resumeText);
-                        
-                        // Convert Python dictionary to JSON string
-                        return result.ToString();
+                        // Call the JSON entry point of the parser
+                        using (PyObject result = resumeParser.parse_resume_json(resumeText))
+                        {
+                            return DecodeUtf8(result);
+                        }
                     }
                     catch (Exception ex)
                     {
@@ -118,11 +119,11 @@ namespace PersonalJobAgent.Core.Services
                         // Import the job matcher module
                         dynamic jobMatcher = Py.Import("job_matcher");
                         
-                        // Call the match_jobs function
-                        dynamic result = jobMatcher.match_jobs(userProfileJson, jobListingsJson);
-                        
-                        // Convert Python dictionary to JSON string
-                        return result.ToString();
+                        // Call the JSON entry point of the matcher
+                        using (PyObject result = jobMatcher.match_jobs_json(userProfileJson, jobListingsJson))
+                        {
+                            return DecodeUtf8(result);
+                        }
                     }
                     catch (Exception ex)
                     {
@@ -149,11 +150,12 @@ namespace PersonalJobAgent.Core.Services
                         // Import the cover letter generator module
                         dynamic coverLetterGenerator = Py.Import("cover_letter_generator");
                         
-                        // Call the generate_cover_letter function
-                        dynamic result = coverLetterGenerator.generate_cover_letter(userProfileJson, jobListingJson);
-                        
-                        // Return the generated cover letter text
-                        return result.ToString();
+                        // Call the JSON entry point of the generator
+                        using (PyObject result = coverLetterGenerator.generate_cover_letter_json(userProfileJson, jobListingJson))
+                        {
+                            // Return the generated cover letter text
+                            return DecodeUtf8(result);
+                        }
                     }
                     catch (Exception ex)
                     {
@@ -180,11 +182,11 @@ namespace PersonalJobAgent.Core.Services
                         // Import the interview preparation module
                         dynamic interviewPreparation = Py.Import("interview_preparation");
                         
-                        // Call the prepare_interview function
-                        dynamic result = interviewPreparation.prepare_interview(userProfileJson, jobListingJson);
-                        
-                        // Convert Python dictionary to JSON string
-                        return result.ToString();
+                        // Call the JSON entry point of the interview preparation
+                        using (PyObject result = interviewPreparation.prepare_interview_json(userProfileJson, jobListingJson))
+                        {
+                            return DecodeUtf8(result);
+                        }
                     }
                     catch (Exception ex)
                     {
@@ -195,6 +197,19 @@ namespace PersonalJobAgent.Core.Services
             });
         }
 
+        /// <summary>
+        /// Decodes the UTF-8 bytes returned by a script's JSON entry point in one copy
+        /// </summary>
+        private static string DecodeUtf8(PyObject result)
+        {
+            using (PyBuffer buffer = result.GetBuffer())
+            {
+                byte[] data = new byte[buffer.Length];
+                buffer.Read(data, 0, data.Length, 0);
+                return Encoding.UTF8.GetString(data);
+            }
+        }
+
         /// <summary>
         /// Disposes the Python runtime
         /// </summary>